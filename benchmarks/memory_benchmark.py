@@ -0,0 +1,66 @@
+"""
+This file contains a benchmark of the memory taken by a roster of 100,000 legendary creatures plus 1,000,000 runes in
+the game "Legendary Creature Hunter at Mithoter Planet", as they are after loading saved game data. Passing the code
+folder of another checkout of the game measures that version instead.
+Usage: python benchmarks/memory_benchmark.py [code folder]
+"""
+
+import os
+import pickle
+import sys
+import tempfile
+import tracemalloc
+
+
+CODE_DIRECTORY_NAME: str = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "code")
+NUMBER_OF_LEGENDARY_CREATURES: int = 100000
+NUMBER_OF_RUNES: int = 1000000
+
+
+def get_loaded_size(objects):
+    # type: (list) -> int
+    """
+    Getting the bytes taken by the given objects after they are saved and loaded again.
+    :param objects: a list of objects
+    :return: the bytes allocated while loading them
+    """
+
+    data: bytes = pickle.dumps(objects)
+    tracemalloc.start()
+    loaded_objects: list = pickle.loads(data)
+    size: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del loaded_objects
+    return size
+
+
+def main():
+    # type: () -> None
+    sys.path.insert(0, sys.argv[1] if len(sys.argv) > 1 else CODE_DIRECTORY_NAME)
+    import legendary_creature_hunter_at_mithoter_planet as game
+
+    print("Numeric backend: " + game.numeric_backend)
+    with tempfile.TemporaryDirectory() as directory_name:
+        os.chdir(directory_name)
+        legendary_species: list = game.create_new_game("Player").get_potential_legendary_creatures()
+        os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+    legendary_creatures: list = [legendary_species[i % len(legendary_species)].create_legendary_creature()
+                                 for i in range(NUMBER_OF_LEGENDARY_CREATURES)]
+    size: int = get_loaded_size(legendary_creatures)
+    print("%d legendary creatures: %7.1f MB, %5d bytes each" % (
+        NUMBER_OF_LEGENDARY_CREATURES, size / 1e6, size // NUMBER_OF_LEGENDARY_CREATURES))
+    del legendary_creatures
+
+    rune: game.Rune = game.Rune("Rune", "A rune.", game.mpf("1e6"), 1, 1)
+    rune_instances: list = [game.RuneInstance(rune) for i in range(NUMBER_OF_RUNES)]
+    for rune_instance in rune_instances[::10]:
+        rune_instance.level_up()
+
+    size = get_loaded_size(rune_instances)
+    print("%d runes, 1 in 10 levelled up: %7.1f MB, %5d bytes each" % (
+        NUMBER_OF_RUNES, size / 1e6, size // NUMBER_OF_RUNES))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""
+This file contains a benchmark of starting the game "Legendary Creature Hunter at Mithoter Planet": creating a new game
+without and with a cached world catalogue, and continuing a game from saved game data. Each run happens in a fresh
+Python process, as when the game is started.
+Usage: python benchmarks/startup_benchmark.py [number of runs]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+
+CODE_DIRECTORY_NAME: str = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "code")
+SAVED_GAME_DATA_FILE_NAME: str = "SAVED LEGENDARY CREATURE HUNTER AT MITHOTER PLANET GAME DATA"
+
+# Code run in a fresh process for each path. It prints the seconds taken after the interpreter started.
+SETUP: str = "import sys, time\n" \
+             "start = time.perf_counter()\n" \
+             "sys.path.insert(0, " + repr(CODE_DIRECTORY_NAME) + ")\n" \
+             "import legendary_creature_hunter_at_mithoter_planet as game\n"
+PATHS: dict = {
+    "new game, no catalogue cache": "game.create_new_game('Player')\n",
+    "new game, cached catalogue": "game.create_new_game('Player')\n",
+    "continue game": "game.load_game_data(" + repr(SAVED_GAME_DATA_FILE_NAME) + ")\n",
+}
+
+
+def run(code, directory_name):
+    # type: (str, str) -> tuple
+    start: float = time.perf_counter()
+    output: str = subprocess.run([sys.executable, "-c", SETUP + code + "print(time.perf_counter() - start)"],
+                                 cwd=directory_name, check=True, capture_output=True, text=True).stdout
+    return time.perf_counter() - start, float(output.split()[-1])
+
+
+def main():
+    # type: () -> None
+    number_of_runs: int = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    with tempfile.TemporaryDirectory() as directory_name:
+        subprocess.run([sys.executable, "-c", SETUP + "game.save_game_data(game.create_new_game('Player'), " +
+                        repr(SAVED_GAME_DATA_FILE_NAME) + ")\n"], cwd=directory_name, check=True)
+        for path, code in PATHS.items():
+            times: list = []
+            for i in range(number_of_runs):
+                if path == "new game, no catalogue cache":
+                    subprocess.run([sys.executable, "-c", SETUP + "import shutil\n"
+                                    "shutil.rmtree(game.CATALOGUE_CACHE_DIRECTORY_NAME, ignore_errors=True)\n"],
+                                   cwd=directory_name, check=True)
+                times.append(run(code, directory_name))
+
+            print("%-30s process: %7.1f ms, after interpreter start: %7.1f ms (median of %d runs)" % (
+                path, 1000 * statistics.median(total for total, in_process in times),
+                1000 * statistics.median(in_process for total, in_process in times), number_of_runs))
+
+
+if __name__ == '__main__':
+    main()
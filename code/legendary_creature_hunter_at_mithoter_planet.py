@@ -9,20 +9,90 @@ Author: DtjiSoftwareDeveloper
 # Importing necessary libraries
 
 import sys
-import uuid
-import pickle
+import abc
 import copy
 import random
-from datetime import datetime
 import os
-from mpmath import *
+import bisect
+import heapq
+import itertools
+import io
+import types
+import math
 
-mp.pretty = True
+# The uuid, pickle, datetime, mmap, concurrent.futures and mpmath libraries are only imported by the code paths that
+# use them, so that importing the game's classes stays cheap.
+
+
+# Name of the library used for numbers in the game. "mpmath" supports arbitrarily large numbers while "float" uses
+# Python's built-in floats, which never imports mpmath but cannot hold numbers above about 1.8e308: powers of ten beyond
+# that are treated as infinity (see power_of_ten()), and nothing levels up once the EXP it requires is infinite.
+NUMERIC_BACKENDS: list = ["mpmath", "float"]
+numeric_backend: str = os.environ.get("LEGENDARY_CREATURE_HUNTER_NUMERIC_BACKEND", NUMERIC_BACKENDS[0])
+
+
+# A string which compares greater than every legendary creature ID, used as an upper bound in sorted indexes
+MAX_LEGENDARY_CREATURE_ID: str = "\U0010ffff"
 
 
 # Creating static functions to be used throughout the game
 
 
+def set_numeric_backend(name):
+    # type: (str) -> None
+    """
+    Selecting the library used for numbers in the game. This has to be done before any number is created.
+    :param name: the name of the numeric backend
+    :return: None
+    """
+
+    global numeric_backend
+    if name not in NUMERIC_BACKENDS:
+        raise ValueError("Unknown numeric backend " + repr(name))
+
+    if mpf is not load_mpf and name != numeric_backend:
+        raise ValueError("The numeric backend has already been loaded")
+
+    numeric_backend = name
+
+
+def load_mpf(value=0):
+    # type: (object) -> mpf
+    """
+    Creating a number with the selected numeric backend. The backend is loaded by the first call, which replaces
+    the module-level name 'mpf' with the backend's number type.
+    :param value: the value of the number
+    :return: the number
+    """
+
+    global mpf
+    if numeric_backend == "float":
+        mpf = float
+    else:
+        import mpmath
+        mpmath.mp.pretty = True
+        mpf = mpmath.mpf
+
+    return mpf(value)
+
+
+def get_mpf():
+    # type: () -> type
+    """
+    Getting the number type of the selected numeric backend, loading the backend if needed. Code outside this module
+    should use this rather than importing 'mpf', which is bound to load_mpf() until the first number is created.
+    :return: float or mpmath.mpf
+    """
+
+    load_mpf()
+    return mpf
+
+
+# 'mpf' is reassigned by the first call of load_mpf(), so numbers are created with mpf(value) everywhere in this module
+# without importing the numeric backend when the module is imported.
+mpf = load_mpf
+
+
 def is_number(string: str) -> bool:
     try:
         mpf(string)
@@ -39,13 +109,22 @@ def mpf_sum_of_list(a_list: list) -> mpf:
     return mpf(str(sum(mpf(str(elem)) for elem in a_list if is_number(str(elem)))))
 
 
+def power_of_ten(exponent: int) -> mpf:
+    try:
+        return mpf("10") ** exponent
+    except OverflowError:
+        return mpf("inf")  # beyond the largest float with the "float" numeric backend
+
+
 def load_game_data(file_name):
     # type: (str) -> Game
+    import pickle
     return pickle.load(open(file_name, "rb"))
 
 
 def save_game_data(game_data, file_name):
     # type: (Game, str) -> None
+    import pickle
     pickle.dump(game_data, open(file_name, "wb"))
 
 
@@ -57,9 +136,73 @@ def clear():
         os.system('clear')  # For Linux System
 
 
+def render_text(obj, *args):
+    # type: (object, object) -> str
+    """
+    Rendering an object into a string. Objects write their text with write_text(stream), and nested objects write into
+    the same stream rather than returning intermediate strings.
+    :param obj: an object with a write_text() method
+    :param args: extra arguments passed to write_text(), e.g. the level of a skill
+    :return: the text written by the object
+    """
+
+    stream: io.StringIO = io.StringIO()
+    obj.write_text(stream, *args)
+    return stream.getvalue()
+
+
 # Creating necessary classes
 
 
+class SlottedState:
+    """
+    This class contains the pickling support shared by classes keeping their attributes in __slots__ rather than in
+    a per-instance __dict__. Saved game data from before __slots__ were used stores attributes in a dict, which is still
+    accepted.
+    """
+
+    __slots__: tuple = ()
+
+    # Class -> names of the attributes its instances store in slots
+    __slot_names: dict = {}
+
+    @classmethod
+    def get_slot_names(cls):
+        # type: () -> tuple
+        if cls not in SlottedState.__slot_names:
+            slot_names: list = []
+            for klass in cls.__mro__:
+                for name in klass.__dict__.get("__slots__", ()):
+                    if name.startswith("__") and not name.endswith("__"):
+                        name = "_" + klass.__name__.lstrip("_") + name
+
+                    # Attributes replaced by properties in subclasses are not stored.
+                    if isinstance(getattr(cls, name, None), types.MemberDescriptorType):
+                        slot_names.append(name)
+
+            SlottedState.__slot_names[cls] = tuple(slot_names)
+
+        return SlottedState.__slot_names[cls]
+
+    def __getstate__(self):
+        # type: () -> dict
+        state: dict = {}
+        for name in self.get_slot_names():
+            try:
+                state[name] = getattr(self, name)
+            except AttributeError:
+                pass  # slot never assigned
+
+        return state
+
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        slot_names: tuple = self.get_slot_names()
+        for name, value in state.items():
+            if name in slot_names:
+                setattr(self, name, value)
+
+
 class Action:
     """
     This class contains attributes of an action which can be carried out during battles.
@@ -73,17 +216,34 @@ class Action:
 
     def __str__(self):
         # type: () -> str
-        return str(self.name) + "\n"
+        return render_text(self)
 
-    def execute(self, user, target, skill_to_use=None):
-        # type: (LegendaryCreature, LegendaryCreature, Skill or None) -> bool
+    def write_text(self, stream):
+        # type: (io.TextIOBase) -> None
+        stream.write(str(self.name) + "\n")
+
+    @staticmethod
+    def calculate_normal_attack_raw_damage(user, target):
+        # type: (LegendaryCreature, LegendaryCreature) -> mpf
+        """
+        Calculating the damage of a normal attack before it is floored at zero: the attack power of the user minus
+        the defense of the target, both after buffs and debuffs.
+        :param user: the attacking legendary creature
+        :param target: the attacked legendary creature
+        :return: the raw damage, which may be negative
+        """
+
+        return user.attack_power * (1 + user.attack_power_percentage_up / 100 -
+                                    user.attack_power_percentage_down / 100) - target.defense * \
+            (1 + target.defense_percentage_up / 100 - target.defense_percentage_down / 100)
+
+    def execute(self, user, target, skill_to_use=None, random_generator=random):
+        # type: (LegendaryCreature, LegendaryCreature, Skill or None, random.Random) -> bool
         if self.name == "NORMAL ATTACK":
             if user == target:
                 return False
 
-            raw_damage: mpf = user.attack_power * (1 + user.attack_power_percentage_up / 100 -
-                                                   user.attack_power_percentage_down / 100) - target.defense * \
-                              (1 + target.defense_percentage_up / 100 - target.defense_percentage_down / 100)
+            raw_damage: mpf = self.calculate_normal_attack_raw_damage(user, target)
             damage: mpf = raw_damage if raw_damage > 0 else 0
             target.curr_hp -= damage
             return True
@@ -104,10 +264,11 @@ class Action:
                         return False
 
                     # Calculate the amount of damage
-                    raw_damage: mpf = skill_to_use.damage_multiplier. \
-                        calculate_raw_damage_without_enemy_defense(user, target) if \
+                    damage_multiplier: DamageMultiplier = \
+                        skill_to_use.get_damage_multiplier(user.get_skill_level(skill_to_use))
+                    raw_damage: mpf = damage_multiplier.calculate_raw_damage_without_enemy_defense(user, target) if \
                         skill_to_use.does_ignore_enemies_defense else \
-                        skill_to_use.damage_multiplier.calculate_raw_damage(user, target)
+                        damage_multiplier.calculate_raw_damage(user, target)
                     damage: mpf = raw_damage if raw_damage > 0 else 0
                     target.curr_hp -= damage
 
@@ -115,14 +276,18 @@ class Action:
                     if user != target:
                         return False
 
-                    user.curr_hp += skill_to_use.heal_amount
+                    user.curr_hp += skill_to_use.get_heal_amount(user.get_skill_level(skill_to_use))
 
                 elif isinstance(skill_to_use, StrengthenSkill):
                     if user != target:
                         return False
 
-                    user.attack_power_percentage_up += skill_to_use.self_attack_percentage_up
-                    user.defense_percentage_up += skill_to_use.self_defense_percentage_up
+                    user.add_status_effect(StatusEffect(skill_to_use.name, "attack_power_percentage_up",
+                                                        skill_to_use.self_attack_percentage_up,
+                                                        skill_to_use.EFFECT_TURNS))
+                    user.add_status_effect(StatusEffect(skill_to_use.name, "defense_percentage_up",
+                                                        skill_to_use.self_defense_percentage_up,
+                                                        skill_to_use.EFFECT_TURNS))
 
                 elif isinstance(skill_to_use, WeakeningSkill):
                     if user == target:
@@ -131,9 +296,13 @@ class Action:
                     # Checking whether the effect is resisted or not
                     resisted_chance: float = 0.15 if user.accuracy > target.resistance or \
                         target.resistance - user.accuracy <= 0.15 else target.resistance - user.accuracy
-                    if random.random() >= resisted_chance:
-                        target.attack_power_percentage_down += skill_to_use.enemy_attack_percentage_down
-                        target.defense_percentage_down += skill_to_use.enemy_defense_percentage_down
+                    if random_generator.random() >= resisted_chance:
+                        target.add_status_effect(StatusEffect(skill_to_use.name, "attack_power_percentage_down",
+                                                              skill_to_use.enemy_attack_percentage_down,
+                                                              skill_to_use.EFFECT_TURNS))
+                        target.add_status_effect(StatusEffect(skill_to_use.name, "defense_percentage_down",
+                                                              skill_to_use.enemy_defense_percentage_down,
+                                                              skill_to_use.EFFECT_TURNS))
 
                 return True
             return False
@@ -151,33 +320,45 @@ class Battle:
     This class contains attributes of a battle in this game.
     """
 
+    ATTACK_GAUGE_TICK_FACTOR: float = 0.07  # attack gauge gained per tick for each point of attack speed
+
     def __init__(self, team1):
         # type: (Team) -> None
         self.team1: Team = team1
         self.team2: Team = Team([])
-        self.reward: Reward = Reward(mpf("10") ** sum(legendary_creature.level for legendary_creature
-                                                      in self.team2.get_legendary_creatures()),
-                                     mpf("10") ** sum(legendary_creature.level for legendary_creature
-                                                      in self.team2.get_legendary_creatures()),
-                                     mpf("10") ** sum(legendary_creature.level for legendary_creature
-                                                      in self.team2.get_legendary_creatures()))
+        self.reward: Reward = Reward(power_of_ten(sum(legendary_creature.level for legendary_creature
+                                                      in self.team2.get_legendary_creatures())),
+                                     power_of_ten(sum(legendary_creature.level for legendary_creature
+                                                      in self.team2.get_legendary_creatures())),
+                                     power_of_ten(sum(legendary_creature.level for legendary_creature
+                                                      in self.team2.get_legendary_creatures())))
         self.winner: Team or None = None
         self.whose_turn: LegendaryCreature or None = None
+        self.turns: int = 0
+        self.status_effect_timer: StatusEffectTimer = StatusEffectTimer()
+        self.random_generator: random.Random or None = None  # the random module is used if None
 
     def __str__(self):
         # type: () -> str
-        res: str = "Below is a list of legendary creatures in team 1.\n"
+        return render_text(self)
+
+    def write_text(self, stream):
+        # type: (io.TextIOBase) -> None
+        stream.write("Below is a list of legendary creatures in team 1.\n")
         for legendary_creature in self.team1.get_legendary_creatures():
-            res += str(legendary_creature) + "\n"
+            legendary_creature.write_text(stream)
+            stream.write("\n")
 
-        res += "Below is a list of legendary creatures in team 2.\n"
+        stream.write("Below is a list of legendary creatures in team 2.\n")
         for legendary_creature in self.team2.get_legendary_creatures():
-            res += str(legendary_creature) + "\n"
+            legendary_creature.write_text(stream)
+            stream.write("\n")
 
-        res += "Rewards for winning the battle:\n" + str(self.reward) + "\n"
-        res += "Winner of the battle: " + str(self.winner) + "\n"
-        res += "Moving legendary creature: " + str(self.whose_turn) + "\n"
-        return res
+        stream.write("Rewards for winning the battle:\n")
+        self.reward.write_text(stream)
+        stream.write("\n")
+        stream.write("Winner of the battle: " + str(self.winner) + "\n")
+        stream.write("Moving legendary creature: " + str(self.whose_turn) + "\n")
 
     def get_someone_to_move(self):
         # type: () -> None
@@ -190,13 +371,13 @@ class Battle:
         full_attack_gauge_list: list = []  # initial value
         while len(full_attack_gauge_list) == 0:
             for legendary_creature in self.team1.get_legendary_creatures():
-                if legendary_creature.attack_gauge >= legendary_creature.FULL_ATTACK_GAUGE and legendary_creature not \
-                        in full_attack_gauge_list:
+                if legendary_creature.get_is_alive() and legendary_creature.attack_gauge >= \
+                        legendary_creature.FULL_ATTACK_GAUGE and legendary_creature not in full_attack_gauge_list:
                     full_attack_gauge_list.append(legendary_creature)
 
             for legendary_creature in self.team2.get_legendary_creatures():
-                if legendary_creature.attack_gauge >= legendary_creature.FULL_ATTACK_GAUGE and legendary_creature not \
-                        in full_attack_gauge_list:
+                if legendary_creature.get_is_alive() and legendary_creature.attack_gauge >= \
+                        legendary_creature.FULL_ATTACK_GAUGE and legendary_creature not in full_attack_gauge_list:
                     full_attack_gauge_list.append(legendary_creature)
 
             self.tick()
@@ -214,10 +395,166 @@ class Battle:
         """
 
         for legendary_creature in self.team1.get_legendary_creatures():
-            legendary_creature.attack_gauge += legendary_creature.attack_speed * 0.07
+            legendary_creature.attack_gauge += legendary_creature.attack_speed * self.ATTACK_GAUGE_TICK_FACTOR
 
         for legendary_creature in self.team2.get_legendary_creatures():
-            legendary_creature.attack_gauge += legendary_creature.attack_speed * 0.07
+            legendary_creature.attack_gauge += legendary_creature.attack_speed * self.ATTACK_GAUGE_TICK_FACTOR
+
+    def check_winner(self):
+        # type: () -> Team or None
+        """
+        Checking whether all legendary creatures of a team are knocked out, in which case the other team wins.
+        :return: the winner or None if the battle goes on
+        """
+
+        if self.winner is None:
+            if not any(legendary_creature.get_is_alive() for legendary_creature in
+                       self.team2.get_legendary_creatures()):
+                self.winner = self.team1
+            elif not any(legendary_creature.get_is_alive() for legendary_creature in
+                         self.team1.get_legendary_creatures()):
+                self.winner = self.team2
+
+            if self.winner is not None:
+                self.end_status_effects()
+
+        return self.winner
+
+    def end_turn(self):
+        # type: () -> None
+        """
+        Ending the turn of the moving legendary creature, which recovers magic points and waits for its attack gauge
+        to fill up again.
+        :return: None
+        """
+
+        self.whose_turn.recover_magic_points()
+        self.whose_turn.attack_gauge = self.whose_turn.MIN_ATTACK_GAUGE
+        self.turns += 1
+        self.status_effect_timer.advance()
+        self.check_winner()
+
+    def attach_status_effect_timer(self):
+        # type: () -> None
+        """
+        Making the status effects given to legendary creatures in this battle expire as the battle goes on.
+        :return: None
+        """
+
+        for legendary_creature in self.team1.get_legendary_creatures() + self.team2.get_legendary_creatures():
+            legendary_creature.status_effect_timer = self.status_effect_timer
+            # Status effects left from a battle which ended without a winner run out in this battle.
+            for status_effect in legendary_creature.get_status_effects():
+                self.status_effect_timer.schedule(legendary_creature, status_effect)
+
+    def end_status_effects(self):
+        # type: () -> None
+        """
+        Ending the status effects of all legendary creatures in this battle once it is over, so that they do not
+        carry over to later battles.
+        :return: None
+        """
+
+        for legendary_creature in self.team1.get_legendary_creatures() + self.team2.get_legendary_creatures():
+            legendary_creature.clear_status_effects()
+
+    def get_opposing_teams(self, legendary_creature):
+        # type: (LegendaryCreature) -> tuple
+        """
+        Getting the team of a legendary creature in this battle and the team it battles against.
+        :param legendary_creature: a legendary creature in this battle
+        :return: a tuple of both teams
+        """
+
+        if legendary_creature in self.team1.get_legendary_creatures():
+            return self.team1, self.team2
+        return self.team2, self.team1
+
+    @staticmethod
+    def get_threat(legendary_creature):
+        # type: (LegendaryCreature) -> mpf
+        return legendary_creature.attack_power * (1 + legendary_creature.attack_power_percentage_up / 100 -
+                                                  legendary_creature.attack_power_percentage_down / 100)
+
+    def get_alive_enemies(self, legendary_creature):
+        # type: (LegendaryCreature) -> list
+        own_team, enemy_team = self.get_opposing_teams(legendary_creature)
+        return [enemy for enemy in enemy_team.get_legendary_creatures() if enemy.get_is_alive()]
+
+    def get_random_generator(self):
+        # type: () -> random.Random
+        """
+        Getting where the random choices of this battle come from, so that a battle given its own random number
+        generator can be replayed without touching the one of the random module.
+        :return: the random number generator of this battle, or the random module if it has none
+        """
+
+        return self.random_generator if self.random_generator is not None else random
+
+    def get_random_enemy(self, legendary_creature):
+        # type: (LegendaryCreature) -> LegendaryCreature
+        enemies: list = self.get_alive_enemies(legendary_creature)
+        return enemies[self.get_random_generator().randrange(len(enemies))]
+
+    def get_weakest_enemy(self, legendary_creature):
+        # type: (LegendaryCreature) -> LegendaryCreature
+        return min(self.get_alive_enemies(legendary_creature), key=lambda enemy: enemy.curr_hp)
+
+    def get_most_threatening_enemy(self, legendary_creature):
+        # type: (LegendaryCreature) -> LegendaryCreature
+        return max(self.get_alive_enemies(legendary_creature), key=self.get_threat)
+
+    def take_turn(self, policy):
+        # type: (BattlePolicy) -> None
+        """
+        Letting the moving legendary creature carry out the move chosen by a battle policy.
+        :param policy: the battle policy of the team of the moving legendary creature
+        :return: None
+        """
+
+        user: LegendaryCreature = self.whose_turn
+        action_name, skill_to_use, target = policy.choose_move(self, user)
+        if action_name == "USE SKILL":
+            user.use_skill(target, skill_to_use, self.get_random_generator())
+        elif action_name == "NORMAL HEAL":
+            user.normal_heal(user)
+        else:
+            user.normal_attack(target)
+
+    def resolve(self, team1_policy, team2_policy, max_turns=10000):
+        # type: (BattlePolicy, BattlePolicy, int) -> Team or None
+        """
+        Carrying out the battle to the end with both teams moving according to battle policies.
+        :param team1_policy: the battle policy of team 1
+        :param team2_policy: the battle policy of team 2
+        :param max_turns: the most turns to be taken, so that battles where nobody can be knocked out end
+        :return: the winner or None if there is no winner after max_turns turns
+        """
+
+        for i in range(max_turns):
+            if self.check_winner() is not None:
+                break
+
+            self.get_someone_to_move()
+            if self.whose_turn is None:
+                break
+
+            self.take_turn(team1_policy if self.get_opposing_teams(self.whose_turn)[0] is self.team1 else
+                           team2_policy)
+            self.end_turn()
+
+        return self.winner
+
+    def get_summary(self):
+        # type: () -> str
+        stream: io.StringIO = io.StringIO()
+        stream.write("The battle ended after " + str(self.turns) + " turns.\n")
+        for team_name, team in [("Team 1", self.team1), ("Team 2", self.team2)]:
+            stream.write(team_name + ":\n")
+            for legendary_creature in team.get_legendary_creatures():
+                stream.write(legendary_creature.get_summary() + "\n")
+
+        return stream.getvalue()
 
     def clone(self):
         # type: () -> Battle
@@ -233,6 +570,7 @@ class TrainerBattle(Battle):
         # type: (Team, Team) -> None
         Battle.__init__(self, team1)
         self.team2: Team = team2
+        self.attach_status_effect_timer()
 
 
 class WildBattle(Battle):
@@ -245,28 +583,623 @@ class WildBattle(Battle):
         Battle.__init__(self, team1)
         self.team2: Team = Team([wild_legendary_creature])
         self.wild_legendary_creature_caught: bool = False  # initial value
+        self.attach_status_effect_timer()
+
+    def write_text(self, stream):
+        # type: (io.TextIOBase) -> None
+        Battle.write_text(self, stream)
+        stream.write("Has the wild legendary creature been caught? " + str(self.wild_legendary_creature_caught) + "\n")
+
+
+class RaidBattle(Battle):
+    """
+    This class contains attributes of a raid battle between two raid teams of up to hundreds of legendary creatures.
+    Instead of scanning both teams, a raid battle keeps a heap of the ticks at which legendary creatures get a full
+    attack gauge and, for each team, heaps of legendary creatures by HP and by threat together with a list of
+    legendary creatures still alive. Heap entries are only added for legendary creatures whose HP or status effects
+    changed in a turn, and outdated entries are skipped when they come up, so a turn costs O(log n).
+    """
+
+    MAX_LISTED_CREATURE_TYPES: int = 10  # creature types shown for each team when rendering a raid battle
+
+    def __init__(self, team1, team2):
+        # type: (Team, Team) -> None
+        Battle.__init__(self, team1)
+        self.team2: Team = team2
+        self.attach_status_effect_timer()
+        self.__clock: int = 0  # attack gauge ticks passed so far
+        self.__number_of_entries: int = 0  # breaks ties between heap entries and tells outdated entries apart
+        self.__team_indexes: dict = {}  # legendary creature ID -> 0 for team 1 and 1 for team 2
+        self.__latest_entries: dict = {}  # legendary creature ID -> number of its latest HP and threat heap entries
+        self.__gauge_ticks: dict = {}  # legendary creature ID -> (clock when its attack gauge was set, attack gauge)
+        self.__turn_queue: list = []  # heap of (tick of full attack gauge, -attack gauge then, entry, creature)
+        self.__hp_heaps: list = [[], []]  # heaps of (HP, entry, legendary creature) for each team
+        self.__threat_heaps: list = [[], []]  # heaps of (-threat, entry, legendary creature) for each team
+        self.__alive: list = [[], []]  # legendary creatures still alive in each team
+        self.__alive_positions: dict = {}  # legendary creature ID -> position in the list of its team in alive
+        for team_index, team in enumerate([self.team1, self.team2]):
+            for legendary_creature in team.get_legendary_creatures():
+                self.__team_indexes[legendary_creature.legendary_creature_id] = team_index
+                self.__refresh(legendary_creature)
+                self.__schedule_turn(legendary_creature)
+
+    def write_text(self, stream):
+        # type: (io.TextIOBase) -> None
+        for team_name, team in [("team 1", self.team1), ("team 2", self.team2)]:
+            self.write_team_text(stream, team_name, team)
+            stream.write("\n")
+
+        stream.write("Rewards for winning the battle:\n")
+        self.reward.write_text(stream)
+        stream.write("\n")
+        stream.write("Winner of the battle: " + str(self.winner) + "\n")
+        stream.write("Moving legendary creature: " + (self.whose_turn.get_summary() if self.whose_turn is not None
+                                                       else "None") + "\n")
+
+    def write_team_text(self, stream, team_name, team):
+        # type: (io.TextIOBase, str, Team) -> None
+        """
+        Writing totals for a team instead of every legendary creature in it.
+        :return: None
+        """
+
+        legendary_creatures: list = team.get_legendary_creatures()
+        team_index: int = self.__get_team_index(team)
+        alive: list = self.__alive[team_index]
+        alive_by_type: dict = {}
+        for legendary_creature in alive:
+            alive_by_type[legendary_creature.creature_type] = alive_by_type.get(legendary_creature.creature_type,
+                                                                                0) + 1
+
+        stream.write("Legendary creatures alive in " + str(team_name) + ": " + str(len(alive)) + "/" +
+                     str(len(legendary_creatures)) + "\n")
+        stream.write("HP of " + str(team_name) + ": " + str(mpf_sum_of_list([legendary_creature.curr_hp for
+                                                                              legendary_creature in alive])) +
+                     "/" + str(mpf_sum_of_list([legendary_creature.max_hp for legendary_creature in
+                                                legendary_creatures])) + "\n")
+        for creature_type, number_alive in sorted(alive_by_type.items(), key=lambda item: (-item[1], item[0]))[
+                :self.MAX_LISTED_CREATURE_TYPES]:
+            stream.write("    " + str(creature_type) + ": " + str(number_alive) + " alive\n")
+
+        if len(alive) > 0:
+            stream.write("Lowest HP: " + self.__get_top(self.__hp_heaps[team_index]).get_summary() + "\n")
+            stream.write("Highest threat: " + self.__get_top(self.__threat_heaps[team_index]).get_summary() + "\n")
+
+    def get_summary(self):
+        # type: () -> str
+        stream: io.StringIO = io.StringIO()
+        stream.write("The raid battle ended after " + str(self.turns) + " turns.\n")
+        for team_name, team in [("team 1", self.team1), ("team 2", self.team2)]:
+            self.write_team_text(stream, team_name, team)
+
+        return stream.getvalue()
+
+    def __get_team_index(self, team):
+        # type: (Team) -> int
+        return 0 if team is self.team1 else 1
+
+    def __next_entry(self):
+        # type: () -> int
+        self.__number_of_entries += 1
+        return self.__number_of_entries
+
+    def __schedule_turn(self, legendary_creature):
+        # type: (LegendaryCreature) -> None
+        # Finding the first tick at which the attack gauge is full, the same way Battle.tick() fills it
+        gauge_per_tick: mpf = legendary_creature.attack_speed * self.ATTACK_GAUGE_TICK_FACTOR
+        if not legendary_creature.get_is_alive() or gauge_per_tick <= 0:
+            return
+
+        missing_gauge: mpf = legendary_creature.FULL_ATTACK_GAUGE - legendary_creature.attack_gauge
+        ticks: int = max(0, math.ceil(float(missing_gauge / gauge_per_tick)))
+        while legendary_creature.attack_gauge + ticks * gauge_per_tick < legendary_creature.FULL_ATTACK_GAUGE:
+            ticks += 1
+        while ticks > 0 and legendary_creature.attack_gauge + (ticks - 1) * gauge_per_tick >= \
+                legendary_creature.FULL_ATTACK_GAUGE:
+            ticks -= 1
+
+        self.__gauge_ticks[legendary_creature.legendary_creature_id] = (self.__clock, legendary_creature.attack_gauge)
+        heapq.heappush(self.__turn_queue, (self.__clock + ticks, -(legendary_creature.attack_gauge + ticks *
+                                                                   gauge_per_tick), self.__next_entry(),
+                                           legendary_creature))
+
+    def __get_attack_gauge(self, legendary_creature):
+        # type: (LegendaryCreature) -> mpf
+        clock, attack_gauge = self.__gauge_ticks.get(legendary_creature.legendary_creature_id,
+                                                     (self.__clock, legendary_creature.attack_gauge))
+        return attack_gauge + (self.__clock - clock) * legendary_creature.attack_speed * self.ATTACK_GAUGE_TICK_FACTOR
+
+    def update_attack_gauges(self):
+        # type: () -> None
+        """
+        Bringing the attack gauges of all legendary creatures up to date, which only happens for the moving
+        legendary creature during the battle.
+        :return: None
+        """
+
+        for legendary_creature in self.team1.get_legendary_creatures() + self.team2.get_legendary_creatures():
+            if legendary_creature.get_is_alive():
+                legendary_creature.attack_gauge = self.__get_attack_gauge(legendary_creature)
+                self.__gauge_ticks[legendary_creature.legendary_creature_id] = (self.__clock,
+                                                                                legendary_creature.attack_gauge)
+
+    def __refresh(self, legendary_creature):
+        # type: (LegendaryCreature) -> None
+        # Adding new heap entries for a legendary creature whose HP or status effects may have changed
+        legendary_creature_id: str = legendary_creature.legendary_creature_id
+        team_index: int = self.__team_indexes[legendary_creature_id]
+        alive: list = self.__alive[team_index]
+        if not legendary_creature.get_is_alive():
+            self.__latest_entries.pop(legendary_creature_id, None)
+            position: int or None = self.__alive_positions.pop(legendary_creature_id, None)
+            if position is not None:
+                last: LegendaryCreature = alive.pop()
+                if last is not legendary_creature:
+                    alive[position] = last
+                    self.__alive_positions[last.legendary_creature_id] = position
+            return
+
+        if legendary_creature_id not in self.__alive_positions:
+            self.__alive_positions[legendary_creature_id] = len(alive)
+            alive.append(legendary_creature)
+
+        entry: int = self.__next_entry()
+        self.__latest_entries[legendary_creature_id] = entry
+        for heap, key in [(self.__hp_heaps[team_index], legendary_creature.curr_hp),
+                          (self.__threat_heaps[team_index], -self.get_threat(legendary_creature))]:
+            heapq.heappush(heap, (key, entry, legendary_creature))
+            if len(heap) > 4 * len(alive) + 16:
+                # Dropping outdated entries once they outnumber the legendary creatures alive
+                heap[:] = [heap_entry for heap_entry in heap if
+                           self.__latest_entries.get(heap_entry[2].legendary_creature_id) == heap_entry[1]]
+                heapq.heapify(heap)
+
+    def __get_top(self, heap):
+        # type: (list) -> LegendaryCreature
+        while self.__latest_entries.get(heap[0][2].legendary_creature_id) != heap[0][1]:
+            heapq.heappop(heap)
+        return heap[0][2]
+
+    def get_opposing_teams(self, legendary_creature):
+        # type: (LegendaryCreature) -> tuple
+        if self.__team_indexes[legendary_creature.legendary_creature_id] == 0:
+            return self.team1, self.team2
+        return self.team2, self.team1
+
+    def get_alive_enemies(self, legendary_creature):
+        # type: (LegendaryCreature) -> list
+        return list(self.__alive[1 - self.__team_indexes[legendary_creature.legendary_creature_id]])
+
+    def get_random_enemy(self, legendary_creature):
+        # type: (LegendaryCreature) -> LegendaryCreature
+        enemies: list = self.__alive[1 - self.__team_indexes[legendary_creature.legendary_creature_id]]
+        return enemies[self.get_random_generator().randrange(len(enemies))]
+
+    def get_weakest_enemy(self, legendary_creature):
+        # type: (LegendaryCreature) -> LegendaryCreature
+        return self.__get_top(self.__hp_heaps[1 - self.__team_indexes[legendary_creature.legendary_creature_id]])
+
+    def get_most_threatening_enemy(self, legendary_creature):
+        # type: (LegendaryCreature) -> LegendaryCreature
+        return self.__get_top(self.__threat_heaps[1 - self.__team_indexes[legendary_creature.legendary_creature_id]])
+
+    def get_someone_to_move(self):
+        # type: () -> None
+        self.whose_turn = None
+        while len(self.__turn_queue) > 0:
+            ready_tick, negative_attack_gauge, entry, legendary_creature = heapq.heappop(self.__turn_queue)
+            if legendary_creature.get_is_alive():
+                self.__clock = max(self.__clock, ready_tick)
+                legendary_creature.attack_gauge = -negative_attack_gauge
+                self.whose_turn = legendary_creature
+                return
+
+    def take_turn(self, policy):
+        # type: (BattlePolicy) -> None
+        user: LegendaryCreature = self.whose_turn
+        action_name, skill_to_use, target = policy.choose_move(self, user)
+        if action_name == "USE SKILL":
+            user.use_skill(target, skill_to_use, self.get_random_generator())
+        elif action_name == "NORMAL HEAL":
+            user.normal_heal(user)
+        else:
+            user.normal_attack(target)
+
+        self.__refresh(user)
+        if target is not user:
+            self.__refresh(target)
+
+    def end_turn(self):
+        # type: () -> None
+        self.whose_turn.recover_magic_points()
+        self.whose_turn.attack_gauge = self.whose_turn.MIN_ATTACK_GAUGE
+        self.__schedule_turn(self.whose_turn)
+        self.turns += 1
+        for legendary_creature in self.status_effect_timer.advance():
+            self.__refresh(legendary_creature)
+
+        self.check_winner()
+
+    def check_winner(self):
+        # type: () -> Team or None
+        if self.winner is None:
+            if len(self.__alive[1]) == 0:
+                self.winner = self.team1
+            elif len(self.__alive[0]) == 0:
+                self.winner = self.team2
+
+            if self.winner is not None:
+                self.update_attack_gauges()
+                self.end_status_effects()
+
+        return self.winner
+
+
+class BattlePolicy(abc.ABC):
+    """
+    This class contains attributes of a way of choosing moves in battles without asking the player. RandomBattlePolicy
+    is the battle policy of legendary creatures which are not given another one.
+    """
+
+    @abc.abstractmethod
+    def choose_move(self, battle, user):
+        # type: (Battle, LegendaryCreature) -> tuple
+        """
+        Choosing the move of a legendary creature.
+        :param battle: the battle
+        :param user: the moving legendary creature
+        :return: a tuple of the name of the action, the skill to use or None and the target
+        """
+
+
+class RandomBattlePolicy(BattlePolicy):
+    """
+    This class contains attributes of the battle policy of wild legendary creatures and CPU trainers: a normal
+    attack on a random enemy, a normal heal or a random skill, each with the same chance.
+    """
+
+    def choose_move(self, battle, user):
+        # type: (Battle, LegendaryCreature) -> tuple
+        random_generator: random.Random = battle.get_random_generator()
+        target: LegendaryCreature = battle.get_random_enemy(user)
+        chance: float = random_generator.random()
+        if chance <= 1 / 3:
+            return "NORMAL ATTACK", None, target
+        elif chance <= 2 / 3 or len(user.get_skills()) == 0:
+            return "NORMAL HEAL", None, user
+
+        skill_to_use: Skill = user.get_skills()[random_generator.randrange(len(user.get_skills()))]
+        if isinstance(skill_to_use, AttackSkill) or isinstance(skill_to_use, WeakeningSkill):
+            return "USE SKILL", skill_to_use, target
+        return "USE SKILL", skill_to_use, user
+
+
+class AutoBattlePolicy(BattlePolicy):
+    """
+    This class contains attributes of the battle policy used when the player's team battles automatically. The
+    enemy with the lowest HP (or the one with the highest attack power after buffs and debuffs) is targeted, a
+    legendary creature heals itself when its HP falls below a share of its maximum HP, optionally weakens an enemy
+    which is not weakened yet and otherwise uses its strongest affordable attacking skill.
+    """
+
+    POSSIBLE_TARGET_RULES: list = ["LOWEST HP", "HIGHEST THREAT"]
+
+    def __init__(self, heal_below=0.3, weaken_first=True, target_rule="LOWEST HP"):
+        # type: (float, bool, str) -> None
+        self.heal_below: float = heal_below  # share of maximum HP below which a legendary creature heals itself
+        self.weaken_first: bool = weaken_first
+        self.target_rule: str = target_rule if target_rule in self.POSSIBLE_TARGET_RULES else \
+            self.POSSIBLE_TARGET_RULES[0]
+
+    def choose_move(self, battle, user):
+        # type: (Battle, LegendaryCreature) -> tuple
+        target: LegendaryCreature = battle.get_weakest_enemy(user) if self.target_rule == "LOWEST HP" else \
+            battle.get_most_threatening_enemy(user)
+        affordable_skills: list = [skill for skill in user.get_skills() if
+                                   user.curr_magic_points >= skill.magic_points_cost]
+        if user.curr_hp < self.heal_below * user.max_hp:
+            heal_skills: list = [skill for skill in affordable_skills if isinstance(skill, HealSkill)]
+            if len(heal_skills) > 0:
+                return "USE SKILL", max(heal_skills, key=lambda skill: skill.get_heal_amount(
+                    user.get_skill_level(skill))), user
+            return "NORMAL HEAL", None, user
+
+        if self.weaken_first and target.attack_power_percentage_down == 0 and target.defense_percentage_down == 0:
+            weakening_skills: list = [skill for skill in affordable_skills if isinstance(skill, WeakeningSkill)]
+            if len(weakening_skills) > 0:
+                return "USE SKILL", max(weakening_skills, key=lambda skill: skill.enemy_defense_percentage_down), \
+                    target
+
+        best_skill: AttackSkill or None = None
+        best_damage: mpf = Action.calculate_normal_attack_raw_damage(user, target)  # normal attack
+        for skill in affordable_skills:
+            if isinstance(skill, AttackSkill):
+                damage_multiplier: DamageMultiplier = skill.get_damage_multiplier(user.get_skill_level(skill))
+                damage: mpf = damage_multiplier.calculate_raw_damage_without_enemy_defense(user, target) if \
+                    skill.does_ignore_enemies_defense else damage_multiplier.calculate_raw_damage(user, target)
+                if damage > best_damage:
+                    best_skill = skill
+                    best_damage = damage
+
+        if best_skill is not None:
+            return "USE SKILL", best_skill, target
+        return "NORMAL ATTACK", None, target
+
+
+def run_tournament_match(match):
+    # type: (tuple) -> tuple
+    """
+    Carrying out one tournament match, possibly in a worker process.
+    :param match: a tuple of both teams, their battle policies, the random seed and the most turns to be taken
+    :return: a tuple of the points scored by team 1 (1 for a win, 0.5 for a draw and 0 for a loss) and the turns taken
+    """
+
+    team1, team2, team1_policy, team2_policy, seed, max_turns = match
+    if len(team1.get_legendary_creatures()) == 0 or len(team2.get_legendary_creatures()) == 0:
+        # A trainer without legendary creatures forfeits the match.
+        return (0.5 if len(team1.get_legendary_creatures()) == len(team2.get_legendary_creatures()) else
+                1 if len(team2.get_legendary_creatures()) == 0 else 0), 0
+
+    restore_legendary_creatures(team1.get_legendary_creatures() + team2.get_legendary_creatures())
+    battle: TrainerBattle = TrainerBattle(team1, team2)
+    battle.random_generator = random.Random(seed)
+    winner: Team or None = battle.resolve(team1_policy, team2_policy, max_turns)
+    return (1 if winner is battle.team1 else 0 if winner is battle.team2 else 0.5), battle.turns
+
+
+class Tournament:
+    """
+    This class contains attributes of a tournament between trainers, played in round robin or Swiss rounds of
+    trainer battles. Ratings are Elo ratings updated after every round. With an odd number of trainers in a Swiss
+    round, the lowest ranked trainer who has not had a bye yet sits out and scores a point, which does not count as a
+    win or change any rating. The matches of a round can be carried out in worker processes, and the random seed of
+    every match is drawn up front, so results do not depend on the number of workers.
+    """
+
+    POSSIBLE_FORMATS: list = ["ROUND ROBIN", "SWISS"]
+    INITIAL_RATING: float = 1500
+    K_FACTOR: float = 32
+
+    def __init__(self, trainers, tournament_format="ROUND ROBIN", number_of_rounds=None, games_per_pairing=1,
+                 max_turns=2000, seed=None):
+        # type: (list, str, int or None, int, int, int or None) -> None
+        self.__trainers: list = trainers
+        self.tournament_format: str = tournament_format if tournament_format in self.POSSIBLE_FORMATS else \
+            self.POSSIBLE_FORMATS[0]
+        number_of_trainers: int = len(trainers)
+        if number_of_rounds is None:
+            number_of_rounds = number_of_trainers - 1 + number_of_trainers % 2 if \
+                self.tournament_format == "ROUND ROBIN" else math.ceil(math.log2(max(2, number_of_trainers)))
+
+        self.number_of_rounds: int = number_of_rounds
+        self.games_per_pairing: int = games_per_pairing
+        self.max_turns: int = max_turns  # turns after which a match is a draw
+        self.rounds_played: int = 0
+        self.__random: random.Random = random.Random(seed)
+        self.__ratings: list = [self.INITIAL_RATING] * number_of_trainers
+        self.__points: list = [0.0] * number_of_trainers
+        self.__results: list = [[0, 0, 0] for i in range(number_of_trainers)]  # wins, draws and losses
+        self.__head_to_head: list = [[[0.0, 0] for j in range(number_of_trainers)] for i in
+                                     range(number_of_trainers)]  # points scored and games played against each other
+        self.__byes: set = set()  # trainers who sat out a Swiss round
 
     def __str__(self):
         # type: () -> str
-        res: str = Battle.__str__(self)
-        res += "Has the wild legendary creature been caught? " + str(self.wild_legendary_creature_caught) + "\n"
-        return res
+        return render_text(self)
+
+    def write_text(self, stream):
+        # type: (io.TextIOBase) -> None
+        stream.write("Standings after " + str(self.rounds_played) + " of " + str(self.number_of_rounds) +
+                     " rounds (" + str(self.tournament_format) + "):\n")
+        for rank, (trainer_index, rating, points, wins, draws, losses) in enumerate(self.get_standings()):
+            stream.write(str(rank + 1) + ". #" + str(trainer_index) + " " + str(self.__trainers[trainer_index].name) +
+                         ", Rating: " + str(round(rating)) + ", Points: " + str(points) + ", W/D/L: " + str(wins) +
+                         "/" + str(draws) + "/" + str(losses) + "\n")
+
+        stream.write("\nWin rates of row trainers against column trainers:\n")
+        stream.write("      " + "".join("%7s" % ("#" + str(j)) for j in range(len(self.__trainers))) + "\n")
+        for i, row in enumerate(self.get_win_rate_matrix()):
+            stream.write("%6s" % ("#" + str(i)) + "".join("%7s" % ("-" if win_rate is None else
+                                                                  "%.2f" % win_rate) for win_rate in row) + "\n")
+
+    def get_trainers(self):
+        # type: () -> list
+        return self.__trainers
+
+    def get_ratings(self):
+        # type: () -> list
+        return self.__ratings
+
+    def get_standings(self):
+        # type: () -> list
+        """
+        Getting the standings of the tournament.
+        :return: a list of tuples of the index of a trainer, its rating, points, wins, draws and losses, best first
+        """
+
+        return sorted(((i, self.__ratings[i], self.__points[i], *self.__results[i]) for i in
+                       range(len(self.__trainers))), key=lambda standing: (-standing[2], -standing[1], standing[0]))
+
+    def get_win_rate_matrix(self):
+        # type: () -> list
+        """
+        Getting the share of points each trainer scored against each other trainer.
+        :return: a list of rows with None for trainers who have not played each other
+        """
+
+        return [[points / games if games > 0 else None for points, games in row] for row in self.__head_to_head]
+
+    def get_policy(self, trainer):
+        # type: (Trainer) -> BattlePolicy
+        return AutoBattlePolicy() if isinstance(trainer, Player) else RandomBattlePolicy()
 
+    def get_round_pairings(self):
+        # type: () -> list
+        """
+        Getting the pairs of trainer indexes battling in the next round.
+        :return: a list of pairs
+        """
+
+        number_of_trainers: int = len(self.__trainers)
+        if self.tournament_format == "ROUND ROBIN":
+            # Circle method: the first trainer stays in place while the others rotate by one place every round, with
+            # an empty place (None) sitting out when the number of trainers is odd.
+            places: list = list(range(number_of_trainers)) + ([None] if number_of_trainers % 2 == 1 else [])
+            if len(places) < 2:
+                return []
+
+            rotation: int = self.rounds_played % (len(places) - 1)
+            places = places[:1] + places[1:][-rotation:] + places[1:][:-rotation] if rotation > 0 else places
+            pairings: list = [(places[i], places[-1 - i]) for i in range(len(places) // 2)]
+            if (self.rounds_played // (len(places) - 1)) % 2 == 1:
+                pairings = [(second, first) for first, second in pairings]  # swapping sides in every other cycle
+            return [pairing for pairing in pairings if None not in pairing]
+
+        # Swiss: trainers with similar points and ratings battle each other, avoiding rematches where possible.
+        ranking: list = [standing[0] for standing in self.get_standings()]
+        if len(ranking) % 2 == 1:
+            bye: int = next((i for i in reversed(ranking) if i not in self.__byes), ranking[-1])
+            self.__byes.add(bye)
+            ranking.remove(bye)
+
+        pairings: list = []
+        while len(ranking) > 1:
+            first: int = ranking.pop(0)
+            second: int = next((i for i in ranking if self.__head_to_head[first][i][1] == 0), ranking[0])
+            ranking.remove(second)
+            pairings.append((first, second))
+
+        return pairings
+
+    def play_round(self, executor=None):
+        # type: (object) -> list
+        """
+        Carrying out the matches of the next round and updating the ratings.
+        :param executor: a concurrent.futures executor carrying out the matches, or None to carry them out here
+        :return: a list of tuples of both trainer indexes, the points scored by the first trainer and the turns taken
+        """
+
+        matches: list = []
+        match_trainers: list = []
+        pairings: list = self.get_round_pairings()
+        if self.tournament_format == "SWISS":
+            paired: set = {trainer_index for pairing in pairings for trainer_index in pairing}
+            for trainer_index in range(len(self.__trainers)):
+                if trainer_index not in paired:
+                    self.__points[trainer_index] += 1  # a bye
+
+        for first, second in pairings:
+            for game in range(self.games_per_pairing):
+                # Alternating sides, since team 1 moves first when attack gauges are equal
+                team1_index, team2_index = (first, second) if game % 2 == 0 else (second, first)
+                team1_trainer: Trainer = self.__trainers[team1_index]
+                team2_trainer: Trainer = self.__trainers[team2_index]
+                match_trainers.append((team1_index, team2_index))
+                matches.append((team1_trainer.battle_team.clone(), team2_trainer.battle_team.clone(),
+                                self.get_policy(team1_trainer), self.get_policy(team2_trainer),
+                                self.__random.getrandbits(64), self.max_turns))
+
+        outcomes: list = list(map(run_tournament_match, matches)) if executor is None else \
+            list(executor.map(run_tournament_match, matches, chunksize=max(1, len(matches) // 32)))
+        rating_changes: list = [0.0] * len(self.__trainers)
+        results: list = []
+        for (team1_index, team2_index), (points, turns) in zip(match_trainers, outcomes):
+            expected_points: float = 1 / (1 + 10 ** ((self.__ratings[team2_index] - self.__ratings[team1_index])
+                                                    / 400))
+            rating_changes[team1_index] += self.K_FACTOR * (points - expected_points)
+            rating_changes[team2_index] -= self.K_FACTOR * (points - expected_points)
+            self.__points[team1_index] += points
+            self.__points[team2_index] += 1 - points
+            for trainer_index, other_index, trainer_points in [(team1_index, team2_index, points),
+                                                               (team2_index, team1_index, 1 - points)]:
+                self.__results[trainer_index][0 if trainer_points == 1 else 1 if trainer_points == 0.5 else 2] += 1
+                self.__head_to_head[trainer_index][other_index][0] += trainer_points
+                self.__head_to_head[trainer_index][other_index][1] += 1
+
+            results.append((team1_index, team2_index, points, turns))
+
+        for trainer_index, rating_change in enumerate(rating_changes):
+            self.__ratings[trainer_index] += rating_change
+
+        self.rounds_played += 1
+        return results
+
+    def run(self, workers=None):
+        # type: (int or None) -> list
+        """
+        Carrying out all remaining rounds of the tournament.
+        :param workers: the number of worker processes, all CPUs by default and none (carrying out matches in this
+        process) if it is 1
+        :return: the standings
+        """
+
+        if workers == 1:
+            while self.rounds_played < self.number_of_rounds:
+                self.play_round()
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=workers, initializer=set_numeric_backend,
+                                     initargs=(numeric_backend,)) as executor:
+                while self.rounds_played < self.number_of_rounds:
+                    self.play_round(executor)
 
-class Location:
+        return self.get_standings()
+
+
+class Location(SlottedState):
     """
-    This class contains attributes of a location in this game.
+    This class contains attributes of a location in this game. Locations are immutable and interned by their city,
+    so Location(city, x, y) always gives the same object for the same coordinates and locations can be compared and
+    hashed cheaply, e.g. when used as dict keys.
     """
 
-    def __init__(self, city, x, y):
-        # type: (City, int, int) -> None
-        self.city: City = city
-        self.x: int = x
-        self.y: int = y
+    __slots__: tuple = ("city", "x", "y")
+
+    def __new__(cls, city=None, x=0, y=0):
+        # type: (City or None, int, int) -> Location
+        if city is None:
+            return super().__new__(cls)  # being restored from saved game data from before locations were interned
+        return city.get_location(x, y)
+
+    @classmethod
+    def create(cls, city, x, y):
+        # type: (City, int, int) -> Location
+        location: Location = super().__new__(cls)
+        object.__setattr__(location, "city", city)
+        object.__setattr__(location, "x", x)
+        object.__setattr__(location, "y", y)
+        return location
+
+    def __setattr__(self, name, value):
+        # type: (str, object) -> None
+        raise AttributeError("locations are immutable")
+
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        for name in self.get_slot_names():
+            object.__setattr__(self, name, state[name])
+
+    def __reduce__(self):
+        # type: () -> tuple
+        return Location, (self.city, self.x, self.y)
+
+    def __eq__(self, other):
+        # type: (object) -> bool
+        return self is other or (isinstance(other, Location) and self.city is other.city and self.x == other.x and
+                                 self.y == other.y)
+
+    def __hash__(self):
+        # type: () -> int
+        return hash((id(self.city), self.x, self.y))
 
     def __str__(self):
         # type: () -> str
-        return str(self.city.name) + ", (" + str(self.x) + ", " + str(self.y) + ")"
+        return render_text(self)
+
+    def write_text(self, stream):
+        # type: (io.TextIOBase) -> None
+        stream.write(str(self.city.name) + ", (" + str(self.x) + ", " + str(self.y) + ")")
 
     def get_tile(self):
         # type: () -> Tile or None
@@ -277,7 +1210,7 @@ class Location:
 
     def clone(self):
         # type: () -> Location
-        return copy.deepcopy(self)
+        return self
 
 
 class City:
@@ -292,23 +1225,249 @@ class City:
         self.CITY_WIDTH: int = city_width
         self.__tiles: list = tiles
         assert len(self.__tiles) == self.CITY_HEIGHT and len(self.__tiles[0]) == self.CITY_WIDTH, "Dimension mismatch!"
+        self.__locations: dict = {}  # (x, y) -> location
+        self.__masks: dict = {}  # tile type or feature -> bitmask of the tiles having it, computed when first needed
+        self.__row_texts: list = [None] * self.CITY_HEIGHT  # rendered rows, None for rows to be rendered again
+        self.__version: int = 0  # incremented whenever any tile of this city changes
+        self.__walking_distances: dict = {}  # tile index -> walking distances to that tile, computed when first needed
+        self.__attach_tiles()
+
+    def __getstate__(self):
+        # type: () -> dict
+        state: dict = self.__dict__.copy()
+        state.pop("_City__locations", None)
+        state.pop("_City__masks", None)
+        state.pop("_City__walking_distances", None)
+        state.pop("_City__row_texts", None)
+        return state
+
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        # Locations in this city may already have been interned while the rest of the saved game data was restored.
+        self.__dict__.update(state)
+        self.__dict__.setdefault("_City__locations", {})
+        self.__dict__.setdefault("_City__version", 0)
+        self.__masks = {}
+        self.__walking_distances = {}
+        self.__row_texts = [None] * self.CITY_HEIGHT
+        self.__attach_tiles()
+
+    def __attach_tiles(self):
+        # type: () -> None
+        for row in range(self.CITY_HEIGHT):
+            for tile in self.__tiles[row]:
+                tile.attach_to_city(self, row)
 
     def __str__(self):
         # type: () -> str
-        res: str = ""  # initial value
+        return render_text(self)
+
+    def write_text(self, stream):
+        # type: (io.TextIOBase) -> None
+        # Only the rows whose tiles changed since they were last written are rendered again.
         for row in range(self.CITY_HEIGHT):
-            curr: str = "|"  # initial value
-            for col in range(self.CITY_WIDTH):
-                curr += str(self.__tiles[row][col]) + "|"
+            if self.__row_texts[row] is None:
+                row_stream: io.StringIO = io.StringIO()
+                row_stream.write("|")
+                for col in range(self.CITY_WIDTH):
+                    self.__tiles[row][col].write_text(row_stream)
+                    row_stream.write("|")
 
-            res += str(curr) + "\n"
+                row_stream.write("\n")
+                self.__row_texts[row] = row_stream.getvalue()
 
-        return res
+            stream.write(self.__row_texts[row])
 
     def get_tiles(self):
         # type: () -> list
         return self.__tiles
 
+    def get_version(self):
+        # type: () -> int
+        return self.__version
+
+    def row_changed(self, row):
+        # type: (int) -> None
+        self.__row_texts[row] = None
+        self.__version += 1
+
+    def set_tile(self, x, y, tile):
+        # type: (int, int, Tile) -> None
+        self.__tiles[y][x] = tile
+        tile.attach_to_city(self, y)
+        self.__masks = {}
+        self.__walking_distances = {}
+        self.row_changed(y)
+
+    def tiles_changed(self):
+        # type: () -> None
+        """
+        Discarding the tile masks, walking distances and rendered rows of this city. This is to be called whenever a
+        tile or a portal of a tile is changed other than through set_tile() or by moving game characters.
+        :return: None
+        """
+
+        self.__masks = {}
+        self.__walking_distances = {}
+        self.__row_texts = [None] * self.CITY_HEIGHT
+        self.__version += 1
+
+    def get_tile_index(self, x, y):
+        # type: (int, int) -> int
+        return y * self.CITY_WIDTH + x
+
+    def __compute_mask(self, has_feature):
+        # type: (callable) -> int
+        mask: int = 0
+        for y in range(self.CITY_HEIGHT):
+            for x in range(self.CITY_WIDTH):
+                if has_feature(self.__tiles[y][x]):
+                    mask |= 1 << self.get_tile_index(x, y)
+
+        return mask
+
+    def get_tile_type_mask(self, tile_type):
+        # type: (type) -> int
+        """
+        Getting the bitmask of the tiles of a type in this city, where bit y * CITY_WIDTH + x is set for the tile at
+        (x, y).
+        :param tile_type: the type of tiles
+        :return: the bitmask
+        """
+
+        if tile_type not in self.__masks:
+            self.__masks[tile_type] = self.__compute_mask(lambda tile: isinstance(tile, tile_type))
+
+        return self.__masks[tile_type]
+
+    def get_portal_mask(self):
+        # type: () -> int
+        if "PORTAL" not in self.__masks:
+            self.__masks["PORTAL"] = self.__compute_mask(lambda tile: isinstance(tile.portal, Portal))
+
+        return self.__masks["PORTAL"]
+
+    def get_water_adjacent_mask(self):
+        # type: () -> int
+        """
+        Getting the bitmask of the tiles directly above, below, left of or right of a water tile in this city.
+        :return: the bitmask
+        """
+
+        if "WATER ADJACENT" not in self.__masks:
+            water: int = self.get_tile_type_mask(WaterTile)
+            all_tiles: int = (1 << (self.CITY_WIDTH * self.CITY_HEIGHT)) - 1
+            first_column: int = sum(1 << self.get_tile_index(0, y) for y in range(self.CITY_HEIGHT))
+            last_column: int = first_column << (self.CITY_WIDTH - 1)
+            self.__masks["WATER ADJACENT"] = ((water << self.CITY_WIDTH) | (water >> self.CITY_WIDTH) |
+                                              ((water << 1) & ~first_column) | ((water >> 1) & ~last_column)) & \
+                all_tiles
+
+        return self.__masks["WATER ADJACENT"]
+
+    def is_in_mask(self, mask, x, y):
+        # type: (int, int, int) -> bool
+        return 0 <= x < self.CITY_WIDTH and 0 <= y < self.CITY_HEIGHT and (mask >> self.get_tile_index(x, y)) & 1 == 1
+
+    def get_locations_in_mask(self, mask):
+        # type: (int) -> list
+        locations: list = []
+        while mask:
+            lowest_bit: int = mask & -mask
+            index: int = lowest_bit.bit_length() - 1
+            locations.append(self.get_location(index % self.CITY_WIDTH, index // self.CITY_WIDTH))
+            mask ^= lowest_bit
+
+        return locations
+
+    @staticmethod
+    def get_walking_distances(is_walkable, city_width, city_height, x, y):
+        # type: (callable, int, int, int, int) -> list
+        """
+        Getting the fewest steps up, down, left or right needed to walk from every tile of a city to a tile, with a
+        breadth-first search from that tile.
+        :param is_walkable: a function of the coordinates of a tile telling whether the tile can be walked on
+        :param city_width: the width of the city
+        :param city_height: the height of the city
+        :param x: the x coordinate of the tile walked to
+        :param y: the y coordinate of the tile walked to
+        :return: a list of rows of distances, None for tiles from which the tile cannot be reached
+        """
+
+        distances: list = [[None] * city_width for row in range(city_height)]
+        if not is_walkable(x, y):
+            return distances
+
+        distances[y][x] = 0
+        queue: list = [(x, y)]
+        for curr_x, curr_y in queue:  # the queue grows while it is walked through
+            for dx, dy in WorldSimulation.DIRECTIONS:
+                next_x: int = curr_x + dx
+                next_y: int = curr_y + dy
+                if 0 <= next_x < city_width and 0 <= next_y < city_height and distances[next_y][next_x] is None \
+                        and is_walkable(next_x, next_y):
+                    distances[next_y][next_x] = distances[curr_y][curr_x] + 1
+                    queue.append((next_x, next_y))
+
+        return distances
+
+    def get_next_step(self, location, destination):
+        # type: (Location, Location) -> Location or None
+        """
+        Getting the first step of a shortest walk from a location to another in this city which does not cross water.
+        :param location: the location walked from
+        :param destination: the location walked to
+        :return: the neighbouring location to step onto, the location itself if it is the destination, or None if the
+        destination cannot be reached
+        """
+
+        if location == destination:
+            return location
+
+        walking_distances: dict = self.__dict__.setdefault("_City__walking_distances", {})
+        destination_index: int = self.get_tile_index(destination.x, destination.y)
+        if destination_index not in walking_distances:
+            water: int = self.get_tile_type_mask(WaterTile)
+            walking_distances[destination_index] = self.get_walking_distances(
+                lambda x, y: not self.is_in_mask(water, x, y), self.CITY_WIDTH, self.CITY_HEIGHT, destination.x,
+                destination.y)
+
+        distances: list = walking_distances[destination_index]
+        if distances[location.y][location.x] is None:
+            return None
+
+        for dx, dy in WorldSimulation.DIRECTIONS:
+            x: int = location.x + dx
+            y: int = location.y + dy
+            if 0 <= x < self.CITY_WIDTH and 0 <= y < self.CITY_HEIGHT and \
+                    distances[y][x] == distances[location.y][location.x] - 1:
+                return self.get_location(x, y)
+
+        return None
+
+    def get_location(self, x, y):
+        # type: (int, int) -> Location
+        """
+        Getting the interned location at the given coordinates in this city.
+        :param x: the x coordinate, from 0 to CITY_WIDTH - 1
+        :param y: the y coordinate, from 0 to CITY_HEIGHT - 1
+        :return: the location
+        """
+
+        locations: dict = self.__dict__.setdefault("_City__locations", {})
+        location: Location or None = locations.get((x, y))
+        if location is None:
+            # Locations saved in game data are restored before the attributes of their city, so the bounds are
+            # only checked once the city has them.
+            if "CITY_WIDTH" in self.__dict__ and (not 0 <= x < self.CITY_WIDTH or not 0 <= y < self.CITY_HEIGHT):
+                raise ValueError("(" + str(x) + ", " + str(y) + ") is outside " + str(self.name) + " city, which is " +
+                                 str(self.CITY_WIDTH) + " tiles wide and " + str(self.CITY_HEIGHT) + " tiles high")
+
+            location = Location.create(self, x, y)
+            locations[(x, y)] = location
+
+        return location
+
     def clone(self):
         # type: () -> City
         return copy.deepcopy(self)
@@ -326,7 +1485,13 @@ class Portal:
 
     def __str__(self):
         # type: () -> str
-        return str(self.location_from) + " -> " + str(self.location_to)
+        return render_text(self)
+
+    def write_text(self, stream):
+        # type: (io.TextIOBase) -> None
+        self.location_from.write_text(stream)
+        stream.write(" -> ")
+        self.location_to.write_text(stream)
 
     def get_tile_from(self):
         # type: () -> Tile or None
@@ -341,45 +1506,96 @@ class Portal:
         return copy.deepcopy(self)
 
 
-class Tile:
+class Tile(SlottedState):
     """
     This class contains attributes of a tile in this game.
     """
 
+    __slots__: tuple = ("name", "__game_characters", "portal", "__version", "__city", "__row")
+
     def __init__(self, portal=None):
         # type: (Portal or None) -> None
         self.name: str = ""
         self.__game_characters: list = []
         self.portal: Portal or None = portal
+        self.__version: int = 0  # incremented whenever the way this tile is shown changes
+        self.__city: City or None = None  # the city this tile is in, told about changes to this tile
+        self.__row: int = 0
 
-    def get_game_characters(self):
+    def __getstate__(self):
+        # type: () -> dict
+        state: dict = SlottedState.__getstate__(self)
+        state.pop("_Tile__city", None)
+        state.pop("_Tile__row", None)
+        return state
+
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        self.__version = 0
+        self.__city = None
+        self.__row = 0
+        SlottedState.__setstate__(self, state)
+
+    def get_version(self):
+        # type: () -> int
+        return self.__version
+
+    def attach_to_city(self, city, row):
+        # type: (City, int) -> None
+        self.__city = city
+        self.__row = row
+
+    def changed(self):
+        # type: () -> None
+        self.__version += 1
+        if self.__city is not None:
+            self.__city.row_changed(self.__row)
+
+    def get_game_characters(self):
         # type: () -> list
         return self.__game_characters
 
     def add_game_character(self, game_character):
         # type: (GameCharacter) -> None
         self.__game_characters.append(game_character)
+        self.changed()
 
     def remove_game_character(self, game_character):
         # type: (GameCharacter) -> bool
         if game_character not in self.__game_characters:
             return False
         self.__game_characters.remove(game_character)
+        self.changed()
         return True
 
+    def update_game_characters(self, leaving, arriving):
+        # type: (list, list) -> None
+        """
+        Removing and adding many game characters at once, in time proportional to the number of game characters on
+        this tile rather than to the number of moves.
+        :param leaving: the game characters leaving this tile
+        :param arriving: the game characters arriving at this tile
+        :return: None
+        """
+
+        if len(leaving) > 0:
+            leaving_ids: set = {id(game_character) for game_character in leaving}
+            self.__game_characters = [game_character for game_character in self.__game_characters
+                                      if id(game_character) not in leaving_ids]
+
+        self.__game_characters.extend(arriving)
+        self.changed()
+
     def __str__(self):
         # type: () -> str
+        return render_text(self)
+
+    def write_text(self, stream):
+        # type: (io.TextIOBase) -> None
         if len(self.__game_characters) == 0:
-            return str(self.name)
+            stream.write(str(self.name))
         else:
-            res: str = ""  # initial value
-            for i in range(len(self.__game_characters)):
-                if i == len(self.__game_characters) - 1:
-                    res += str(self.__game_characters[i].name)
-                else:
-                    res += str(self.__game_characters[i].name) + ", "
-
-            return res
+            stream.write(", ".join(str(game_character.name) for game_character in self.__game_characters))
 
     def clone(self):
         # type: () -> Tile
@@ -391,6 +1607,8 @@ class LandTile(Tile):
     This class contains attributes of a tile representing land.
     """
 
+    __slots__: tuple = ()
+
     def __init__(self, portal=None):
         # type: (Portal or None) -> None
         Tile.__init__(self, portal)
@@ -402,6 +1620,7 @@ class TrainingCenterTile(LandTile):
     creatures exists.
     """
 
+    __slots__: tuple = ("__legendary_creatures_trained", "legendary_creature_exp_per_second")
     MIN_LEGENDARY_CREATURES: int = 0
     MAX_LEGENDARY_CREATURES: int = 20
 
@@ -436,6 +1655,8 @@ class SandTile(LandTile):
     This class contains attributes of a tile representing sand.
     """
 
+    __slots__: tuple = ()
+
     def __init__(self, portal=None):
         # type: (Portal or None) -> None
         Tile.__init__(self, portal)
@@ -447,6 +1668,8 @@ class GrassTile(LandTile):
     This class contains attributes of a tile representing grass.
     """
 
+    __slots__: tuple = ()
+
     def __init__(self, portal=None):
         # type: (Portal or None) -> None
         Tile.__init__(self, portal)
@@ -458,6 +1681,8 @@ class ShopTile(LandTile):
     This class contains attributes of a tile representing shop.
     """
 
+    __slots__: tuple = ("__items_sold",)
+
     def __init__(self, items_sold, portal=None):
         # type: (list, Portal or None) -> None
         Tile.__init__(self, portal)
@@ -474,6 +1699,8 @@ class WaterTile(Tile):
     This class contains attributes of a tile representing water.
     """
 
+    __slots__: tuple = ()
+
     def __init__(self, portal=None):
         # type: (Portal or None) -> None
         Tile.__init__(self, portal)
@@ -487,28 +1714,47 @@ class GameCharacter:
 
     def __init__(self, name, location):
         # type: (str, Location) -> None
+        import uuid
         self.game_character_id: str = str(uuid.uuid1())  # Generating random game character ID
         self.name: str = name
         self.location: Location = location
         self.location.get_tile().add_game_character(self)
+        self.patrol_route: list = []  # locations visited in turn when roaming, or empty for a random walk
+        self.patrol_position: int = 0
+
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        self.__dict__.update(state)
+        self.__dict__.setdefault("patrol_route", [])
+        self.__dict__.setdefault("patrol_position", 0)
 
     def __str__(self):
         # type: () -> str
-        res: str = ""  # initial value
-        res += "Game Character ID: " + str(self.game_character_id) + "\n"
-        res += "Name: " + str(self.name) + "\n"
-        res += "Location: " + str(self.location) + "\n"
-        return res
+        return render_text(self)
+
+    def write_text(self, stream):
+        # type: (io.TextIOBase) -> None
+        stream.write("Game Character ID: " + str(self.game_character_id) + "\n")
+        stream.write("Name: " + str(self.name) + "\n")
+        stream.write("Location: ")
+        self.location.write_text(stream)
+        stream.write("\n")
 
     def interact_with_npc(self, npc):
         # type: (NPC) -> str
         return str(npc.message)
 
+    def move_to(self, location):
+        # type: (Location) -> None
+        self.location.get_tile().remove_game_character(self)
+        self.location = location
+        self.location.get_tile().add_game_character(self)
+
     def enter_portal(self):
         # type: () -> bool
         if isinstance(self.location.get_tile().portal, Portal):
             portal: Portal = self.location.get_tile().portal
-            self.location = portal.location_to
+            self.move_to(portal.location_to)
             return True
         return False
 
@@ -527,11 +1773,10 @@ class NPC(GameCharacter):
         GameCharacter.__init__(self, name, location)
         self.message: str = message
 
-    def __str__(self):
-        # type: () -> str
-        res: str = GameCharacter.__str__(self)
-        res += "Message: " + str(self.message)
-        return res
+    def write_text(self, stream):
+        # type: (io.TextIOBase) -> None
+        GameCharacter.write_text(self, stream)
+        stream.write("Message: " + str(self.message))
 
 
 class Trainer(GameCharacter):
@@ -550,30 +1795,56 @@ class Trainer(GameCharacter):
         self.required_exp: mpf = mpf("1e6")
         self.coins: mpf = mpf("0")
 
-    def __str__(self):
+    def write_text(self, stream):
+        # type: (io.TextIOBase) -> None
+        GameCharacter.write_text(self, stream)
+        stream.write("Below is the team brought by this player for battles.\n")
+        self.battle_team.write_text(stream)
+        stream.write("\nITEM INVENTORY\n")
+        self.item_inventory.write_text(stream)
+        stream.write("\nLEGENDARY CREATURE INVENTORY\n")
+        self.legendary_creature_inventory.write_text(stream)
+        stream.write("\n")
+        self.write_progress_text(stream)
+
+    def write_progress_text(self, stream):
+        # type: (io.TextIOBase) -> None
+        stream.write("Level: " + str(self.level) + "\n")
+        stream.write("EXP: " + str(self.exp) + "\n")
+        stream.write("EXP needed to have in order to reach next level: " + str(self.required_exp) + "\n")
+        stream.write("Coins: " + str(self.coins) + "\n")
+
+    def get_summary(self):
         # type: () -> str
-        res: str = GameCharacter.__str__(self)
-        res += "Below is the team brought by this player for battles.\n" + str(self.battle_team) + "\n"
-        res += "ITEM INVENTORY\n" + str(self.item_inventory) + "\n"
-        res += "LEGENDARY CREATURE INVENTORY\n" + \
-               str(self.legendary_creature_inventory) + "\n"
-        res += "Level: " + str(self.level) + "\n"
-        res += "EXP: " + str(self.exp) + "\n"
-        res += "EXP needed to have in order to reach next level: " + str(self.required_exp) + "\n"
-        res += "Coins: " + str(self.coins) + "\n"
-        return res
+        """
+        Getting the stats of this trainer with one line for every legendary creature in the battle team and only the
+        sizes of the inventories, which can be paged through separately.
+        :return: the summary
+        """
+
+        stream: io.StringIO = io.StringIO()
+        GameCharacter.write_text(self, stream)
+        stream.write("Below is the team brought by this player for battles.\n")
+        for legendary_creature in self.battle_team.get_legendary_creatures():
+            stream.write(legendary_creature.get_summary() + "\n")
+
+        stream.write("Number of items: " + str(self.item_inventory.get_number_of_items()) + "\n")
+        stream.write("Number of legendary creatures: " +
+                     str(self.legendary_creature_inventory.get_number_of_legendary_creatures()) + "\n")
+        self.write_progress_text(stream)
+        return stream.getvalue()
 
     def place_rune_on_legendary_creature(self, legendary_creature, rune):
         # type: (LegendaryCreature, Rune) -> bool
-        if legendary_creature in self.legendary_creature_inventory.get_legendary_creatures() and rune in \
-                self.item_inventory.get_items():
+        if self.legendary_creature_inventory.has_legendary_creature(legendary_creature) and \
+                self.item_inventory.has_item(rune):
             legendary_creature.place_rune(rune)
             return True
         return False
 
     def remove_rune_from_legendary_creature(self, legendary_creature, slot_number):
         # type: (LegendaryCreature, int) -> bool
-        if legendary_creature in self.legendary_creature_inventory.get_legendary_creatures():
+        if self.legendary_creature_inventory.has_legendary_creature(legendary_creature):
             if slot_number in legendary_creature.get_runes().keys():
                 legendary_creature.remove_rune(slot_number)
             return False
@@ -581,9 +1852,9 @@ class Trainer(GameCharacter):
 
     def level_up(self):
         # type: () -> None
-        while self.exp >= self.required_exp:
+        while self.exp >= self.required_exp and self.required_exp != mpf("inf"):
             self.level += 1
-            self.required_exp *= mpf("10") ** self.level
+            self.required_exp *= power_of_ten(self.level)
 
     def purchase_item(self, item):
         # type: (Item) -> bool
@@ -595,15 +1866,14 @@ class Trainer(GameCharacter):
 
     def sell_item(self, item):
         # type: (Item) -> bool
-        if item in self.item_inventory.get_items():
-            self.remove_item_from_inventory(item)
+        if self.remove_item_from_inventory(item):
             self.coins += item.sell_coin_gain
             return True
         return False
 
     def level_up_rune(self, rune):
         # type: (Rune) -> bool
-        if rune not in self.item_inventory.get_items():
+        if not self.item_inventory.has_item(rune):
             return False
 
         if self.coins >= rune.level_up_coin_cost:
@@ -622,7 +1892,7 @@ class Trainer(GameCharacter):
 
     def add_legendary_creature_to_training_center(self, legendary_creature):
         # type: (LegendaryCreature) -> bool
-        if legendary_creature not in self.legendary_creature_inventory.get_legendary_creatures():
+        if not self.legendary_creature_inventory.has_legendary_creature(legendary_creature):
             return False
 
         curr_tile: Tile or None = self.location.get_tile()
@@ -647,7 +1917,15 @@ class Trainer(GameCharacter):
 
     def catch_legendary_creature(self, legendary_creature, ball):
         # type: (LegendaryCreature, Ball) -> bool
-        if ball not in self.item_inventory.get_items():
+        """
+        Throwing a ball from the item inventory at a legendary creature. The ball stays in the item inventory whether
+        or not the legendary creature is caught, so it can be thrown again.
+        :param legendary_creature: the legendary creature to be caught
+        :param ball: the ball thrown
+        :return: whether the legendary creature is caught
+        """
+
+        if not self.item_inventory.has_item(ball):
             return False
         else:
             legendary_creature_hp_percentage_loss: float = 100 - ((legendary_creature.curr_hp /
@@ -669,7 +1947,7 @@ class Trainer(GameCharacter):
 
     def add_legendary_creature_to_team(self, legendary_creature):
         # type: (LegendaryCreature) -> bool
-        if legendary_creature in self.legendary_creature_inventory.get_legendary_creatures():
+        if self.legendary_creature_inventory.has_legendary_creature(legendary_creature):
             return self.battle_team.add_legendary_creature(legendary_creature)
         return False
 
@@ -698,11 +1976,10 @@ class CPUTrainer(Trainer):
         Trainer.__init__(self, name, location, battle_team)
         self.times_beaten: int = 0  # initial value
 
-    def __str__(self):
-        # type: () -> str
-        res: str = Trainer.__str__(self)
-        res += "Times beaten: " + str(self.times_beaten) + "\n"
-        return res
+    def write_text(self, stream):
+        # type: (io.TextIOBase) -> None
+        Trainer.write_text(self, stream)
+        stream.write("Times beaten: " + str(self.times_beaten) + "\n")
 
     def get_beaten(self):
         # type: () -> None
@@ -714,35 +1991,227 @@ class CPUTrainer(Trainer):
 
 class LegendaryCreatureInventory:
     """
-    This class contains attributes of a legendary creature inventory to store legendary creatures.
+    This class contains attributes of a legendary creature inventory to store legendary creatures. Legendary creatures
+    are stored by their IDs and are also kept in sorted indexes so that the strongest legendary creatures or the ones
+    within a range of levels can be found without sorting the whole inventory.
     """
 
+    INDEXED_ATTRIBUTES: list = ["level", "attack_power", "max_hp"]
+
     def __init__(self):
         # type: () -> None
-        self.__legendary_creatures: list = []
+        self.__legendary_creatures: dict = {}  # legendary creature ID -> legendary creature
+        self.__sorted_legendary_creature_ids: dict = {attribute: [] for attribute in self.INDEXED_ATTRIBUTES}
+        self.__index_keys: dict = {}  # legendary creature ID -> indexed attribute values when last indexed
+        self.__legendary_creature_ids_by_type: dict = {}  # creature type -> (legendary creature ID -> None)
+        self.__sorted_names: list = []  # sorted list of (name, legendary creature ID)
 
     def __str__(self):
         # type: () -> str
-        res: str = "Below is a list of legendary creatures in this inventory.\n"  # initial value
-        for legendary_creature in self.__legendary_creatures:
-            res += str(legendary_creature) + "\n"
+        return render_text(self)
+
+    def write_text(self, stream):
+        # type: (io.TextIOBase) -> None
+        stream.write("Below is a list of legendary creatures in this inventory.\n")
+        for legendary_creature in self.__legendary_creatures.values():
+            legendary_creature.write_text(stream)
+            stream.write("\n")
+
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        if isinstance(state.get("_LegendaryCreatureInventory__legendary_creatures"), list):
+            # Saved game data from before legendary creatures were indexed only has the list of legendary creatures.
+            self.__init__()
+            for legendary_creature in state["_LegendaryCreatureInventory__legendary_creatures"]:
+                self.add_legendary_creature(legendary_creature)
+        else:
+            self.__dict__.update(state)
+            if "_LegendaryCreatureInventory__sorted_names" not in state:
+                self.__sorted_names = sorted((legendary_creature.name, legendary_creature_id) for
+                                             legendary_creature_id, legendary_creature in
+                                             self.__legendary_creatures.items())
 
-        return res
+            for legendary_creature in self.__legendary_creatures.values():
+                legendary_creature.add_stat_listener(self)
+
+    def __add_to_indexes(self, legendary_creature):
+        # type: (LegendaryCreature) -> None
+        legendary_creature_id: str = legendary_creature.legendary_creature_id
+        index_keys: tuple = tuple(getattr(legendary_creature, attribute) for attribute in self.INDEXED_ATTRIBUTES)
+        self.__index_keys[legendary_creature_id] = index_keys
+        for attribute, key in zip(self.INDEXED_ATTRIBUTES, index_keys):
+            bisect.insort(self.__sorted_legendary_creature_ids[attribute], (key, legendary_creature_id))
+
+    def __remove_from_indexes(self, legendary_creature):
+        # type: (LegendaryCreature) -> None
+        legendary_creature_id: str = legendary_creature.legendary_creature_id
+        for attribute, key in zip(self.INDEXED_ATTRIBUTES, self.__index_keys.pop(legendary_creature_id)):
+            sorted_legendary_creature_ids: list = self.__sorted_legendary_creature_ids[attribute]
+            del sorted_legendary_creature_ids[bisect.bisect_left(sorted_legendary_creature_ids,
+                                                                 (key, legendary_creature_id))]
 
     def add_legendary_creature(self, legendary_creature):
         # type: (LegendaryCreature) -> None
-        self.__legendary_creatures.append(legendary_creature)
+        if legendary_creature.legendary_creature_id in self.__legendary_creatures:
+            return
+
+        self.__legendary_creatures[legendary_creature.legendary_creature_id] = legendary_creature
+        self.__legendary_creature_ids_by_type.setdefault(legendary_creature.creature_type, {})[
+            legendary_creature.legendary_creature_id] = None
+        self.__add_to_indexes(legendary_creature)
+        bisect.insort(self.__sorted_names, (legendary_creature.name, legendary_creature.legendary_creature_id))
+        legendary_creature.add_stat_listener(self)
 
     def remove_legendary_creature(self, legendary_creature):
         # type: (LegendaryCreature) -> bool
-        if legendary_creature in self.__legendary_creatures:
-            self.__legendary_creatures.remove(legendary_creature)
+        if legendary_creature.legendary_creature_id in self.__legendary_creatures:
+            del self.__legendary_creatures[legendary_creature.legendary_creature_id]
+            del self.__legendary_creature_ids_by_type[legendary_creature.creature_type][
+                legendary_creature.legendary_creature_id]
+            self.__remove_from_indexes(legendary_creature)
+            del self.__sorted_names[bisect.bisect_left(self.__sorted_names, (legendary_creature.name,
+                                                                             legendary_creature.legendary_creature_id))]
+            legendary_creature.remove_stat_listener(self)
             return True
         return False
 
+    def update_legendary_creature(self, legendary_creature):
+        # type: (LegendaryCreature) -> None
+        """
+        Re-indexing a legendary creature in this inventory after its stats changed.
+        :param legendary_creature: the legendary creature whose stats changed
+        :return: None
+        """
+
+        if legendary_creature.legendary_creature_id in self.__legendary_creatures:
+            self.__remove_from_indexes(legendary_creature)
+            self.__add_to_indexes(legendary_creature)
+
+    def has_legendary_creature(self, legendary_creature):
+        # type: (LegendaryCreature) -> bool
+        return self.__legendary_creatures.get(legendary_creature.legendary_creature_id) is legendary_creature
+
+    def get_legendary_creature(self, legendary_creature_id):
+        # type: (str) -> LegendaryCreature or None
+        return self.__legendary_creatures.get(legendary_creature_id)
+
+    def get_number_of_legendary_creatures(self):
+        # type: () -> int
+        return len(self.__legendary_creatures)
+
     def get_legendary_creatures(self):
         # type: () -> list
-        return self.__legendary_creatures
+        return list(self.__legendary_creatures.values())
+
+    def get_legendary_creatures_of_type(self, creature_type):
+        # type: (str) -> list
+        return [self.__legendary_creatures[legendary_creature_id] for legendary_creature_id in
+                self.__legendary_creature_ids_by_type.get(creature_type, {})]
+
+    def get_top_legendary_creatures(self, attribute, k):
+        # type: (str, int) -> list
+        """
+        Getting the legendary creatures with the highest values of an indexed attribute.
+        :param attribute: one of INDEXED_ATTRIBUTES
+        :param k: the maximum number of legendary creatures to get
+        :return: a list of legendary creatures, highest value first
+        """
+
+        sorted_legendary_creature_ids: list = self.__sorted_legendary_creature_ids[attribute]
+        return [self.__legendary_creatures[legendary_creature_id] for key, legendary_creature_id in
+                reversed(sorted_legendary_creature_ids[max(0, len(sorted_legendary_creature_ids) - k):])]
+
+    def get_legendary_creatures_in_range(self, attribute, min_value=None, max_value=None):
+        # type: (str, mpf or None, mpf or None) -> list
+        """
+        Getting the legendary creatures whose value of an indexed attribute is within a range.
+        :param attribute: one of INDEXED_ATTRIBUTES
+        :param min_value: the lowest value included, or None for no lower bound
+        :param max_value: the highest value included, or None for no upper bound
+        :return: a list of legendary creatures, lowest value first
+        """
+
+        sorted_legendary_creature_ids: list = self.__sorted_legendary_creature_ids[attribute]
+        start: int = 0 if min_value is None else bisect.bisect_left(sorted_legendary_creature_ids, (min_value,))
+        end: int = len(sorted_legendary_creature_ids) if max_value is None else \
+            bisect.bisect_right(sorted_legendary_creature_ids, (max_value, MAX_LEGENDARY_CREATURE_ID))
+        return [self.__legendary_creatures[legendary_creature_id] for key, legendary_creature_id in
+                sorted_legendary_creature_ids[start:end]]
+
+    def get_page(self, page_number, page_size, creature_type=None, min_level=None, max_level=None, name_prefix=None):
+        # type: (int, int, str or None, int or None, int or None, str or None) -> list
+        """
+        Getting one page of the legendary creatures matching the given filters. Only the legendary creatures up to the
+        end of the page are looked at, and filters on levels, names or creature types start from their index.
+        :param page_number: the number of the page, starting from 0
+        :param page_size: the number of legendary creatures on a page
+        :param creature_type: only include legendary creatures of this type
+        :param min_level: only include legendary creatures with at least this level
+        :param max_level: only include legendary creatures with at most this level
+        :param name_prefix: only include legendary creatures whose names start with this prefix
+        :return: a list of at most page_size legendary creatures
+        """
+
+        if min_level is not None or max_level is not None:
+            sorted_legendary_creature_ids: list = self.__sorted_legendary_creature_ids["level"]
+            start: int = 0 if min_level is None else bisect.bisect_left(sorted_legendary_creature_ids, (min_level,))
+            end: int = len(sorted_legendary_creature_ids) if max_level is None else \
+                bisect.bisect_right(sorted_legendary_creature_ids, (max_level, MAX_LEGENDARY_CREATURE_ID))
+            candidate_ids = (sorted_legendary_creature_ids[i][1] for i in range(start, end))
+        elif name_prefix is not None:
+            start: int = bisect.bisect_left(self.__sorted_names, (name_prefix,))
+            candidate_ids = (legendary_creature_id for name, legendary_creature_id in
+                             itertools.takewhile(lambda entry: entry[0].startswith(name_prefix),
+                                                 itertools.islice(self.__sorted_names, start, None)))
+        elif creature_type is not None:
+            candidate_ids = iter(self.__legendary_creature_ids_by_type.get(creature_type, {}))
+        else:
+            candidate_ids = iter(self.__legendary_creatures)
+
+        matching = (legendary_creature for legendary_creature in
+                    (self.__legendary_creatures[legendary_creature_id] for legendary_creature_id in candidate_ids)
+                    if (creature_type is None or legendary_creature.creature_type == creature_type) and
+                    (min_level is None or legendary_creature.level >= min_level) and
+                    (max_level is None or legendary_creature.level <= max_level) and
+                    (name_prefix is None or legendary_creature.name.startswith(name_prefix)))
+        return list(itertools.islice(matching, page_number * page_size, (page_number + 1) * page_size))
+
+    def render_page(self, page_number, page_size, summary=True, creature_type=None, min_level=None, max_level=None,
+                    name_prefix=None):
+        # type: (int, int, bool, str or None, int or None, int or None, str or None) -> str
+        """
+        Rendering one page of legendary creatures, either as one line each or with their full stats.
+        :return: the rendered page
+        """
+
+        return self.render_legendary_creatures(page_number, self.get_page(page_number, page_size, creature_type,
+                                                                          min_level, max_level, name_prefix), summary)
+
+    @staticmethod
+    def render_legendary_creatures(page_number, legendary_creatures, summary=True):
+        # type: (int, list, bool) -> str
+        """
+        Rendering a page of legendary creatures which was already got with get_page().
+        :param page_number: the number of the page, starting from 0
+        :param legendary_creatures: the legendary creatures on the page
+        :param summary: whether to show one line for every legendary creature rather than its full stats
+        :return: the rendered page
+        """
+
+        stream: io.StringIO = io.StringIO()
+        stream.write("Page " + str(page_number + 1) + " of legendary creatures in this inventory.\n")
+        for i, legendary_creature in enumerate(legendary_creatures):
+            if summary:
+                stream.write("#" + str(i) + ": " + legendary_creature.get_summary() + "\n")
+            else:
+                stream.write("#" + str(i) + "\n")
+                legendary_creature.write_text(stream)
+                stream.write("\n")
+
+        if len(legendary_creatures) == 0:
+            stream.write("No legendary creatures on this page.\n")
+
+        return stream.getvalue()
 
     def clone(self):
         # type: () -> LegendaryCreatureInventory
@@ -751,35 +2220,230 @@ class LegendaryCreatureInventory:
 
 class ItemInventory:
     """
-    This class contains attributes of an inventory to store items.
+    This class contains attributes of an inventory to store items. Stackable items are stored once together with how
+    many of them the inventory holds, while every rune gets its own rune instance.
     """
 
     def __init__(self):
         # type: () -> None
-        self.__items: list = []
+        self.__items: dict = {}  # item ID -> item, in the order the items were added
+        self.__quantities: dict = {}  # item ID -> number of copies of the item
+        self.__item_ids: dict = {}  # item -> item ID
+        self.__items_by_type: dict = {}  # item type -> (item ID -> item)
+        self.__sorted_item_ids: dict = {}  # item type -> sorted list of (sort key, item ID)
+        self.__next_item_id: int = 0
+        self.__number_of_items: int = 0
 
     def __str__(self):
         # type: () -> str
-        res: str = "Below is a list of items in this inventory.\n"
-        for item in self.__items:
-            res += str(item) + "\n"
+        return render_text(self)
+
+    def write_text(self, stream):
+        # type: (io.TextIOBase) -> None
+        stream.write("Below is a list of items in this inventory.\n")
+        for item_id, item in self.__items.items():
+            item.write_text(stream)
+            stream.write("Quantity: " + str(self.__quantities[item_id]) + "\n\n")
+
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        if isinstance(state.get("_ItemInventory__items"), list):
+            # Saved game data from before items were indexed only has the list of items, where runes carry their
+            # own level.
+            self.__init__()
+            for item in state["_ItemInventory__items"]:
+                self.add_item(RuneInstance.from_legacy_rune(item) if type(item) is Rune else item)
+        else:
+            self.__dict__.update(state)
 
-        return res
+    @staticmethod
+    def get_sort_key(item):
+        # type: (Item) -> tuple or None
+        """
+        Getting the key the ordered view of the type of the given item is sorted by.
+        :param item: an item
+        :return: the sort key, or None if items of this type have no ordered view
+        """
 
-    def add_item(self, item):
-        # type: (Item) -> None
-        self.__items.append(item)
+        if isinstance(item, Rune):
+            return item.slot_number, item.rating
+        elif isinstance(item, Ball):
+            return item.catch_success_rate,
+        return None
 
-    def remove_item(self, item):
-        # type: (Item) -> bool
-        if item in self.__items:
-            self.__items.remove(item)
-            return True
+    def add_item(self, item, quantity=1):
+        # type: (Item, int) -> int
+        """
+        Adding copies of an item to this inventory. A rune definition gets a new rune instance for every copy.
+        :param item: the item to add
+        :param quantity: the number of copies to add
+        :return: the item ID of the (last) entry the item was added to
+        """
+
+        if item.IS_STACKABLE and item in self.__item_ids:
+            item_id: int = self.__item_ids[item]
+            self.__quantities[item_id] += quantity
+            self.__number_of_items += quantity
+            return item_id
+
+        if not item.IS_STACKABLE and not isinstance(item, RuneInstance):
+            item_id: int = -1  # initial value
+            for i in range(quantity):
+                item_id = self.add_item(RuneInstance(item))
+
+            return item_id
+
+        item_id: int = self.__next_item_id
+        self.__next_item_id += 1
+        self.__items[item_id] = item
+        self.__quantities[item_id] = quantity if item.IS_STACKABLE else 1
+        self.__number_of_items += self.__quantities[item_id]
+        self.__item_ids[item] = item_id
+        self.__items_by_type.setdefault(type(item), {})[item_id] = item
+        sort_key: tuple or None = self.get_sort_key(item)
+        if sort_key is not None:
+            bisect.insort(self.__sorted_item_ids.setdefault(type(item), []), (sort_key, item_id))
+
+        return item_id
+
+    def remove_item(self, item, quantity=1):
+        # type: (Item, int) -> bool
+        if item in self.__item_ids:
+            return self.remove_item_by_id(self.__item_ids[item], quantity)
         return False
 
+    def remove_item_by_id(self, item_id, quantity=1):
+        # type: (int, int) -> bool
+        if item_id not in self.__items or self.__quantities[item_id] < quantity:
+            return False
+
+        self.__quantities[item_id] -= quantity
+        self.__number_of_items -= quantity
+        if self.__quantities[item_id] > 0:
+            return True
+
+        item: Item = self.__items.pop(item_id)
+        del self.__quantities[item_id]
+        del self.__item_ids[item]
+        del self.__items_by_type[type(item)][item_id]
+        sort_key: tuple or None = self.get_sort_key(item)
+        if sort_key is not None:
+            sorted_item_ids: list = self.__sorted_item_ids[type(item)]
+            del sorted_item_ids[bisect.bisect_left(sorted_item_ids, (sort_key, item_id))]
+
+        return True
+
+    def has_item(self, item):
+        # type: (Item) -> bool
+        return item in self.__item_ids
+
+    def get_item(self, item_id):
+        # type: (int) -> Item or None
+        return self.__items.get(item_id)
+
+    def get_quantity(self, item):
+        # type: (Item) -> int
+        return self.__quantities[self.__item_ids[item]] if item in self.__item_ids else 0
+
+    def get_number_of_items(self):
+        # type: () -> int
+        return self.__number_of_items
+
     def get_items(self):
         # type: () -> list
-        return self.__items
+        """
+        Getting all distinct items in this inventory, i.e. one entry for every stack and every rune instance.
+        :return: a list of items
+        """
+
+        return list(self.__items.values())
+
+    def get_items_of_type(self, item_type):
+        # type: (type) -> list
+        """
+        Getting all distinct items of the given type in the order they were added.
+        :param item_type: an item class, e.g. EXPShard
+        :return: a list of items
+        """
+
+        res: list = []  # initial value
+        for curr_type, items in self.__items_by_type.items():
+            if issubclass(curr_type, item_type):
+                res.extend(items.values())
+
+        return res
+
+    def get_sorted_items(self, item_type):
+        # type: (type) -> list
+        """
+        Getting all distinct items of the given type in their ordered view, i.e. runes by slot number and rating, and
+        balls by catch success rate.
+        :param item_type: an item class with an ordered view
+        :return: a list of items
+        """
+
+        sorted_item_ids: list = []  # initial value
+        for curr_type, curr_sorted_item_ids in self.__sorted_item_ids.items():
+            if issubclass(curr_type, item_type):
+                sorted_item_ids = list(heapq.merge(sorted_item_ids, curr_sorted_item_ids)) if \
+                    len(sorted_item_ids) > 0 else curr_sorted_item_ids
+
+        return [self.__items[item_id] for sort_key, item_id in sorted_item_ids]
+
+    def get_page(self, page_number, page_size, item_type=None, name_prefix=None):
+        # type: (int, int, type or None, str or None) -> list
+        """
+        Getting one page of the distinct items matching the given filters. Only the items up to the end of the page
+        are looked at.
+        :param page_number: the number of the page, starting from 0
+        :param page_size: the number of items on a page
+        :param item_type: only include items of this type
+        :param name_prefix: only include items whose names start with this prefix
+        :return: a list of at most page_size items
+        """
+
+        if item_type is None:
+            candidates = iter(self.__items.values())
+        else:
+            candidates = itertools.chain.from_iterable(items.values() for curr_type, items in
+                                                       self.__items_by_type.items() if issubclass(curr_type, item_type))
+
+        matching = (item for item in candidates if name_prefix is None or item.name.startswith(name_prefix))
+        return list(itertools.islice(matching, page_number * page_size, (page_number + 1) * page_size))
+
+    def render_page(self, page_number, page_size, summary=True, item_type=None, name_prefix=None):
+        # type: (int, int, bool, type or None, str or None) -> str
+        """
+        Rendering one page of items, either as one line each or with their full details.
+        :return: the rendered page
+        """
+
+        return self.render_items(page_number, self.get_page(page_number, page_size, item_type, name_prefix), summary)
+
+    def render_items(self, page_number, items, summary=True):
+        # type: (int, list, bool) -> str
+        """
+        Rendering a page of items which was already got with get_page().
+        :param page_number: the number of the page, starting from 0
+        :param items: the items on the page
+        :param summary: whether to show one line for every item rather than its full details
+        :return: the rendered page
+        """
+
+        stream: io.StringIO = io.StringIO()
+        stream.write("Page " + str(page_number + 1) + " of items in this inventory.\n")
+        for i, item in enumerate(items):
+            if summary:
+                stream.write("#" + str(i) + ": " + item.get_summary() + " x" + str(self.get_quantity(item)) + "\n")
+            else:
+                stream.write("#" + str(i) + "\n")
+                item.write_text(stream)
+                stream.write("Quantity: " + str(self.get_quantity(item)) + "\n\n")
+
+        if len(items) == 0:
+            stream.write("No items on this page.\n")
+
+        return stream.getvalue()
 
     def clone(self):
         # type: () -> ItemInventory
@@ -806,11 +2470,13 @@ class Team:
 
     def __str__(self):
         # type: () -> str
-        res: str = ""  # initial value
-        for legendary_creature in self.__legendary_creatures:
-            res += str(legendary_creature) + "\n"
+        return render_text(self)
 
-        return res
+    def write_text(self, stream):
+        # type: (io.TextIOBase) -> None
+        for legendary_creature in self.__legendary_creatures:
+            legendary_creature.write_text(stream)
+            stream.write("\n")
 
     def add_legendary_creature(self, legendary_creature):
         # type: (LegendaryCreature) -> bool
@@ -835,11 +2501,25 @@ class Team:
         return copy.deepcopy(self)
 
 
-class Item:
+class RaidTeam(Team):
+    """
+    This class contains attributes of a team brought to raid battles.
+    """
+
+    MAX_LEGENDARY_CREATURES: int = 1000
+
+
+class Item(SlottedState, metaclass=abc.ABCMeta):
     """
-    This class contains attributes of an item in this game.
+    This class contains attributes of an item in this game. Items sold in shops are shared definitions which are not
+    changed after they are created.
     """
 
+    __slots__: tuple = ("name", "description", "coin_cost", "sell_coin_gain")
+
+    # Whether owned copies of this item are interchangeable, in which case item inventories only store their count.
+    IS_STACKABLE: bool = True
+
     def __init__(self, name, description, coin_cost):
         # type: (str, str, mpf) -> None
         self.name: str = name
@@ -849,23 +2529,33 @@ class Item:
 
     def __str__(self):
         # type: () -> str
-        res: str = ""  # initial value
-        res += "Name: " + str(self.name) + "\n"
-        res += "Description: " + str(self.description) + "\n"
-        res += "Coin Cost: " + str(self.coin_cost) + "\n"
-        res += "Sell Coin Gain: " + str(self.sell_coin_gain) + "\n"
-        return res
+        return render_text(self)
+
+    def write_text(self, stream):
+        # type: (io.TextIOBase) -> None
+        stream.write("Name: " + str(self.name) + "\n")
+        stream.write("Description: " + str(self.description) + "\n")
+        stream.write("Coin Cost: " + str(self.coin_cost) + "\n")
+        stream.write("Sell Coin Gain: " + str(self.sell_coin_gain) + "\n")
+
+    def get_summary(self):
+        # type: () -> str
+        return str(self.name) + " (Coin Cost: " + str(self.coin_cost) + ")"
 
     def clone(self):
         # type: () -> Item
         return copy.deepcopy(self)
 
 
-class StatIncrease:
+class StatIncrease(SlottedState):
     """
     This class contains attributes of increase in stats of a rune.
     """
 
+    __slots__: tuple = ("max_hp_up", "max_hp_percentage_up", "max_magic_points_up", "max_magic_points_percentage_up",
+                        "attack_up", "attack_percentage_up", "defense_up", "defense_percentage_up", "attack_speed_up",
+                        "crit_rate_up", "crit_damage_up", "resistance_up", "accuracy_up")
+
     def __init__(self, max_hp_up, max_hp_percentage_up, max_magic_points_up, max_magic_points_percentage_up,
                  attack_up, attack_percentage_up, defense_up, defense_percentage_up, attack_speed_up, crit_rate_up,
                  crit_damage_up, resistance_up, accuracy_up):
@@ -886,21 +2576,23 @@ class StatIncrease:
 
     def __str__(self):
         # type: () -> str
-        res: str = ""  # initial value
-        res += "Max HP Up: " + str(self.max_hp_up) + "\n"
-        res += "Max HP Percentage Up: " + str(self.max_hp_percentage_up * 100) + "%\n"
-        res += "Max Magic Points Up: " + str(self.max_magic_points_up) + "\n"
-        res += "Max Magic Points Percentage Up: " + str(self.max_magic_points_percentage_up * 100) + "%\n"
-        res += "Attack Up: " + str(self.attack_up) + "\n"
-        res += "Attack Percentage Up: " + str(self.attack_percentage_up * 100) + "%\n"
-        res += "Defense Up: " + str(self.defense_up) + "\n"
-        res += "Defense Percentage Up: " + str(self.defense_percentage_up * 100) + "%\n"
-        res += "Attack Speed Up: " + str(self.attack_speed_up) + "\n"
-        res += "Crit Rate Up: " + str(self.crit_rate_up * 100) + "%\n"
-        res += "Crit Damage Up: " + str(self.crit_damage_up * 100) + "%\n"
-        res += "Resistance Up: " + str(self.resistance_up * 100) + "%\n"
-        res += "Accuracy Up: " + str(self.accuracy_up * 100) + "%\n"
-        return res
+        return render_text(self)
+
+    def write_text(self, stream):
+        # type: (io.TextIOBase) -> None
+        stream.write("Max HP Up: " + str(self.max_hp_up) + "\n")
+        stream.write("Max HP Percentage Up: " + str(self.max_hp_percentage_up * 100) + "%\n")
+        stream.write("Max Magic Points Up: " + str(self.max_magic_points_up) + "\n")
+        stream.write("Max Magic Points Percentage Up: " + str(self.max_magic_points_percentage_up * 100) + "%\n")
+        stream.write("Attack Up: " + str(self.attack_up) + "\n")
+        stream.write("Attack Percentage Up: " + str(self.attack_percentage_up * 100) + "%\n")
+        stream.write("Defense Up: " + str(self.defense_up) + "\n")
+        stream.write("Defense Percentage Up: " + str(self.defense_percentage_up * 100) + "%\n")
+        stream.write("Attack Speed Up: " + str(self.attack_speed_up) + "\n")
+        stream.write("Crit Rate Up: " + str(self.crit_rate_up * 100) + "%\n")
+        stream.write("Crit Damage Up: " + str(self.crit_damage_up * 100) + "%\n")
+        stream.write("Resistance Up: " + str(self.resistance_up * 100) + "%\n")
+        stream.write("Accuracy Up: " + str(self.accuracy_up * 100) + "%\n")
 
     def clone(self):
         # type: () -> StatIncrease
@@ -912,6 +2604,8 @@ class Rune(Item):
     This class contains attributes of a rune to strengthen legendary creatures in this game.
     """
 
+    __slots__: tuple = ("rating", "slot_number", "stat_increase")
+    IS_STACKABLE: bool = False
     MIN_RATING: int = 1
     MAX_RATING: int = 6
     MIN_SLOT_NUMBER: int = 1
@@ -930,30 +2624,117 @@ class Rune(Item):
                                                         mpf(2 * self.rating), mpf(0.01 * self.rating),
                                                         mpf(0.05 * self.rating), mpf(0.01 * self.rating),
                                                         mpf(0.01 * self.rating))
+
+    def write_text(self, stream):
+        # type: (io.TextIOBase) -> None
+        Item.write_text(self, stream)
+        stream.write("Rating: " + str(self.rating) + "\n")
+        stream.write("Slot Number: " + str(self.slot_number) + "\n")
+        stream.write("Stat Increase:\n")
+        self.stat_increase.write_text(stream)
+        stream.write("\n")
+
+
+class RuneInstance(SlottedState):
+    """
+    This class contains attributes of a rune owned by a trainer. The rune definition it was created from is shared and
+    only the level of this rune is stored here. It is registered as a rune rather than inheriting from Rune, so that
+    it has no slots for the attributes it reads from the rune definition.
+    """
+
+    __slots__: tuple = ("rune", "level", "level_up_coin_cost", "stat_increase")
+    IS_STACKABLE: bool = False
+
+    def __init__(self, rune):
+        # type: (Rune) -> None
+        self.rune: Rune = rune
         self.level: int = 1
-        self.level_up_coin_cost: mpf = coin_cost
+        self.stat_increase: StatIncrease = rune.stat_increase  # copied when this rune is first levelled up
+        self.level_up_coin_cost: mpf = rune.coin_cost
 
     def __str__(self):
         # type: () -> str
-        res: str = Item.__str__(self)
-        res += "Rating: " + str(self.rating) + "\n"
-        res += "Slot Number: " + str(self.slot_number) + "\n"
-        res += "Stat Increase:\n" + str(self.stat_increase) + "\n"
-        res += "Level: " + str(self.level) + "\n"
-        res += "Level Up Coin Cost: " + str(self.level_up_coin_cost) + "\n"
-        return res
+        return render_text(self)
+
+    def write_text(self, stream):
+        # type: (io.TextIOBase) -> None
+        Rune.write_text(self, stream)
+        stream.write("Level: " + str(self.level) + "\n")
+        stream.write("Level Up Coin Cost: " + str(self.level_up_coin_cost) + "\n")
+
+    def get_summary(self):
+        # type: () -> str
+        return str(self.name) + " (Level: " + str(self.level) + ")"
+
+    def clone(self):
+        # type: () -> RuneInstance
+        return copy.deepcopy(self)
+
+    @staticmethod
+    def from_legacy_rune(rune):
+        # type: (Rune) -> RuneInstance
+        """
+        Creating a rune instance for a rune owned in saved game data from before rune instances existed. Such runes
+        were levelled up in place, and every level up added 2 * rating to the attack speed increase, so the level is
+        read back from how far it is above the attack speed increase of a new rune.
+        :param rune: a rune which was in an item inventory or placed on a legendary creature
+        :return: a rune instance with the level, level up coin cost and stat increase of the given rune
+        """
+
+        new_rune: Rune = Rune(rune.name, rune.description, rune.coin_cost, rune.rating, rune.slot_number)
+        levels_gained: int = int(round((rune.stat_increase.attack_speed_up - new_rune.stat_increase.attack_speed_up) /
+                                       (2 * rune.rating)))
+        rune_instance: RuneInstance = RuneInstance(rune)
+        for level in range(2, levels_gained + 2):
+            rune_instance.level = level
+            rune_instance.level_up_coin_cost *= power_of_ten(level)
+
+        return rune_instance
+
+    @property
+    def name(self):
+        # type: () -> str
+        return self.rune.name
+
+    @property
+    def description(self):
+        # type: () -> str
+        return self.rune.description
+
+    @property
+    def coin_cost(self):
+        # type: () -> mpf
+        return self.rune.coin_cost
+
+    @property
+    def sell_coin_gain(self):
+        # type: () -> mpf
+        return self.rune.sell_coin_gain
+
+    @property
+    def rating(self):
+        # type: () -> int
+        return self.rune.rating
+
+    @property
+    def slot_number(self):
+        # type: () -> int
+        return self.rune.slot_number
 
     def level_up(self):
         # type: () -> None
+        if self.stat_increase is self.rune.stat_increase:
+            self.stat_increase = self.stat_increase.clone()
+
         self.level += 1
-        self.level_up_coin_cost *= mpf("10") ** self.level
-        self.stat_increase.max_hp_up *= mpf("10") ** self.rating
+        self.level_up_coin_cost *= power_of_ten(self.level)
+        self.stat_increase.max_hp_up *= power_of_ten(self.rating)
         self.stat_increase.max_hp_percentage_up += self.rating
-        self.stat_increase.max_magic_points_up *= mpf("10") ** self.rating
+        self.stat_increase.max_magic_points_up *= power_of_ten(self.rating)
         self.stat_increase.max_magic_points_percentage_up += self.rating
-        self.stat_increase.attack_up *= mpf("10") ** self.rating
+        self.stat_increase.attack_up *= power_of_ten(self.rating)
         self.stat_increase.attack_percentage_up += self.rating
-        self.stat_increase.defense_up *= mpf("10") ** self.rating
+        self.stat_increase.defense_up *= power_of_ten(self.rating)
         self.stat_increase.defense_percentage_up += self.rating
         self.stat_increase.attack_speed_up += 2 * self.rating
         self.stat_increase.crit_rate_up += 0.01 * self.rating
@@ -962,21 +2743,25 @@ class Rune(Item):
         self.stat_increase.accuracy_up += 0.01 * self.rating
 
 
+Rune.register(RuneInstance)
+
+
 class EXPShard(Item):
     """
     This class contains attributes of an EXP shard to add the EXP of legendary creatures.
     """
 
+    __slots__: tuple = ("exp_granted",)
+
     def __init__(self, name, description, coin_cost, exp_granted):
         # type: (str, str, mpf, mpf) -> None
         Item.__init__(self, name, description, coin_cost)
         self.exp_granted: mpf = exp_granted
 
-    def __str__(self):
-        # type: () -> str
-        res: str = Item.__str__(self)
-        res += "EXP Granted: " + str(self.exp_granted) + "\n"
-        return res
+    def write_text(self, stream):
+        # type: (io.TextIOBase) -> None
+        Item.write_text(self, stream)
+        stream.write("EXP Granted: " + str(self.exp_granted) + "\n")
 
 
 class LevelUpShard(Item):
@@ -984,6 +2769,8 @@ class LevelUpShard(Item):
     This class contains attributes of a level up shared to level up legendary creatures.
     """
 
+    __slots__: tuple = ()
+
     def __init__(self, name, description, coin_cost):
         # type: (str, str, mpf) -> None
         Item.__init__(self, name, description, coin_cost)
@@ -994,6 +2781,8 @@ class SkillLevelUpShard(Item):
     This class contains attributes of a skill level up shard to level up skills owned by legendary creatures.
     """
 
+    __slots__: tuple = ()
+
     def __init__(self, name, description, coin_cost):
         # type: (str, str, mpf) -> None
         Item.__init__(self, name, description, coin_cost)
@@ -1004,6 +2793,8 @@ class EvolutionCandy(Item):
     This class contains attributes of a candy to evolve a legendary creature.
     """
 
+    __slots__: tuple = ()
+
     def __init__(self, name, description, coin_cost):
         # type: (str, str, mpf) -> None
         Item.__init__(self, name, description, coin_cost)
@@ -1014,6 +2805,8 @@ class FishingRod(Item):
     This class contains attributes of a fishing rod to encounter legendary creatures underwater.
     """
 
+    __slots__: tuple = ("encounter_legendary_creature_chance",)
+
     def __init__(self, name, description, coin_cost, encounter_legendary_creature_chance):
         # type: (str, str, mpf, float) -> None
         Item.__init__(self, name, description, coin_cost)
@@ -1025,28 +2818,196 @@ class Ball(Item):
     This class contains attributes of a ball used to catch legendary creatures.
     """
 
+    __slots__: tuple = ("catch_success_rate",)
+
     def __init__(self, name, description, coin_cost, catch_success_rate):
         # type: (str, str, mpf, float) -> None
         Item.__init__(self, name, description, coin_cost)
         self.catch_success_rate: float = catch_success_rate
 
+    def write_text(self, stream):
+        # type: (io.TextIOBase) -> None
+        Item.write_text(self, stream)
+        stream.write("Catch Success Rate: " + str(self.catch_success_rate * 100) + "%\n")
+
+
+class StatusEffect(SlottedState):
+    """
+    This class contains attributes of a status effect changing an attack or defense percentage of a legendary
+    creature for a number of battle turns. An effect with the "REFRESH" stacking rule replaces an effect of the same
+    name and stat, while effects with the "STACK" stacking rule add up to MAX_STACKS times.
+    """
+
+    __slots__: tuple = ("name", "stat", "amount", "turns", "stacking", "expiry_turn")
+    POSSIBLE_STATS: list = ["attack_power_percentage_up", "attack_power_percentage_down", "defense_percentage_up",
+                            "defense_percentage_down"]
+    POSSIBLE_STACKING_RULES: list = ["REFRESH", "STACK"]
+    MAX_STACKS: int = 5
+
+    def __init__(self, name, stat, amount, turns, stacking="REFRESH"):
+        # type: (str, str, mpf, int, str) -> None
+        assert stat in self.POSSIBLE_STATS, "Unknown stat!"
+        self.name: str = name
+        self.stat: str = stat
+        self.amount: mpf = amount
+        self.turns: int = turns
+        self.stacking: str = stacking if stacking in self.POSSIBLE_STACKING_RULES else self.POSSIBLE_STACKING_RULES[0]
+        self.expiry_turn: int or None = None  # battle turn when this effect expires, set when it is scheduled
+
     def __str__(self):
         # type: () -> str
-        res: str = Item.__str__(self)
-        res += "Catch Success Rate: " + str(self.catch_success_rate * 100) + "%\n"
-        return res
+        return render_text(self)
+
+    def write_text(self, stream):
+        # type: (io.TextIOBase) -> None
+        stream.write(str(self.name) + ": " + str(self.stat) + " " + str(self.amount * 100) + "% for " +
+                     str(self.turns) + " turns\n")
 
+    def clone(self):
+        # type: () -> StatusEffect
+        return copy.deepcopy(self)
 
-class LegendaryCreature:
+
+class StatusEffectTimer:
     """
-    This class contains attributes of a legendary creature in this game.
+    This class contains attributes of the timer of a battle which ends the status effects of all legendary creatures
+    in the battle when they expire. Expiry times are kept in a heap, so that each battle turn only looks at the
+    effects expiring in it. Effects which were replaced or removed early are skipped when they come up in the heap.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        self.turn: int = 0
+        self.__expiries: list = []  # heap of (expiry turn, sequence number, legendary creature, status effect)
+        self.__number_of_schedules: int = 0  # breaks ties between effects expiring in the same turn
+
+    def schedule(self, legendary_creature, status_effect):
+        # type: (LegendaryCreature, StatusEffect) -> None
+        status_effect.expiry_turn = self.turn + status_effect.turns
+        self.__number_of_schedules += 1
+        heapq.heappush(self.__expiries, (status_effect.expiry_turn, self.__number_of_schedules, legendary_creature,
+                                         status_effect))
+
+    def advance(self):
+        # type: () -> list
+        """
+        Moving on to the next battle turn and ending the status effects expiring by then.
+        :return: a list of legendary creatures whose status effects ended
+        """
+
+        self.turn += 1
+        changed_legendary_creatures: list = []
+        while len(self.__expiries) > 0 and self.__expiries[0][0] <= self.turn:
+            expiry_turn, sequence_number, legendary_creature, status_effect = heapq.heappop(self.__expiries)
+            if legendary_creature.remove_status_effect(status_effect):
+                changed_legendary_creatures.append(legendary_creature)
+
+        return changed_legendary_creatures
+
+    def get_number_of_scheduled_effects(self):
+        # type: () -> int
+        return len(self.__expiries)
+
+
+class LegendarySpecies(SlottedState):
+    """
+    This class contains attributes of a species of legendary creatures. A species is an immutable template holding
+    the stats of its legendary creatures at level 1 and is used to create new legendary creatures at any level.
+    """
+
+    __slots__: tuple = ("name", "creature_type", "max_hp", "max_magic_points", "attack_power", "defense",
+                        "attack_speed", "__skills")
+
+    # Products of triangular(k) for k = 2 to level, i.e. how much the main stats have grown at each level
+    __stat_growths: list = [1, 1]
+
+    def __init__(self, name, creature_type, max_hp, max_magic_points, attack_power, defense, attack_speed, skills):
+        # type: (str, str, mpf, mpf, mpf, mpf, int, list) -> None
+        self.name: str = name
+        self.creature_type: str = creature_type if creature_type in LegendaryCreature.POSSIBLE_TYPES else \
+            LegendaryCreature.POSSIBLE_TYPES[0]
+        self.max_hp: mpf = max_hp
+        self.max_magic_points: mpf = max_magic_points
+        self.attack_power: mpf = attack_power
+        self.defense: mpf = defense
+        self.attack_speed: int = attack_speed
+        self.__skills: list = skills  # shared skill definitions
+
+    def __str__(self):
+        # type: () -> str
+        return render_text(self)
+
+    def write_text(self, stream):
+        # type: (io.TextIOBase) -> None
+        stream.write("Name: " + str(self.name) + "\n")
+        stream.write("Creature Type: " + str(self.creature_type) + "\n")
+        stream.write("Max HP: " + str(self.max_hp) + "\n")
+        stream.write("Max Magic Points: " + str(self.max_magic_points) + "\n")
+        stream.write("Attack Power: " + str(self.attack_power) + "\n")
+        stream.write("Defense: " + str(self.defense) + "\n")
+        stream.write("Attack Speed: " + str(self.attack_speed) + "\n")
+        stream.write("Below is a list of skills legendary creatures of this species have.\n")
+        for skill_number, skill in enumerate(self.__skills, 1):
+            stream.write("Skill #" + str(skill_number) + "\n")
+            skill.write_text(stream)
+            stream.write("\n")
+
+    @classmethod
+    def get_stat_growth(cls, level):
+        # type: (int) -> int
+        """
+        Getting the factor the max HP, max magic points, attack power and defense of a legendary creature are
+        multiplied by when it levels up from level 1 to the given level.
+        :param level: the level of the legendary creature
+        :return: the product of triangular(k) for k = 2 to level
+        """
+
+        while len(cls.__stat_growths) <= level:
+            cls.__stat_growths.append(cls.__stat_growths[-1] * triangular(len(cls.__stat_growths)))
+        return cls.__stat_growths[level]
+
+    def get_skills(self):
+        # type: () -> list
+        return self.__skills
+
+    def create_legendary_creature(self, level=1):
+        # type: (int) -> LegendaryCreature
+        """
+        Creating a new legendary creature of this species. Its stats are the same as a legendary creature of this
+        species levelled up from level 1 to the given level with LegendaryCreature.level_up(), up to rounding.
+        :param level: the level of the new legendary creature
+        :return: the new legendary creature
+        """
+
+        stat_growth: int = self.get_stat_growth(level)
+        legendary_creature: LegendaryCreature = LegendaryCreature(
+            self.name, self.creature_type, self.max_hp * stat_growth, self.max_magic_points * stat_growth,
+            self.attack_power * stat_growth, self.defense * stat_growth, self.attack_speed + 2 * (level - 1),
+            list(self.__skills))
+        if level > 1:
+            legendary_creature.level = level
+            legendary_creature.required_exp = mpf("1e6") * power_of_ten(level * (level + 1) // 2 - 1)
+        return legendary_creature
+
+    def clone(self):
+        # type: () -> LegendarySpecies
+        return copy.deepcopy(self)
+
+
+class LegendaryCreatureBase(SlottedState):
+    """
+    This class contains attributes of a legendary creature in this game which are shared by legendary creatures and
+    stored legendary creatures. Its slots only hold the attributes which are not columns of a legendary creature
+    store, so that stored legendary creatures do not allocate slots for their level, EXP and stats.
     """
 
-    MAX_CRIT_RATE: mpf = mpf("1")
-    MAX_RESISTANCE: mpf = mpf("1")
-    MAX_ACCURACY: mpf = mpf("1")
-    MIN_ATTACK_GAUGE: mpf = mpf("0")
-    FULL_ATTACK_GAUGE: mpf = mpf("1")
+    __slots__: tuple = ("name", "creature_type", "__skills", "__skill_levels", "__runes", "has_evolved",
+                        "legendary_creature_id", "__stat_listeners", "__status_effects", "status_effect_timer")
+    MAX_CRIT_RATE: int = 1
+    MAX_RESISTANCE: int = 1
+    MAX_ACCURACY: int = 1
+    MIN_ATTACK_GAUGE: int = 0
+    FULL_ATTACK_GAUGE: int = 1
     POSSIBLE_TYPES: list = ["LAND", "WATER"]
 
     def __init__(self, name, creature_type, max_hp, max_magic_points, attack_power, defense, attack_speed, skills):
@@ -1063,7 +3024,8 @@ class LegendaryCreature:
         self.attack_power: mpf = attack_power
         self.defense: mpf = defense
         self.attack_speed: int = attack_speed
-        self.__skills: list = skills
+        self.__skills: list = skills  # shared skill definitions
+        self.__skill_levels: dict = {}  # skill name -> level, only for skills above level 1
         self.__runes: dict = {}  # initial value
         self.crit_rate: mpf = mpf("0.15")
         self.crit_damage: mpf = mpf("1.5")
@@ -1075,43 +3037,164 @@ class LegendaryCreature:
         self.defense_percentage_down: mpf = mpf("0")
         self.attack_gauge: mpf = mpf("0")
         self.has_evolved: bool = False
+        import uuid
+        self.legendary_creature_id: str = str(uuid.uuid1())  # Generating random legendary creature ID
+        self.__stat_listeners: list = []  # inventories indexing this legendary creature
+        self.__status_effects: list = []  # the percentages up and down above are the sums of these effects
+        self.status_effect_timer: StatusEffectTimer or None = None  # timer of the battle this legendary creature is in
 
     def __str__(self):
         # type: () -> str
-        res: str = ""  # initial value
-        res += "Name: " + str(self.name) + "\n"
-        res += "Creature Type: " + str(self.creature_type) + "\n"
-        res += "Level: " + str(self.level) + "\n"
-        res += "EXP: " + str(self.exp) + "\n"
-        res += "EXP needed to have in order to reach next level: " + str(self.required_exp) + "\n"
-        res += "HP: " + str(self.curr_hp) + "/" + str(self.max_hp) + "\n"
-        res += "Magic Points: " + str(self.curr_magic_points) + "/" + str(self.max_magic_points) + "\n"
-        res += "Attack Power: " + str(self.attack_power) + "\n"
-        res += "Defense: " + str(self.defense) + "\n"
-        res += "Attack Speed: " + str(self.attack_speed) + "\n"
-        res += "Below is a list of skills this legendary creature has.\n"
-        skill_number: int = 1
-        for skill in self.__skills:
-            res += "Skill #" + str(skill_number) + "\n"
-            res += str(skill) + "\n"
-
-        res += "Runes equipped to this legendary creature:\n"
+        return render_text(self)
+
+    def write_text(self, stream):
+        # type: (io.TextIOBase) -> None
+        stream.write("Name: " + str(self.name) + "\n")
+        stream.write("Creature Type: " + str(self.creature_type) + "\n")
+        stream.write("Level: " + str(self.level) + "\n")
+        stream.write("EXP: " + str(self.exp) + "\n")
+        stream.write("EXP needed to have in order to reach next level: " + str(self.required_exp) + "\n")
+        stream.write("HP: " + str(self.curr_hp) + "/" + str(self.max_hp) + "\n")
+        stream.write("Magic Points: " + str(self.curr_magic_points) + "/" + str(self.max_magic_points) + "\n")
+        stream.write("Attack Power: " + str(self.attack_power) + "\n")
+        stream.write("Defense: " + str(self.defense) + "\n")
+        stream.write("Attack Speed: " + str(self.attack_speed) + "\n")
+        stream.write("Below is a list of skills this legendary creature has.\n")
+        for skill_number, skill in enumerate(self.__skills, 1):
+            stream.write("Skill #" + str(skill_number) + "\n")
+            skill.write_text(stream, self.get_skill_level(skill))
+            stream.write("\n")
+
+        stream.write("Runes equipped to this legendary creature:\n")
         for i in range(1, 9):
             if i in self.__runes.keys():
-                res += "Slot #" + str(i) + "\n"
-                res += str(self.__runes[i]) + "\n"
-
-        res += "Crit Rate: " + str(self.crit_rate * 100) + "%\n"
-        res += "Crit Damage: " + str(self.crit_damage * 100) + "%\n"
-        res += "Resistance: " + str(self.resistance * 100) + "%\n"
-        res += "Accuracy: " + str(self.accuracy * 100) + "%\n"
-        res += "Attack Power Percentage Up: " + str(self.attack_power_percentage_up * 100) + "%\n"
-        res += "Attack Power Percentage Down: " + str(self.attack_power_percentage_down * 100) + "%\n"
-        res += "Defense Percentage Up: " + str(self.defense_percentage_up * 100) + "%\n"
-        res += "Defense Percentage Down: " + str(self.defense_percentage_down * 100) + "%\n"
-        res += "Attack Gauge: " + str(self.attack_gauge * 100) + "%\n"
-        res += "Has it evolved? " + str(self.has_evolved) + "\n"
-        return res
+                stream.write("Slot #" + str(i) + "\n")
+                self.__runes[i].write_text(stream)
+                stream.write("\n")
+
+        stream.write("Crit Rate: " + str(self.crit_rate * 100) + "%\n")
+        stream.write("Crit Damage: " + str(self.crit_damage * 100) + "%\n")
+        stream.write("Resistance: " + str(self.resistance * 100) + "%\n")
+        stream.write("Accuracy: " + str(self.accuracy * 100) + "%\n")
+        stream.write("Attack Power Percentage Up: " + str(self.attack_power_percentage_up * 100) + "%\n")
+        stream.write("Attack Power Percentage Down: " + str(self.attack_power_percentage_down * 100) + "%\n")
+        stream.write("Defense Percentage Up: " + str(self.defense_percentage_up * 100) + "%\n")
+        stream.write("Defense Percentage Down: " + str(self.defense_percentage_down * 100) + "%\n")
+        for status_effect in self.__status_effects:
+            stream.write("Status Effect: ")
+            status_effect.write_text(stream)
+
+        stream.write("Attack Gauge: " + str(self.attack_gauge * 100) + "%\n")
+        stream.write("Has it evolved? " + str(self.has_evolved) + "\n")
+
+    def get_summary(self):
+        # type: () -> str
+        return str(self.name) + " (" + str(self.creature_type) + ") Level " + str(self.level) + ", HP: " + \
+            str(self.curr_hp) + "/" + str(self.max_hp) + ", Attack Power: " + str(self.attack_power) + \
+            ", Defense: " + str(self.defense) + ", Attack Speed: " + str(self.attack_speed) + \
+            (", evolved" if self.has_evolved else "")
+
+    def __getstate__(self):
+        # type: () -> dict
+        # Inventories register themselves as stat listeners again when they are loaded or copied, and battles are
+        # not saved.
+        state: dict = SlottedState.__getstate__(self)
+        del state["_LegendaryCreatureBase__stat_listeners"]
+        state.pop("status_effect_timer", None)
+        return state
+
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        # Saved game data from before LegendaryCreatureBase existed names private attributes after LegendaryCreature.
+        state = {"_LegendaryCreatureBase__" + name[len("_LegendaryCreature__"):] if
+                 name.startswith("_LegendaryCreature__") else name: value for name, value in state.items()}
+        SlottedState.__setstate__(self, state)
+        self.__stat_listeners = []
+        self.status_effect_timer = None
+        if "_LegendaryCreatureBase__status_effects" not in state:
+            # Saved game data from before status effects existed
+            self.__status_effects = []
+        if "legendary_creature_id" not in state:
+            # Saved game data from before legendary creatures had IDs
+            import uuid
+            self.legendary_creature_id = str(uuid.uuid1())
+
+        if "_LegendaryCreatureBase__skill_levels" not in state:
+            # Saved game data from before skill levels were kept per legendary creature
+            self.__skill_levels = {}
+
+        # Runes placed in saved game data from before rune instances existed carry their own level.
+        self.__runes = {slot_number: RuneInstance.from_legacy_rune(rune) if type(rune) is Rune else rune
+                        for slot_number, rune in self.__runes.items()}
+
+    def add_stat_listener(self, listener):
+        # type: (LegendaryCreatureInventory) -> None
+        self.__stat_listeners.append(listener)
+
+    def remove_stat_listener(self, listener):
+        # type: (LegendaryCreatureInventory) -> None
+        if listener in self.__stat_listeners:
+            self.__stat_listeners.remove(listener)
+
+    def notify_stats_changed(self):
+        # type: () -> None
+        """
+        Letting every inventory indexing this legendary creature know that its level or stats changed.
+        :return: None
+        """
+
+        for listener in self.__stat_listeners:
+            listener.update_legendary_creature(self)
+
+    def get_status_effects(self):
+        # type: () -> list
+        return self.__status_effects
+
+    def add_status_effect(self, status_effect):
+        # type: (StatusEffect) -> bool
+        """
+        Adding a status effect following its stacking rule and scheduling its expiry if this legendary creature is
+        in a battle.
+        :param status_effect: the status effect to be added
+        :return: whether the status effect was added
+        """
+
+        same_effects: list = [other for other in self.__status_effects if other.name == status_effect.name and
+                              other.stat == status_effect.stat]
+        if status_effect.stacking == "REFRESH":
+            for other in same_effects:
+                self.__status_effects.remove(other)
+        elif len(same_effects) >= status_effect.MAX_STACKS:
+            return False
+
+        self.__status_effects.append(status_effect)
+        if self.status_effect_timer is not None:
+            self.status_effect_timer.schedule(self, status_effect)
+
+        self.__update_status_effect_stat(status_effect.stat)
+        return True
+
+    def remove_status_effect(self, status_effect):
+        # type: (StatusEffect) -> bool
+        if not any(other is status_effect for other in self.__status_effects):
+            return False
+
+        self.__status_effects = [other for other in self.__status_effects if other is not status_effect]
+        self.__update_status_effect_stat(status_effect.stat)
+        return True
+
+    def clear_status_effects(self):
+        # type: () -> None
+        self.__status_effects = []
+        self.status_effect_timer = None
+        for stat in StatusEffect.POSSIBLE_STATS:
+            setattr(self, stat, mpf("0"))
+
+    def __update_status_effect_stat(self, stat):
+        # type: (str) -> None
+        # The percentages up and down are only recomputed when status effects change, not for every damage dealt.
+        setattr(self, stat, mpf("0") + sum(status_effect.amount for status_effect in self.__status_effects
+                                           if status_effect.stat == stat))
 
     def evolve(self):
         # type: () -> bool
@@ -1128,6 +3211,7 @@ class LegendaryCreature:
         self.resistance += 0.15
         self.accuracy += 0.15
         self.restore()
+        self.notify_stats_changed()
         return True
 
     def recover_magic_points(self):
@@ -1141,10 +3225,7 @@ class LegendaryCreature:
         self.attack_gauge = self.MIN_ATTACK_GAUGE
         self.curr_hp = self.max_hp
         self.curr_magic_points = self.max_magic_points
-        self.attack_power_percentage_up = mpf("0")
-        self.attack_power_percentage_down = mpf("0")
-        self.defense_percentage_up = mpf("0")
-        self.defense_percentage_down = mpf("0")
+        self.clear_status_effects()
 
     def get_runes(self):
         # type: () -> dict
@@ -1170,6 +3251,7 @@ class LegendaryCreature:
             self.resistance += rune.stat_increase.resistance_up
             self.accuracy += rune.stat_increase.accuracy_up
             self.restore()
+            self.notify_stats_changed()
 
     def remove_rune(self, slot_number):
         # type: (int) -> bool
@@ -1190,14 +3272,16 @@ class LegendaryCreature:
             self.resistance -= current_rune.stat_increase.resistance_up
             self.accuracy -= current_rune.stat_increase.accuracy_up
             self.restore()
+            self.notify_stats_changed()
             return True
         return False
 
     def level_up(self):
         # type: () -> None
-        while self.exp >= self.required_exp:
+        old_level: int = self.level
+        while self.exp >= self.required_exp and self.required_exp != mpf("inf"):
             self.level += 1
-            self.required_exp *= mpf("10") ** self.level
+            self.required_exp *= power_of_ten(self.level)
             self.attack_power *= triangular(self.level)
             self.max_hp *= triangular(self.level)
             self.max_magic_points *= triangular(self.level)
@@ -1205,6 +3289,9 @@ class LegendaryCreature:
             self.attack_speed += 2
             self.restore()
 
+        if self.level != old_level:
+            self.notify_stats_changed()
+
     def normal_attack(self, other):
         # type: (LegendaryCreature) -> None
         action: Action = Action("NORMAL ATTACK")
@@ -1215,8 +3302,8 @@ class LegendaryCreature:
         action: Action = Action("NORMAL HEAL")
         action.execute(self, other)
 
-    def use_skill(self, other, skill):
-        # type: (LegendaryCreature, Skill) -> bool
+    def use_skill(self, other, skill, random_generator=random):
+        # type: (LegendaryCreature, Skill, random.Random) -> bool
         if skill not in self.__skills:
             return False
 
@@ -1224,7 +3311,7 @@ class LegendaryCreature:
             return False
 
         action: Action = Action("USE SKILL")
-        action.execute(self, other, skill)
+        action.execute(self, other, skill, random_generator)
         self.curr_magic_points -= skill.magic_points_cost
         return True
 
@@ -1232,267 +3319,2415 @@ class LegendaryCreature:
         # type: () -> bool
         return self.curr_hp > 0
 
-    def get_skills(self):
-        # type: () -> list
-        return self.__skills
+    def get_skills(self):
+        # type: () -> list
+        return self.__skills
+
+    def get_skill_level(self, skill):
+        # type: (Skill) -> int
+        return self.__skill_levels.get(skill.name, 1)
+
+    def level_up_skill(self, skill):
+        # type: (Skill) -> bool
+        if skill not in self.__skills:
+            return False
+
+        self.__skill_levels[skill.name] = self.get_skill_level(skill) + 1
+        return True
+
+    def clone(self):
+        # type: () -> LegendaryCreature
+        return copy.deepcopy(self)
+
+
+class LegendaryCreature(LegendaryCreatureBase):
+    """
+    This class contains attributes of a legendary creature in this game.
+    """
+
+    __slots__: tuple = ("level", "exp", "required_exp", "curr_hp", "max_hp", "curr_magic_points", "max_magic_points",
+                        "attack_power", "defense", "attack_speed", "crit_rate", "crit_damage", "resistance",
+                        "accuracy", "attack_power_percentage_up", "attack_power_percentage_down",
+                        "defense_percentage_up", "defense_percentage_down", "attack_gauge")
+
+
+class StoreColumn:
+    """
+    This class contains attributes of a stat of stored legendary creatures which is kept in a column of their
+    legendary creature store rather than in the legendary creatures themselves.
+    """
+
+    __slots__: tuple = ("name",)
+
+    def __init__(self):
+        # type: () -> None
+        self.name: str = ""
+
+    def __set_name__(self, owner, name):
+        # type: (type, str) -> None
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        # type: (StoredLegendaryCreature or None, type) -> object
+        if instance is None:
+            return self
+
+        column = self.get_column(instance)
+        value = column[instance.row]
+        return value if column.dtype == object else value.item()
+
+    def __set__(self, instance, value):
+        # type: (StoredLegendaryCreature, object) -> None
+        self.get_column(instance)[instance.row] = value
+
+    def get_column(self, instance):
+        # type: (StoredLegendaryCreature) -> object
+        if instance.store is None:
+            raise ValueError(str(instance.name) + " was removed from its legendary creature store; use the legendary "
+                             "creature returned by remove_legendary_creature() instead")
+        return instance.store.get_column(self.name)
+
+
+class StoredLegendaryCreature(LegendaryCreatureBase):
+    """
+    This class contains attributes of a legendary creature whose level, EXP and stats are kept in a row of a
+    legendary creature store. It behaves like any other legendary creature, and copying or saving it gives a plain
+    legendary creature with the same attributes.
+    """
+
+    __slots__: tuple = ("store", "row")
+
+    level: StoreColumn = StoreColumn()
+    exp: StoreColumn = StoreColumn()
+    required_exp: StoreColumn = StoreColumn()
+    curr_hp: StoreColumn = StoreColumn()
+    max_hp: StoreColumn = StoreColumn()
+    curr_magic_points: StoreColumn = StoreColumn()
+    max_magic_points: StoreColumn = StoreColumn()
+    attack_power: StoreColumn = StoreColumn()
+    defense: StoreColumn = StoreColumn()
+    attack_speed: StoreColumn = StoreColumn()
+    crit_rate: StoreColumn = StoreColumn()
+    crit_damage: StoreColumn = StoreColumn()
+    resistance: StoreColumn = StoreColumn()
+    accuracy: StoreColumn = StoreColumn()
+    attack_power_percentage_up: StoreColumn = StoreColumn()
+    attack_power_percentage_down: StoreColumn = StoreColumn()
+    defense_percentage_up: StoreColumn = StoreColumn()
+    defense_percentage_down: StoreColumn = StoreColumn()
+    attack_gauge: StoreColumn = StoreColumn()
+
+    def __reduce_ex__(self, protocol):
+        # type: (int) -> tuple
+        return LegendaryCreature.__new__, (LegendaryCreature,), self.get_detached_state()
+
+    def get_detached_state(self):
+        # type: () -> dict
+        """
+        Getting the state of a plain legendary creature with the same attributes as this stored legendary creature.
+        :return: the state
+        """
+
+        state: dict = {name: getattr(self, name) for name in LegendaryCreature.get_slot_names()}
+        del state["_LegendaryCreatureBase__stat_listeners"]
+        del state["status_effect_timer"]
+        return state
+
+
+class LegendaryCreatureStore:
+    """
+    This class contains attributes of a store keeping the level, EXP and stats of many legendary creatures in NumPy
+    arrays with one row per legendary creature, so that operations on whole rosters run as single vectorised passes.
+    Stats use float64 columns with the float numeric backend and object columns holding mpf values with mpmath.
+    A store only exists while the game runs: saving the legendary creatures in it saves plain legendary creatures.
+    """
+
+    COLUMNS: list = ["level", "exp", "required_exp", "curr_hp", "max_hp", "curr_magic_points", "max_magic_points",
+                     "attack_power", "defense", "attack_speed", "crit_rate", "crit_damage", "resistance", "accuracy",
+                     "attack_power_percentage_up", "attack_power_percentage_down", "defense_percentage_up",
+                     "defense_percentage_down", "attack_gauge"]
+    GROWING_STATS: list = ["max_hp", "max_magic_points", "attack_power", "defense"]
+    BUFF_COLUMNS: list = ["attack_power_percentage_up", "attack_power_percentage_down", "defense_percentage_up",
+                          "defense_percentage_down"]
+    MIN_CAPACITY: int = 16
+
+    def __init__(self):
+        # type: () -> None
+        try:
+            import numpy
+        except ImportError as error:
+            raise ImportError("LegendaryCreatureStore requires NumPy, which is not installed") from error
+
+        self.__numpy = numpy
+        self.__stat_dtype = numpy.float64 if numeric_backend == "float" else object
+        self.__columns: dict = {column: numpy.empty(self.MIN_CAPACITY, numpy.int64 if column == "level" else
+                                                    self.__stat_dtype) for column in self.COLUMNS}
+        self.__legendary_creatures: list = []  # row -> stored legendary creature
+
+    def __reduce__(self):
+        # type: () -> tuple
+        raise TypeError("legendary creature stores are not saved; save the legendary creatures in them instead")
+
+    def get_column(self, column):
+        # type: (str) -> object
+        return self.__columns[column]
+
+    def get_number_of_legendary_creatures(self):
+        # type: () -> int
+        return len(self.__legendary_creatures)
+
+    def get_legendary_creatures(self):
+        # type: () -> list
+        return self.__legendary_creatures
+
+    def add_legendary_creature(self, legendary_creature):
+        # type: (LegendaryCreature) -> StoredLegendaryCreature
+        """
+        Moving a legendary creature into this store. The legendary creature given is left unchanged and the returned
+        stored legendary creature with the same attributes is to be used in its place.
+        :param legendary_creature: the legendary creature to be stored
+        :return: the stored legendary creature
+        """
+
+        row: int = len(self.__legendary_creatures)
+        if row == len(self.__columns["level"]):
+            for column, values in self.__columns.items():
+                grown = self.__numpy.empty(2 * row, values.dtype)
+                grown[:row] = values
+                self.__columns[column] = grown
+
+        stored_legendary_creature: StoredLegendaryCreature = \
+            StoredLegendaryCreature.__new__(StoredLegendaryCreature)
+        stored_legendary_creature.store = self
+        stored_legendary_creature.row = row
+        state: dict = legendary_creature.__getstate__()
+        for column in self.COLUMNS:
+            setattr(stored_legendary_creature, column, state.pop(column))
+
+        stored_legendary_creature.__setstate__(state)
+        self.__legendary_creatures.append(stored_legendary_creature)
+        return stored_legendary_creature
+
+    def remove_legendary_creature(self, stored_legendary_creature):
+        # type: (StoredLegendaryCreature) -> LegendaryCreature or None
+        """
+        Moving a legendary creature out of this store. The last row takes the place of the removed row. The stored
+        legendary creature no longer has a row afterwards, so reading or setting its level, EXP or stats raises
+        ValueError.
+        :param stored_legendary_creature: the stored legendary creature to be removed
+        :return: a plain legendary creature with the same attributes or None if it is not in this store
+        """
+
+        if stored_legendary_creature.store is not self:
+            return None
+
+        legendary_creature: LegendaryCreature = LegendaryCreature.__new__(LegendaryCreature)
+        legendary_creature.__setstate__(stored_legendary_creature.get_detached_state())
+        row: int = stored_legendary_creature.row
+        last: StoredLegendaryCreature = self.__legendary_creatures.pop()
+        if last is not stored_legendary_creature:
+            for values in self.__columns.values():
+                values[row] = values[last.row]
+
+            last.row = row
+            self.__legendary_creatures[row] = last
+
+        stored_legendary_creature.store = None
+        return legendary_creature
+
+    def __get_rows(self, legendary_creatures):
+        # type: (list or None) -> object
+        if legendary_creatures is None:
+            return slice(0, len(self.__legendary_creatures))
+        return self.__numpy.fromiter((legendary_creature.row for legendary_creature in legendary_creatures
+                                      if legendary_creature.store is self), self.__numpy.intp)
+
+    def __can_level_up(self, rows):
+        # type: (object) -> object
+        required_exp = self.__columns["required_exp"][rows]
+        return (self.__columns["exp"][rows] >= required_exp) & (required_exp != mpf("inf"))
+
+    def restore(self, legendary_creatures=None):
+        # type: (list or None) -> None
+        """
+        Restoring HP and magic points and clearing attack gauges and buffs in one pass.
+        :param legendary_creatures: the stored legendary creatures to be restored, or None for all of them
+        :return: None
+        """
+
+        for legendary_creature in self.__legendary_creatures if legendary_creatures is None else legendary_creatures:
+            if len(legendary_creature.get_status_effects()) > 0 or legendary_creature.status_effect_timer is not None:
+                legendary_creature.clear_status_effects()
+
+        rows = self.__get_rows(legendary_creatures)
+        self.__columns["curr_hp"][rows] = self.__columns["max_hp"][rows]
+        self.__columns["curr_magic_points"][rows] = self.__columns["max_magic_points"][rows]
+        self.__columns["attack_gauge"][rows] = LegendaryCreature.MIN_ATTACK_GAUGE
+        for column in self.BUFF_COLUMNS:
+            self.__columns[column][rows] = mpf("0")
+
+    def grant_exp(self, exp, legendary_creatures=None):
+        # type: (mpf, list or None) -> None
+        """
+        Adding EXP to stored legendary creatures and levelling up the ones with enough EXP, with the same results as
+        LegendaryCreature.level_up(). Each round levels up every legendary creature which still has enough EXP by
+        one level.
+        :param exp: the EXP to add to every legendary creature
+        :param legendary_creatures: the stored legendary creatures to add EXP to, or None for all of them
+        :return: None
+        """
+
+        numpy = self.__numpy
+        rows = numpy.arange(len(self.__legendary_creatures))[self.__get_rows(legendary_creatures)]
+        columns: dict = self.__columns
+        columns["exp"][rows] += exp
+        old_levels = columns["level"][rows].copy()
+        levelling_rows = rows[self.__can_level_up(rows)]
+        with numpy.errstate(over="ignore"):  # overflowing floats become infinity like in LegendaryCreature.level_up()
+            while len(levelling_rows) > 0:
+                columns["level"][levelling_rows] += 1
+                levels = columns["level"][levelling_rows]
+                columns["required_exp"][levelling_rows] *= numpy.array([power_of_ten(int(level)) for level in
+                                                                        levels], self.__stat_dtype)
+                growth = (levels * (levels - 1) // 2).astype(self.__stat_dtype)
+                for column in self.GROWING_STATS:
+                    columns[column][levelling_rows] *= growth
+
+                columns["attack_speed"][levelling_rows] += 2
+                levelling_rows = levelling_rows[self.__can_level_up(levelling_rows)]
+
+        levelled_up_rows = rows[columns["level"][rows] != old_levels]
+        self.restore([self.__legendary_creatures[row] for row in levelled_up_rows])
+        for row in levelled_up_rows:
+            self.__legendary_creatures[row].notify_stats_changed()
+
+    def sort_by(self, column, descending=False, legendary_creatures=None):
+        # type: (str, bool, list or None) -> list
+        """
+        Sorting stored legendary creatures by one of the columns.
+        :param column: the name of the column
+        :param descending: whether the largest values come first
+        :param legendary_creatures: the stored legendary creatures to be sorted, or None for all of them
+        :return: a list of the stored legendary creatures in order
+        """
+
+        rows = self.__numpy.arange(len(self.__legendary_creatures))[self.__get_rows(legendary_creatures)]
+        order = self.__numpy.argsort(self.__columns[column][rows], kind="stable")
+        if descending:
+            order = order[::-1]
+        return [self.__legendary_creatures[row] for row in rows[order]]
+
+
+def restore_legendary_creatures(legendary_creatures):
+    # type: (list) -> None
+    """
+    Restoring legendary creatures, with all stored legendary creatures of the same store restored in one pass.
+    :param legendary_creatures: a list of legendary creatures
+    :return: None
+    """
+
+    stored_legendary_creatures: dict = {}  # store -> stored legendary creatures in it
+    for legendary_creature in legendary_creatures:
+        if isinstance(legendary_creature, StoredLegendaryCreature) and legendary_creature.store is not None:
+            stored_legendary_creatures.setdefault(legendary_creature.store, []).append(legendary_creature)
+        else:
+            legendary_creature.restore()
+
+    for store, legendary_creatures_in_store in stored_legendary_creatures.items():
+        store.restore(legendary_creatures_in_store)
+
+
+def grant_exp_to_legendary_creatures(legendary_creatures, exp):
+    # type: (list, mpf) -> None
+    """
+    Adding EXP to legendary creatures and levelling them up, with all stored legendary creatures of the same store
+    handled in one pass.
+    :param legendary_creatures: a list of legendary creatures
+    :param exp: the EXP to add to every legendary creature
+    :return: None
+    """
+
+    stored_legendary_creatures: dict = {}  # store -> stored legendary creatures in it
+    for legendary_creature in legendary_creatures:
+        if isinstance(legendary_creature, StoredLegendaryCreature) and legendary_creature.store is not None:
+            stored_legendary_creatures.setdefault(legendary_creature.store, []).append(legendary_creature)
+        else:
+            legendary_creature.exp += exp
+            legendary_creature.level_up()
+
+    for store, legendary_creatures_in_store in stored_legendary_creatures.items():
+        store.grant_exp(exp, legendary_creatures_in_store)
+
+
+class Skill(SlottedState):
+    """
+    This class contains attributes of a skill legendary creatures have. A skill is a definition shared by every
+    legendary creature having it and is never changed. The level of a skill is kept by each legendary creature.
+    """
+
+    __slots__: tuple = ("name", "description", "magic_points_cost", "__effective_values")
+
+    def __init__(self, name, description, magic_points_cost):
+        # type: (str, str, mpf) -> None
+        self.name: str = name
+        self.description: str = description
+        self.magic_points_cost: mpf = magic_points_cost
+        self.__effective_values: dict = {}  # level -> values of this skill at that level
+
+    def __str__(self):
+        # type: () -> str
+        return render_text(self)
+
+    def __getstate__(self):
+        # type: () -> dict
+        state: dict = SlottedState.__getstate__(self)
+        del state["_Skill__effective_values"]
+        return state
+
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        level: int = state.get("level", 1)
+        SlottedState.__setstate__(self, state)
+        self.__effective_values = {}
+        if level > 1:
+            # Saved game data from before skill levels were kept per legendary creature stored levelled up values in
+            # the skill shared by all legendary creatures. Those values are brought back to level 1.
+            self.reset_legacy_level(level)
+
+    def write_text(self, stream, level=1):
+        # type: (io.TextIOBase, int) -> None
+        stream.write("Name: " + str(self.name) + "\n")
+        stream.write("Description: " + str(self.description) + "\n")
+        stream.write("Magic Points Cost: " + str(self.magic_points_cost) + "\n")
+        stream.write("Level: " + str(level) + "\n")
+
+    def get_effective_values(self, level):
+        # type: (int) -> object
+        """
+        Getting the values of this skill at a level. They are computed once per level and then shared by all
+        legendary creatures having this skill at that level.
+        :param level: the level of this skill
+        :return: the values of this skill at that level
+        """
+
+        if level not in self.__effective_values:
+            self.__effective_values[level] = self.compute_effective_values(level)
+        return self.__effective_values[level]
+
+    def compute_effective_values(self, level):
+        # type: (int) -> object
+        return None
+
+    def reset_legacy_level(self, level):
+        # type: (int) -> None
+        pass
+
+    def clone(self):
+        # type: () -> Skill
+        return copy.deepcopy(self)
+
+
+class AttackSkill(Skill):
+    """
+    This class contains attributes of a skill to attack an enemy.
+    """
+
+    __slots__: tuple = ("damage_multiplier", "does_ignore_enemies_defense")
+
+    def __init__(self, name, description, magic_points_cost, damage_multiplier, does_ignore_enemies_defense):
+        # type: (str, str, mpf, DamageMultiplier, bool) -> None
+        Skill.__init__(self, name, description, magic_points_cost)
+        self.damage_multiplier: DamageMultiplier = damage_multiplier
+        self.does_ignore_enemies_defense: bool = does_ignore_enemies_defense
+
+    def write_text(self, stream, level=1):
+        # type: (io.TextIOBase, int) -> None
+        Skill.write_text(self, stream, level)
+        stream.write("Damage Multiplier:\n")
+        self.get_damage_multiplier(level).write_text(stream)
+        stream.write("\n")
+        stream.write("Does it ignore enemy's defense: " + str(self.does_ignore_enemies_defense) + "\n")
+
+    def compute_effective_values(self, level):
+        # type: (int) -> DamageMultiplier
+        if level == 1:
+            return self.damage_multiplier
+        return self.damage_multiplier.scale(mpf("1.25") ** (level - 1))
+
+    def reset_legacy_level(self, level):
+        # type: (int) -> None
+        self.damage_multiplier = self.damage_multiplier.scale(1 / mpf("1.25") ** (level - 1))
+
+    def get_damage_multiplier(self, level):
+        # type: (int) -> DamageMultiplier
+        return self.get_effective_values(level)
+
+
+class HealSkill(Skill):
+    """
+    This class contains attributes of a skill to heal self.
+    """
+
+    __slots__: tuple = ("heal_amount",)
+
+    def __init__(self, name, description, magic_points_cost, heal_amount):
+        # type: (str, str, mpf, mpf) -> None
+        Skill.__init__(self, name, description, magic_points_cost)
+        self.heal_amount: mpf = heal_amount
+
+    def write_text(self, stream, level=1):
+        # type: (io.TextIOBase, int) -> None
+        Skill.write_text(self, stream, level)
+        stream.write("Heal Amount: " + str(self.get_heal_amount(level)) + "\n")
+
+    def compute_effective_values(self, level):
+        # type: (int) -> mpf
+        return self.heal_amount * 2 ** (level - 1)
+
+    def reset_legacy_level(self, level):
+        # type: (int) -> None
+        self.heal_amount /= 2 ** (level - 1)
+
+    def get_heal_amount(self, level):
+        # type: (int) -> mpf
+        return self.get_effective_values(level)
+
+
+class StrengthenSkill(Skill):
+    """
+    This class contains attributes of a skill to strengthen self.
+    """
+
+    __slots__: tuple = ("self_attack_percentage_up", "self_defense_percentage_up")
+    EFFECT_TURNS: int = 6  # battle turns the strengthening lasts
+
+    def __init__(self, name, description, magic_points_cost, self_attack_percentage_up, self_defense_percentage_up):
+        # type: (str, str, mpf, mpf, mpf) -> None
+        Skill.__init__(self, name, description, magic_points_cost)
+        self.self_attack_percentage_up: mpf = self_attack_percentage_up
+        self.self_defense_percentage_up: mpf = self_defense_percentage_up
+
+    def write_text(self, stream, level=1):
+        # type: (io.TextIOBase, int) -> None
+        Skill.write_text(self, stream, level)
+        stream.write("Attack Percentage Up to Self: " + str(self.self_attack_percentage_up * 100) + "%\n")
+        stream.write("Defense Percentage Up to Self: " + str(self.self_defense_percentage_up * 100) + "%\n")
+
+
+class WeakeningSkill(Skill):
+    """
+    This class contains attributes of a skill to weaken enemies.
+    """
+
+    __slots__: tuple = ("enemy_attack_percentage_down", "enemy_defense_percentage_down")
+    EFFECT_TURNS: int = 6  # battle turns the weakening lasts
+
+    def __init__(self, name, description, magic_points_cost, enemy_attack_percentage_down,
+                 enemy_defense_percentage_down):
+        # type: (str, str, mpf, mpf, mpf) -> None
+        Skill.__init__(self, name, description, magic_points_cost)
+        self.enemy_attack_percentage_down: mpf = enemy_attack_percentage_down
+        self.enemy_defense_percentage_down: mpf = enemy_defense_percentage_down
+
+    def write_text(self, stream, level=1):
+        # type: (io.TextIOBase, int) -> None
+        Skill.write_text(self, stream, level)
+        stream.write("Attack Percentage Down to Enemy: " + str(self.enemy_attack_percentage_down * 100) + "%\n")
+        stream.write("Defense Percentage Down to Enemy: " + str(self.enemy_defense_percentage_down * 100) + "%\n")
+
+
+class DamageMultiplier(SlottedState):
+    """
+    This class contains attributes of damage multiplier.
+    """
+
+    __slots__: tuple = ("multiplier_to_self_max_hp", "multiplier_to_enemy_max_hp", "multiplier_to_self_attack_power",
+                        "multiplier_to_enemy_attack_power", "multiplier_to_self_defense", "multiplier_to_enemy_defense",
+                        "multiplier_to_self_max_magic_points", "multiplier_to_enemy_max_magic_points",
+                        "multiplier_to_self_attack_speed", "multiplier_to_enemy_attack_speed")
+
+    def __init__(self, multiplier_to_self_max_hp, multiplier_to_enemy_max_hp, multiplier_to_self_attack_power,
+                 multiplier_to_enemy_attack_power, multiplier_to_self_defense, multiplier_to_enemy_defense,
+                 multiplier_to_self_max_magic_points, multiplier_to_enemy_max_magic_points,
+                 multiplier_to_self_attack_speed, multiplier_to_enemy_attack_speed):
+        # type: (float, float, float, float, float, float, float, float, float, float) -> None
+        self.multiplier_to_self_max_hp: float = multiplier_to_self_max_hp
+        self.multiplier_to_enemy_max_hp: float = multiplier_to_enemy_max_hp
+        self.multiplier_to_self_attack_power: float = multiplier_to_self_attack_power
+        self.multiplier_to_enemy_attack_power: float = multiplier_to_enemy_attack_power
+        self.multiplier_to_self_defense: float = multiplier_to_self_defense
+        self.multiplier_to_enemy_defense: float = multiplier_to_enemy_defense
+        self.multiplier_to_self_max_magic_points: float = multiplier_to_self_max_magic_points
+        self.multiplier_to_enemy_max_magic_points: float = multiplier_to_enemy_max_magic_points
+        self.multiplier_to_self_attack_speed: float = multiplier_to_self_attack_speed
+        self.multiplier_to_enemy_attack_speed: float = multiplier_to_enemy_attack_speed
+
+    def __str__(self):
+        # type: () -> str
+        return render_text(self)
+
+    def write_text(self, stream):
+        # type: (io.TextIOBase) -> None
+        stream.write("Damage Multiplier to Self Max HP: " + str(self.multiplier_to_self_max_hp) + "\n")
+        stream.write("Damage Multiplier to Enemy's Max HP: " + str(self.multiplier_to_enemy_max_hp) + "\n")
+        stream.write("Damage Multiplier to Self Attack Power: " + str(self.multiplier_to_self_attack_power) + "\n")
+        stream.write("Damage Multiplier to Enemy's Attack Power: " + str(self.multiplier_to_enemy_attack_power) + "\n")
+        stream.write("Damage Multiplier to Self Defense: " + str(self.multiplier_to_self_defense) + "\n")
+        stream.write("Damage Multiplier to Enemy's Defense: " + str(self.multiplier_to_enemy_defense) + "\n")
+        stream.write("Damage Multiplier to Self Max Magic Points: " + str(self.multiplier_to_self_max_magic_points) +
+                     "\n")
+        stream.write("Damage Multiplier to Enemy's Max Magic Points: " +
+                     str(self.multiplier_to_enemy_max_magic_points) + "\n")
+        stream.write("Damage Multiplier to Self Attack Speed: " + str(self.multiplier_to_self_attack_speed) + "\n")
+        stream.write("Damage Multiplier to Enemy's Attack Speed: " + str(self.multiplier_to_enemy_attack_speed) + "\n")
+
+    def calculate_raw_damage_without_enemy_defense(self, user, target):
+        # type: (LegendaryCreature, LegendaryCreature) -> mpf
+        return user.max_hp * self.multiplier_to_self_max_hp + target.max_hp * self.multiplier_to_enemy_max_hp + \
+               user.attack_power * (1 + user.attack_power_percentage_up / 100 -
+                                    user.attack_power_percentage_down / 100) * \
+               (self.multiplier_to_self_attack_speed * user.attack_speed) \
+               * self.multiplier_to_self_attack_power + target.attack_power * (
+                       1 + target.attack_power_percentage_up / 100
+                       - target.attack_power_percentage_down / 100) * \
+               (self.multiplier_to_enemy_attack_speed * target.attack_speed) * \
+               self.multiplier_to_enemy_attack_power + user.defense * (1 + user.defense_percentage_up / 100 -
+                                        user.defense_percentage_down / 100) * self.multiplier_to_self_defense + \
+               target.defense * (1 + target.defense_percentage_up / 100 - target.defense_percentage_down / 100) * \
+               self.multiplier_to_enemy_defense + user.max_magic_points * \
+               self.multiplier_to_self_max_magic_points + target.max_magic_points * \
+               self.multiplier_to_enemy_max_magic_points
+
+    def calculate_raw_damage(self, user, target):
+        # type: (LegendaryCreature, LegendaryCreature) -> mpf
+        return self.calculate_raw_damage_without_enemy_defense(user, target) - target.defense
+
+    def scale(self, factor):
+        # type: (mpf) -> DamageMultiplier
+        """
+        Getting a copy of this damage multiplier with all multipliers except the ones to attack speeds multiplied by
+        a factor, which is how attack skills grow when levelled up.
+        :param factor: the factor to multiply by
+        :return: the scaled damage multiplier
+        """
+
+        return DamageMultiplier(self.multiplier_to_self_max_hp * factor, self.multiplier_to_enemy_max_hp * factor,
+                                self.multiplier_to_self_attack_power * factor,
+                                self.multiplier_to_enemy_attack_power * factor,
+                                self.multiplier_to_self_defense * factor, self.multiplier_to_enemy_defense * factor,
+                                self.multiplier_to_self_max_magic_points * factor,
+                                self.multiplier_to_enemy_max_magic_points * factor,
+                                self.multiplier_to_self_attack_speed, self.multiplier_to_enemy_attack_speed)
+
+    def clone(self):
+        # type: () -> DamageMultiplier
+        return copy.deepcopy(self)
+
+
+class Reward(SlottedState):
+    """
+    This class contains attributes of the reward for doing something in this game.
+    """
+
+    __slots__: tuple = ("player_coin_gain", "player_exp_gain", "legendary_creature_exp_gain")
+
+    def __init__(self, player_coin_gain, player_exp_gain, legendary_creature_exp_gain):
+        # type: (mpf, mpf, mpf) -> None
+        self.player_coin_gain: mpf = player_coin_gain
+        self.player_exp_gain: mpf = player_exp_gain
+        self.legendary_creature_exp_gain: mpf = legendary_creature_exp_gain
+
+    def __str__(self):
+        # type: () -> str
+        return render_text(self)
+
+    def write_text(self, stream):
+        # type: (io.TextIOBase) -> None
+        stream.write("Player Coin Gain: " + str(self.player_coin_gain) + "\n")
+        stream.write("Player EXP Gain: " + str(self.player_exp_gain) + "\n")
+        stream.write("Legendary Creature EXP Gain: " + str(self.legendary_creature_exp_gain) + "\n")
+
+    def clone(self):
+        # type: () -> Reward
+        return copy.deepcopy(self)
+
+
+class EncounterTable:
+    """
+    This class contains attributes of the wild legendary creatures which can be encountered on a type of tile in a
+    city. Each entry has a weight and a band of levels, and an entry is chosen in constant time with Walker's alias
+    method.
+    """
+
+    def __init__(self, legendary_species, weights, min_levels, max_levels):
+        # type: (list, list, list, list) -> None
+        assert len(legendary_species) == len(weights) == len(min_levels) == len(max_levels) > 0, \
+            "An encounter table needs at least one entry!"
+        self.__legendary_species: list = legendary_species
+        self.__weights: list = weights
+        self.__min_levels: list = min_levels
+        self.__max_levels: list = max_levels
+
+        # Building the alias table: entry i is chosen with probability __probabilities[i] when column i is drawn,
+        # otherwise entry __aliases[i] is chosen.
+        n: int = len(weights)
+        total_weight: float = sum(weights)
+        scaled_weights: list = [weight * n / total_weight for weight in weights]
+        self.__probabilities: list = [1.0] * n
+        self.__aliases: list = list(range(n))
+        small: list = [i for i in range(n) if scaled_weights[i] < 1]
+        large: list = [i for i in range(n) if scaled_weights[i] >= 1]
+        while len(small) > 0 and len(large) > 0:
+            less: int = small.pop()
+            more: int = large.pop()
+            self.__probabilities[less] = scaled_weights[less]
+            self.__aliases[less] = more
+            scaled_weights[more] += scaled_weights[less] - 1
+            if scaled_weights[more] < 1:
+                small.append(more)
+            else:
+                large.append(more)
+
+    def __str__(self):
+        # type: () -> str
+        return render_text(self)
+
+    def write_text(self, stream):
+        # type: (io.TextIOBase) -> None
+        total_weight: float = sum(self.__weights)
+        for i, legendary_species in enumerate(self.__legendary_species):
+            stream.write(str(legendary_species.name) + " (Level " + str(self.__min_levels[i]) + " - " +
+                         str(self.__max_levels[i]) + "): " + str(round(100 * self.__weights[i] / total_weight, 2)) +
+                         "%\n")
+
+    def get_legendary_species(self):
+        # type: () -> list
+        return self.__legendary_species
+
+    def choose_entry(self):
+        # type: () -> int
+        column: int = random.randrange(len(self.__probabilities))
+        return column if random.random() < self.__probabilities[column] else self.__aliases[column]
+
+    def create_legendary_creature(self):
+        # type: () -> LegendaryCreature
+        """
+        Creating a new wild legendary creature of a randomly chosen entry at a random level in the entry's band.
+        :return: the new legendary creature
+        """
+
+        i: int = self.choose_entry()
+        return self.__legendary_species[i].create_legendary_creature(random.randint(self.__min_levels[i],
+                                                                                    self.__max_levels[i]))
+
+    def get_probabilities(self):
+        # type: () -> dict
+        """
+        Getting the chance of each legendary species to be encountered.
+        :return: a dict of names of legendary species to their chances
+        """
+
+        total_weight: float = sum(self.__weights)
+        probabilities: dict = {}
+        for legendary_species, weight in zip(self.__legendary_species, self.__weights):
+            probabilities[legendary_species.name] = probabilities.get(legendary_species.name, 0) + \
+                weight / total_weight
+        return probabilities
+
+    def clone(self):
+        # type: () -> EncounterTable
+        return copy.deepcopy(self)
+
+
+class CatchAnalytics:
+    """
+    This class contains attributes of the odds of catching and encountering wild legendary creatures with a list of
+    balls and fishing rods, worked out in closed form. A ball catches a legendary creature with the chance of its catch
+    success rate plus the share of HP the legendary creature lost (at most 1) and is not used up, so catching costs the
+    coins of one ball and the number of throws until a catch follows a geometric distribution, and so does the number
+    of casts of a fishing rod until an encounter.
+    """
+
+    def __init__(self, balls, fishing_rods=None, hp_share=1.0, confidence=0.9):
+        # type: (list, list or None, float, float) -> None
+        self.__balls: list = balls
+        self.__fishing_rods: list = fishing_rods if fishing_rods is not None else []
+        self.hp_share: float = hp_share  # share of its max HP the legendary creature to be caught has left
+        self.confidence: float = confidence  # chance of success to be reached when counting throws needed
+
+    @classmethod
+    def from_items(cls, items, hp_share=1.0, confidence=0.9):
+        # type: (list, float, float) -> CatchAnalytics
+        """
+        Getting the catch analytics for the balls and fishing rods among a list of items, e.g. items sold in shops.
+        :return: the catch analytics
+        """
+
+        return cls([item for item in items if isinstance(item, Ball)],
+                   [item for item in items if isinstance(item, FishingRod)], hp_share, confidence)
+
+    def __str__(self):
+        # type: () -> str
+        return render_text(self)
+
+    def write_text(self, stream):
+        # type: (io.TextIOBase) -> None
+        stream.write("Catching a legendary creature with " + str(round(self.hp_share * 100, 2)) + "% HP left:\n")
+        for ball, catch_chance, expected_throws, coin_cost, throws_needed in self.get_ball_statistics(
+                self.hp_share, self.confidence):
+            stream.write(str(ball.name) + ": " + str(coin_cost) + " coins, " + str(round(catch_chance * 100, 2)) +
+                         "% per throw, " + str(round(expected_throws, 2)) + " throws expected, " +
+                         str(throws_needed) + " throws for a " + str(round(self.confidence * 100, 2)) +
+                         "% chance\n")
+
+        best_ball: Ball or None = self.get_best_ball(self.hp_share)
+        stream.write("Cheapest ball: " + (str(best_ball.name) if best_ball is not None else "None") + "\n")
+        for fishing_rod, encounter_chance, expected_casts in self.get_fishing_statistics():
+            stream.write(str(fishing_rod.name) + ": " + str(round(encounter_chance * 100, 2)) +
+                         "% encounter chance per cast, " + str(round(expected_casts, 2)) + " casts expected\n")
+
+    @staticmethod
+    def get_hp_share(legendary_creature):
+        # type: (LegendaryCreature) -> float
+        return float(legendary_creature.curr_hp / legendary_creature.max_hp)
+
+    @staticmethod
+    def get_catch_chance(ball, hp_share):
+        # type: (Ball, float) -> float
+        # The same roll as Trainer.catch_legendary_creature()
+        return max(0.0, min(1.0, float(ball.catch_success_rate) + 1 - hp_share))
+
+    @staticmethod
+    def get_expected_attempts(chance):
+        # type: (float) -> float
+        return 1 / chance if chance > 0 else float("inf")
+
+    @staticmethod
+    def get_attempts_needed(chance, confidence):
+        # type: (float, float) -> float
+        """
+        Getting the number of attempts after which at least one attempt succeeded with a given chance.
+        :param chance: the chance of each attempt to succeed
+        :param confidence: the chance of at least one success to be reached
+        :return: the number of attempts, or infinity if it is never reached
+        """
+
+        if chance >= 1 or confidence <= 0:
+            return 1
+        if chance <= 0 or confidence >= 1:
+            return float("inf")
+        return max(1, math.ceil(math.log(1 - confidence) / math.log(1 - chance)))
+
+    def get_ball_statistics(self, hp_share=1.0, confidence=0.9):
+        # type: (float, float) -> list
+        """
+        Getting the odds of catching a legendary creature with each ball.
+        :param hp_share: the share of its max HP the legendary creature has left
+        :param confidence: the chance of a catch to be reached when counting throws needed
+        :return: a list of tuples of the ball, its catch chance, the expected throws until a catch, the coins it costs
+        and the throws needed for the confidence, cheapest first among the balls which can catch the legendary
+        creature
+        """
+
+        statistics: list = []
+        for ball in self.__balls:
+            catch_chance: float = self.get_catch_chance(ball, hp_share)
+            statistics.append((ball, catch_chance, self.get_expected_attempts(catch_chance), ball.coin_cost,
+                               self.get_attempts_needed(catch_chance, confidence)))
+
+        return sorted(statistics, key=lambda statistic: (statistic[1] <= 0, statistic[3], -statistic[1]))
+
+    def get_best_ball(self, hp_share=1.0):
+        # type: (float) -> Ball or None
+        statistics: list = self.get_ball_statistics(hp_share)
+        return statistics[0][0] if len(statistics) > 0 and statistics[0][1] > 0 else None
+
+    def get_fishing_statistics(self, encounter_table=None, legendary_species_name=None):
+        # type: (EncounterTable or None, str or None) -> list
+        """
+        Getting the odds of encountering wild legendary creatures with each fishing rod.
+        :param encounter_table: the encounter table of the water tiles fished at, needed to look for one species
+        :param legendary_species_name: the name of the legendary species looked for, or None for any
+        :return: a list of tuples of the fishing rod, its encounter chance per cast and the expected casts until an
+        encounter
+        """
+
+        species_chance: float = 1.0 if legendary_species_name is None else \
+            encounter_table.get_probabilities().get(legendary_species_name, 0.0)
+        statistics: list = []
+        for fishing_rod in self.__fishing_rods:
+            # The same roll as in main(): random.random() <= encounter_legendary_creature_chance
+            encounter_chance: float = max(0.0, min(1.0, float(fishing_rod.encounter_legendary_creature_chance))) * \
+                species_chance
+            statistics.append((fishing_rod, encounter_chance, self.get_expected_attempts(encounter_chance)))
+
+        return statistics
+
+    def clone(self):
+        # type: () -> CatchAnalytics
+        return copy.deepcopy(self)
+
+
+class ProgressionPlanner:
+    """
+    This class contains attributes of a planner working out how much EXP, how many EXP shards or training center
+    seconds and how many coins levelling up legendary creatures, trainers and runes takes, without levelling anything
+    up. Levelling up to level L multiplies the required EXP and the level up coin cost of a rune by 10 ** L, so the EXP
+    needed to reach level L is 1e6 * 10 ** (L * (L - 1) / 2 - 1). The planner multiplies by the same powers of ten in
+    the same order as levelling up does, so its answers are not off by rounding. Results for each pair of start and
+    target levels are computed once and shared by all callers.
+    """
+
+    __exp_thresholds: list = []  # level -> EXP at the start of that level
+    __exp_needed: dict = {}  # (start level, target level) -> EXP needed from the start of the start level
+    __rune_coin_factors: dict = {}  # (start level, target level) -> coins needed per coin of the current cost
+
+    @classmethod
+    def get_exp_threshold(cls, level):
+        # type: (int) -> mpf
+        """
+        Getting the EXP a legendary creature or trainer has at least once it reached a level.
+        :param level: the level
+        :return: the EXP at the start of that level
+        """
+
+        if len(cls.__exp_thresholds) == 0:
+            cls.__exp_thresholds.extend([mpf("0"), mpf("0"), mpf("1e6")])
+        while len(cls.__exp_thresholds) <= level:
+            cls.__exp_thresholds.append(cls.__exp_thresholds[-1] * power_of_ten(len(cls.__exp_thresholds) - 1))
+        return cls.__exp_thresholds[max(1, level)]
+
+    @classmethod
+    def get_exp_needed(cls, start_level, target_level):
+        # type: (int, int) -> mpf
+        if (start_level, target_level) not in cls.__exp_needed:
+            cls.__exp_needed[(start_level, target_level)] = max(mpf("0"), cls.get_exp_threshold(target_level) -
+                                                                cls.get_exp_threshold(start_level))
+        return cls.__exp_needed[(start_level, target_level)]
+
+    @classmethod
+    def get_exp_needed_by(cls, levelling, target_level):
+        # type: (LegendaryCreature or Trainer, int) -> mpf
+        """
+        Getting the EXP a legendary creature or trainer still needs to reach a level.
+        :param levelling: the legendary creature or trainer, which is not changed
+        :param target_level: the level to reach
+        :return: the EXP needed
+        """
+
+        if target_level <= levelling.level:
+            return mpf("0")
+
+        # Legendary creatures created at a higher level have worked out the EXP required for their next level in
+        # closed form rather than level by level, so it may differ from the threshold by rounding. Their thresholds
+        # are offset by the difference.
+        exp_at_next_level: mpf = cls.get_exp_threshold(levelling.level + 1)
+        exp_at_target_level: mpf = cls.get_exp_threshold(target_level) if levelling.required_exp == exp_at_next_level \
+            else levelling.required_exp + cls.get_exp_needed(levelling.level + 1, target_level)
+        return max(mpf("0"), exp_at_target_level - levelling.exp)
+
+    @staticmethod
+    def get_times_needed(amount, amount_per_time):
+        # type: (mpf, mpf) -> int or mpf
+        """
+        Getting how many times an amount has to be added to reach a total, rounded up.
+        :return: the number of times, or infinity if it cannot be reached
+        """
+
+        if amount <= 0:
+            return 0
+        if amount_per_time <= 0 or amount == mpf("inf"):
+            return mpf("inf")
+
+        times: int = int(amount / amount_per_time)
+        while times * amount_per_time < amount:
+            times += 1
+        return times
+
+    @classmethod
+    def get_exp_shards_needed(cls, levelling, target_level, exp_shards):
+        # type: (LegendaryCreature or Trainer, int, list) -> list
+        """
+        Getting how many EXP shards of each kind a legendary creature needs to reach a level.
+        :param levelling: the legendary creature, which is not changed
+        :param target_level: the level to reach
+        :param exp_shards: a list of EXP shards
+        :return: a list of tuples of each EXP shard, how many of it are needed and what they cost in coins
+        """
+
+        exp_needed: mpf = cls.get_exp_needed_by(levelling, target_level)
+        plan: list = []
+        for exp_shard in exp_shards:
+            number_needed: int or mpf = cls.get_times_needed(exp_needed, exp_shard.exp_granted)
+            plan.append((exp_shard, number_needed, exp_shard.coin_cost * number_needed))
+
+        return plan
+
+    @classmethod
+    def get_training_seconds_needed(cls, levelling, target_level, exp_per_second):
+        # type: (LegendaryCreature, int, mpf) -> int or mpf
+        return cls.get_times_needed(cls.get_exp_needed_by(levelling, target_level), exp_per_second)
+
+    @classmethod
+    def get_rune_coin_factor(cls, start_level, target_level):
+        # type: (int, int) -> mpf
+        """
+        Getting the coins needed to level up a rune from one level to another, per coin it costs to level it up from
+        the start level.
+        :return: the sum of 10 ** (L * (L + 1) / 2 - start level * (start level + 1) / 2) for L from the start level
+        up to the level before the target level
+        """
+
+        if (start_level, target_level) not in cls.__rune_coin_factors:
+            coin_factor: mpf = mpf("0")
+            level_up_coin_factor: mpf = mpf("1")
+            for level in range(start_level, target_level):
+                coin_factor += level_up_coin_factor
+                level_up_coin_factor *= power_of_ten(level + 1)
+            cls.__rune_coin_factors[(start_level, target_level)] = coin_factor
+        return cls.__rune_coin_factors[(start_level, target_level)]
+
+    @classmethod
+    def get_rune_level_up_coins(cls, rune, target_level):
+        # type: (Rune, int) -> mpf
+        """
+        Getting the coins needed to level up a rune to a level.
+        :param rune: a rune, or a rune instance which may have been levelled up already, which is not changed
+        :param target_level: the level to reach
+        :return: the coins needed
+        """
+
+        level: int = getattr(rune, "level", 1)
+        level_up_coin_cost: mpf = getattr(rune, "level_up_coin_cost", rune.coin_cost)
+        return level_up_coin_cost * cls.get_rune_coin_factor(level, target_level) if target_level > level else \
+            mpf("0")
+
+
+class WorldSimulation:
+    """
+    This class contains attributes of the simulation moving roaming game characters around their cities. Each tick
+    moves at most a given number of game characters, taking turns in order, so that a tick can run between player
+    prompts however many game characters roam.
+    """
+
+    MOVES_PER_TICK: int = 1000
+    DIRECTIONS: list = [(0, -1), (0, 1), (-1, 0), (1, 0)]
+
+    def __init__(self, game_characters):
+        # type: (list) -> None
+        self.__game_characters: list = game_characters
+        self.__next_position: int = 0  # position in the list of the game character moved next
+
+    def get_game_characters(self):
+        # type: () -> list
+        return self.__game_characters
+
+    def get_destination(self, game_character):
+        # type: (GameCharacter) -> Location
+        """
+        Getting the location a game character moves to next: one step along a shortest walk to the next location of
+        its patrol route if it has one or else a random neighbouring tile which is not water, or its own location if
+        that tile cannot be entered.
+        :param game_character: the game character to be moved
+        :return: the destination
+        """
+
+        location: Location = game_character.location
+        if len(game_character.patrol_route) > 0:
+            waypoint: Location = game_character.patrol_route[game_character.patrol_position %
+                                                             len(game_character.patrol_route)]
+            if waypoint == location:
+                game_character.patrol_position = (game_character.patrol_position + 1) % \
+                    len(game_character.patrol_route)
+                waypoint = game_character.patrol_route[game_character.patrol_position]
+
+            next_step: Location or None = location.city.get_next_step(location, waypoint) if \
+                waypoint.city is location.city else None
+            if next_step is None:
+                # Waypoints which cannot be reached are skipped.
+                game_character.patrol_position = (game_character.patrol_position + 1) % \
+                    len(game_character.patrol_route)
+                return location
+
+            return next_step
+
+        city: City = location.city
+        dx, dy = self.DIRECTIONS[random.randrange(len(self.DIRECTIONS))]
+        x: int = location.x + dx
+        y: int = location.y + dy
+        if not 0 <= x < city.CITY_WIDTH or not 0 <= y < city.CITY_HEIGHT or \
+                city.is_in_mask(city.get_tile_type_mask(WaterTile), x, y):
+            return location
+
+        return city.get_location(x, y)
+
+    def tick(self, max_moves=MOVES_PER_TICK):
+        # type: (int) -> int
+        """
+        Moving the next game characters in turn. The game characters on each tile are updated once per tick, however
+        many of them leave or arrive.
+        :param max_moves: the most game characters to move
+        :return: the number of game characters moved
+        """
+
+        number_of_moves: int = min(max_moves, len(self.__game_characters))
+        leaving: dict = {}  # tile -> game characters leaving it
+        arriving: dict = {}  # tile -> game characters arriving at it
+        tiles: dict = {}  # id of tile -> tile
+        for i in range(number_of_moves):
+            game_character: GameCharacter = \
+                self.__game_characters[(self.__next_position + i) % len(self.__game_characters)]
+            destination: Location = self.get_destination(game_character)
+            if destination is game_character.location:
+                continue
+
+            old_tile: Tile = game_character.location.get_tile()
+            new_tile: Tile = destination.get_tile()
+            leaving.setdefault(id(old_tile), []).append(game_character)
+            arriving.setdefault(id(new_tile), []).append(game_character)
+            tiles[id(old_tile)] = old_tile
+            tiles[id(new_tile)] = new_tile
+            game_character.location = destination
+
+        for tile_id, tile in tiles.items():
+            tile.update_game_characters(leaving.get(tile_id, []), arriving.get(tile_id, []))
+
+        if len(self.__game_characters) > 0:
+            self.__next_position = (self.__next_position + number_of_moves) % len(self.__game_characters)
+
+        return number_of_moves
+
+
+class AutoWalk:
+    """
+    This class contains attributes of a walk of many steps in adventure mode, e.g. "RIGHT x20" or the route
+    "RIGHT x3, UP x2". A walk stops only at a wild or trainer encounter, at a portal, shop or training center, where
+    the way is blocked or when all steps are taken. Rather than rolling for an encounter on every step, the number of
+    steps until the next encounter is drawn once from the geometric distribution, which gives the same chances.
+    """
+
+    WILD_ENCOUNTER_CHANCE: float = 0.5  # chance of a wild encounter per step onto a grass tile
+    TRAINER_ENCOUNTER_CHANCE: float = 0.5  # chance of a trainer battle per step onto a tile with other trainers
+    DIRECTIONS: dict = {"UP": (0, -1), "DOWN": (0, 1), "LEFT": (-1, 0), "RIGHT": (1, 0)}
+    MAX_STEPS: int = 10000
+
+    def __init__(self, moves):
+        # type: (list) -> None
+        self.__moves: list = moves  # (direction, number of steps) pairs
+        self.steps_taken: int = 0
+        self.stop_reason: str = ""
+        self.wild_encounter: bool = False
+        self.trainer_encounter: bool = False
+
+    @staticmethod
+    def parse(command):
+        # type: (str) -> AutoWalk or None
+        """
+        Reading a walk from a command such as "UP", "RIGHT x20" or "RIGHT x3, UP x2".
+        :param command: the command entered by the player
+        :return: the walk or None if the command is invalid
+        """
+
+        moves: list = []
+        for part in command.split(","):
+            words: list = part.split()
+            if len(words) == 0 or len(words) > 2 or words[0] not in AutoWalk.DIRECTIONS:
+                return None
+
+            number_of_steps: int = 1
+            if len(words) == 2:
+                if not words[1].startswith("x") or not words[1][1:].isdigit():
+                    return None
+                number_of_steps = int(words[1][1:])
+
+            moves.append((words[0], number_of_steps))
+
+        if sum(number_of_steps for direction, number_of_steps in moves) > AutoWalk.MAX_STEPS:
+            return None
+
+        return AutoWalk(moves)
+
+    @staticmethod
+    def sample_steps_until_encounter(chance):
+        # type: (float) -> int
+        """
+        Drawing how many eligible steps it takes until an encounter happening with the given chance per step,
+        counting the step of the encounter itself.
+        :param chance: the chance of an encounter per step
+        :return: the number of steps
+        """
+
+        if chance >= 1:
+            return 1
+        if chance <= 0:
+            return sys.maxsize
+        return 1 + int(math.log(1 - random.random()) / math.log(1 - chance))
+
+    def walk(self, game_character):
+        # type: (GameCharacter) -> str
+        """
+        Walking a game character along this walk. Only the tile the game character stops at is updated.
+        :param game_character: the walking game character
+        :return: the reason the walk stopped
+        """
+
+        location: Location = game_character.location
+        city: City = location.city
+        grass_mask: int = city.get_tile_type_mask(GrassTile)
+        water_mask: int = city.get_tile_type_mask(WaterTile)
+        stop_masks: list = [("PORTAL", city.get_portal_mask()), ("SHOP", city.get_tile_type_mask(ShopTile)),
+                            ("TRAINING CENTER", city.get_tile_type_mask(TrainingCenterTile))]
+        steps_until_wild_encounter: int = self.sample_steps_until_encounter(self.WILD_ENCOUNTER_CHANCE)
+        steps_until_trainer_encounter: int = self.sample_steps_until_encounter(self.TRAINER_ENCOUNTER_CHANCE)
+        self.steps_taken = 0
+        self.stop_reason = "FINISHED"
+        self.wild_encounter = False
+        self.trainer_encounter = False
+        for direction, number_of_steps in self.__moves:
+            dx, dy = self.DIRECTIONS[direction]
+            for i in range(number_of_steps):
+                x: int = location.x + dx
+                y: int = location.y + dy
+                if not 0 <= x < city.CITY_WIDTH or not 0 <= y < city.CITY_HEIGHT or city.is_in_mask(water_mask, x, y):
+                    self.stop_reason = "BLOCKED"
+                    break
+
+                location = city.get_location(x, y)
+                self.steps_taken += 1
+                if city.is_in_mask(grass_mask, x, y):
+                    steps_until_wild_encounter -= 1
+                    self.wild_encounter = steps_until_wild_encounter == 0
+
+                if any(isinstance(other, Trainer) and other is not game_character for other in
+                       location.get_tile().get_game_characters()):
+                    steps_until_trainer_encounter -= 1
+                    self.trainer_encounter = steps_until_trainer_encounter == 0
+
+                if self.wild_encounter or self.trainer_encounter:
+                    self.stop_reason = "ENCOUNTER"
+                    break
+
+                stop_reasons: list = [reason for reason, mask in stop_masks if city.is_in_mask(mask, x, y)]
+                if len(stop_reasons) > 0:
+                    self.stop_reason = stop_reasons[0]
+                    break
+
+            if self.stop_reason != "FINISHED":
+                break
+
+        if location is not game_character.location:
+            game_character.move_to(location)
+
+        return self.stop_reason
+
+
+class Game:
+    """
+    This class contains attributes of the saved game data.
+    """
+
+    def __init__(self, player, opponent_trainers, cities, potential_legendary_creatures, encounter_table_data=None):
+        # type: (Player, list, list, list, dict or None) -> None
+        self.player: Player = player
+        self.__opponent_trainers: list = opponent_trainers
+        self.__cities: list = cities
+        self.__potential_legendary_creatures: list = potential_legendary_creatures  # legendary species
+        self.__potential_legendary_creatures_by_type: dict = self.__group_by_type(potential_legendary_creatures)
+        # (city name, tile name) -> list of (legendary species name, weight, min level, max level)
+        self.__encounter_table_data: dict = {} if encounter_table_data is None else encounter_table_data
+        self.__encounter_tables: dict or None = None  # built from the encounter table data when first needed
+        self.__world_simulation: WorldSimulation = WorldSimulation(opponent_trainers)
+
+    def __getstate__(self):
+        # type: () -> dict
+        state: dict = self.__dict__.copy()
+        del state["_Game__potential_legendary_creatures_by_type"]
+        state.pop("_Game__encounter_tables", None)
+        return state
+
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        self.__dict__.update(state)
+        if any(isinstance(legendary_species, LegendaryCreature) for legendary_species in
+               self.__potential_legendary_creatures):
+            # Saved game data from before legendary species existed used legendary creatures as templates, which
+            # might have been caught and levelled up since. The legendary species of the game world are used instead.
+            self.__potential_legendary_creatures = get_world_catalogue().get_potential_legendary_creatures()
+
+        self.__potential_legendary_creatures_by_type = self.__group_by_type(self.__potential_legendary_creatures)
+        if "_Game__encounter_table_data" not in state:
+            # Saved game data from before encounter tables were saved with the game
+            self.__encounter_table_data = get_world_catalogue().get_encounter_table_data()
+
+        self.__encounter_tables = None
+        if "_Game__world_simulation" not in state:
+            self.__world_simulation = WorldSimulation(self.__opponent_trainers)
+
+    @staticmethod
+    def __group_by_type(potential_legendary_creatures):
+        # type: (list) -> dict
+        potential_legendary_creatures_by_type: dict = {}
+        for legendary_species in potential_legendary_creatures:
+            potential_legendary_creatures_by_type.setdefault(legendary_species.creature_type, []).append(
+                legendary_species)
+        return potential_legendary_creatures_by_type
+
+    def __str__(self):
+        # type: () -> str
+        return render_text(self)
+
+    def write_text(self, stream):
+        # type: (io.TextIOBase) -> None
+        stream.write("Player in the game:\n")
+        self.player.write_text(stream)
+        stream.write("\nBelow is a list of opponent trainers in the game:\n")
+        for opponent_trainer in self.__opponent_trainers:
+            opponent_trainer.write_text(stream)
+            stream.write("\n")
+
+        stream.write("Maps of cities in the game:\n")
+        for city in self.__cities:
+            city.write_text(stream)
+            stream.write("\n")
+
+        stream.write("Below is a list of potential legendary creatures in this game:\n")
+        for legendary_creature in self.__potential_legendary_creatures:
+            legendary_creature.write_text(stream)
+            stream.write("\n")
+
+    def get_opponent_trainers(self):
+        # type: () -> list
+        return self.__opponent_trainers
+
+    def get_cities(self):
+        # type: () -> list
+        return self.__cities
+
+    def get_potential_legendary_creatures(self):
+        # type: () -> list
+        return self.__potential_legendary_creatures
+
+    def get_world_simulation(self):
+        # type: () -> WorldSimulation
+        return self.__world_simulation
+
+    def create_wild_legendary_creature(self, creature_type=None, level=1):
+        # type: (str or None, int) -> LegendaryCreature or None
+        """
+        Creating a new wild legendary creature of a random legendary species.
+        :param creature_type: only choose from legendary species of this type if given
+        :param level: the level of the wild legendary creature
+        :return: the new legendary creature or None if no legendary species can be chosen
+        """
+
+        candidates: list = self.__potential_legendary_creatures if creature_type is None else \
+            self.__potential_legendary_creatures_by_type.get(creature_type, [])
+        if len(candidates) == 0:
+            return None
+        return candidates[random.randrange(len(candidates))].create_legendary_creature(level)
+
+    def get_encounter_table(self, city, tile_name):
+        # type: (City, str) -> EncounterTable or None
+        if self.__encounter_tables is None:
+            self.__encounter_tables = build_encounter_tables(self.__encounter_table_data, self.__cities,
+                                                             self.__potential_legendary_creatures)
+
+        return self.__encounter_tables.get((city.name, tile_name))
+
+    def create_encountered_legendary_creature(self, city, tile_name):
+        # type: (City, str) -> LegendaryCreature or None
+        """
+        Creating a new wild legendary creature encountered on a type of tile in a city.
+        :param city: the city where the wild legendary creature is encountered
+        :param tile_name: "GRASS" for encounters on grass tiles or "WATER" for encounters when fishing
+        :return: the new legendary creature or None if nothing can be encountered there
+        """
+
+        encounter_table: EncounterTable or None = self.get_encounter_table(city, tile_name)
+        return None if encounter_table is None else encounter_table.create_legendary_creature()
+
+    def clone(self):
+        # type: () -> Game
+        return copy.deepcopy(self)
+
+
+class WorldCatalogue:
+    """
+    This class contains attributes of a pre-built game world used to start new games.
+    """
+
+    def __init__(self, items_sold_in_shop, cities, skills, potential_legendary_creatures, opponent_trainers,
+                 player_start_location, starter_legendary_species, encounter_table_data):
+        # type: (list, list, list, list, list, Location, LegendarySpecies, dict) -> None
+        self.__items_sold_in_shop: list = items_sold_in_shop
+        self.__cities: list = cities
+        self.__skills: list = skills
+        self.__potential_legendary_creatures: list = potential_legendary_creatures  # legendary species
+        self.__opponent_trainers: list = opponent_trainers
+        self.player_start_location: Location = player_start_location
+        self.starter_legendary_species: LegendarySpecies = starter_legendary_species
+        # (city name, tile name) -> list of (legendary species name, weight, min level, max level)
+        self.__encounter_table_data: dict = encounter_table_data
+
+    def get_items_sold_in_shop(self):
+        # type: () -> list
+        return self.__items_sold_in_shop
+
+    def get_cities(self):
+        # type: () -> list
+        return self.__cities
+
+    def get_skills(self):
+        # type: () -> list
+        return self.__skills
+
+    def get_potential_legendary_creatures(self):
+        # type: () -> list
+        return self.__potential_legendary_creatures
+
+    def get_opponent_trainers(self):
+        # type: () -> list
+        return self.__opponent_trainers
+
+    def get_encounter_table_data(self):
+        # type: () -> dict
+        return self.__encounter_table_data
+
+    def clone(self):
+        # type: () -> WorldCatalogue
+        return copy.deepcopy(self)
+
+
+# Creating functions used to build the game world
+
+
+# Content files the game world is built from. Content packs found in CONTENT_PACK_DIRECTORY_NAME are applied in file
+# name order on top of the default content file, and an entry replaces any earlier entry with the same name.
+DEFAULT_CONTENT_FILE_NAME: str = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                              "legendary_creature_hunter_at_mithoter_planet_content.json")
+CONTENT_PACK_DIRECTORY_NAME: str = "LEGENDARY CREATURE HUNTER AT MITHOTER PLANET CONTENT PACKS"
+
+# Compiled world catalogues are cached in this directory under the hash of the content they were compiled from and
+# of the code which compiled them.
+CATALOGUE_CACHE_DIRECTORY_NAME: str = "LEGENDARY CREATURE HUNTER AT MITHOTER PLANET CATALOGUE CACHE"
+
+# Hash of the code of the game, computed once per process by get_code_hash()
+code_hash: str or None = None
+
+CONTENT_SECTIONS: list = ["items", "cities", "portals", "skills", "legendary_creatures", "opponent_trainers",
+                          "encounters"]
+ITEM_TYPE_FIELDS: dict = {
+    "RUNE": {"rating": "integer", "slot_number": "integer"},
+    "EXP SHARD": {"exp_granted": "number"},
+    "LEVEL UP SHARD": {},
+    "SKILL LEVEL UP SHARD": {},
+    "EVOLUTION CANDY": {},
+    "FISHING ROD": {"encounter_legendary_creature_chance": "number"},
+    "BALL": {"catch_success_rate": "number"}
+}
+SKILL_TYPE_FIELDS: dict = {
+    "ATTACK": {"damage_multiplier": "object", "does_ignore_enemies_defense": "boolean"},
+    "HEAL": {"heal_amount": "number"},
+    "WEAKENING": {"enemy_attack_percentage_down": "number", "enemy_defense_percentage_down": "number"},
+    "STRENGTHENING": {"self_attack_percentage_up": "number", "self_defense_percentage_up": "number"}
+}
+LEGENDARY_CREATURE_FIELDS: dict = {"name": "string", "creature_type": "string", "max_hp": "number",
+                                   "max_magic_points": "number", "attack_power": "number", "defense": "number",
+                                   "attack_speed": "number", "skills": "list"}
+DAMAGE_MULTIPLIER_FIELDS: list = ["multiplier_to_self_max_hp", "multiplier_to_enemy_max_hp",
+                                  "multiplier_to_self_attack_power", "multiplier_to_enemy_attack_power",
+                                  "multiplier_to_self_defense", "multiplier_to_enemy_defense",
+                                  "multiplier_to_self_max_magic_points", "multiplier_to_enemy_max_magic_points",
+                                  "multiplier_to_self_attack_speed", "multiplier_to_enemy_attack_speed"]
+TILE_NAMES: list = ["WATER", "SAND", "GRASS", "SHOP", "TRAINING CENTER"]
+
+# Wild legendary creatures are encountered on grass tiles and when fishing next to water tiles. Cities without an
+# encounter table for one of these in the content get one where every legendary species of the given types is equally
+# likely at level 1.
+ENCOUNTER_TILE_NAMES: list = ["GRASS", "WATER"]
+DEFAULT_ENCOUNTER_CREATURE_TYPES: dict = {"GRASS": ["LAND", "WATER"], "WATER": ["WATER"]}
+ENCOUNTER_ENTRY_FIELDS: dict = {"legendary_creature": "string", "weight": "number", "min_level": "integer",
+                                "max_level": "integer"}
+
+# Compiled world catalogue shared by all new games created in this process. It is either a memory-mapped catalogue
+# cache file or the pickled bytes of the catalogue when the cache directory cannot be written.
+world_catalogue_data: bytes or None = None
+
+
+def get_content_file_names():
+    # type: () -> list
+    """
+    Getting the names of all content files the game world is built from, in the order they are applied.
+    :return: a list of file names
+    """
+
+    content_file_names: list = [DEFAULT_CONTENT_FILE_NAME]
+    if os.path.isdir(CONTENT_PACK_DIRECTORY_NAME):
+        for file_name in sorted(os.listdir(CONTENT_PACK_DIRECTORY_NAME)):
+            if file_name.endswith(".json") or file_name.endswith(".toml"):
+                content_file_names.append(os.path.join(CONTENT_PACK_DIRECTORY_NAME, file_name))
+
+    return content_file_names
+
+
+def parse_content(file_name, data):
+    # type: (str, bytes) -> dict
+    """
+    Parsing the content of a JSON or TOML content file.
+    :param file_name: the name of the content file
+    :param data: the raw content of the file
+    :return: the parsed content
+    """
+
+    if file_name.endswith(".toml"):
+        try:
+            import tomllib
+        except ImportError:
+            raise ValueError(file_name + ": TOML content files need Python 3.11 or later")
+
+        return tomllib.loads(data.decode("utf-8"))
+
+    import json
+    content = json.loads(data.decode("utf-8"))
+    if not isinstance(content, dict):
+        raise ValueError(file_name + ": content must be an object")
+
+    return content
+
+
+def merge_content(contents):
+    # type: (list) -> dict
+    """
+    Merging several content files into one. Later entries replace earlier entries with the same name, portals are
+    identified by the location they start from, encounter tables by their city and tile and the player section is
+    replaced as a whole.
+    :param contents: a list of parsed content files in the order they are applied
+    :return: the merged content
+    """
+
+    merged: dict = {section: {} for section in CONTENT_SECTIONS}
+    merged_player: dict or None = None
+    for content in contents:
+        for section in CONTENT_SECTIONS:
+            for entry in content.get(section, []):
+                if section == "portals":
+                    key = str(entry.get("from")) if isinstance(entry, dict) else str(entry)
+                elif section == "encounters":
+                    key = str((entry.get("city"), entry.get("tile"))) if isinstance(entry, dict) else str(entry)
+                else:
+                    key = str(entry.get("name")) if isinstance(entry, dict) else str(entry)
+
+                merged[section].pop(key, None)
+                merged[section][key] = entry
+
+        if "player" in content:
+            merged_player = content["player"]
+
+    res: dict = {section: list(merged[section].values()) for section in CONTENT_SECTIONS}
+    res["player"] = merged_player
+    return res
+
+
+def validate_content(content):
+    # type: (dict) -> None
+    """
+    Checking that merged content describes a complete and consistent game world.
+    :param content: the merged content
+    :return: None
+    :raises ValueError: if the content is invalid
+    """
+
+    errors: list = []  # initial value
+    city_sizes: dict = {}  # initial value
+    city_tiles: dict = {}  # city name -> rows of tile names
+
+    def check_field(entry, field, field_type, where):
+        # type: (dict, str, str, str) -> bool
+        if field not in entry:
+            errors.append(where + ": missing '" + field + "'")
+            return False
+
+        value = entry[field]
+        if field_type == "string":
+            valid: bool = isinstance(value, str)
+        elif field_type == "integer":
+            valid = isinstance(value, int) and not isinstance(value, bool)
+        elif field_type == "number":
+            valid = not isinstance(value, bool) and isinstance(value, (int, float, str)) and is_number(str(value))
+        elif field_type == "boolean":
+            valid = isinstance(value, bool)
+        elif field_type == "object":
+            valid = isinstance(value, dict)
+        else:
+            valid = isinstance(value, list)
+
+        if not valid:
+            errors.append(where + ": '" + field + "' must be a " + field_type)
+
+        return valid
+
+    def check_location(entry, field, where):
+        # type: (dict, str, str) -> None
+        if not check_field(entry, field, "object", where):
+            return
+
+        location: dict = entry[field]
+        if check_field(location, "city", "string", where + "." + field) and \
+                check_field(location, "x", "integer", where + "." + field) and \
+                check_field(location, "y", "integer", where + "." + field):
+            if location["city"] not in city_sizes:
+                errors.append(where + "." + field + ": unknown city '" + location["city"] + "'")
+            else:
+                city_height, city_width = city_sizes[location["city"]]
+                if not (0 <= location["x"] < city_width and 0 <= location["y"] < city_height):
+                    errors.append(where + "." + field + ": location is outside the city")
+
+    for section in CONTENT_SECTIONS:
+        if not isinstance(content.get(section), list) or not all(isinstance(entry, dict) for entry in
+                                                                 content[section]):
+            errors.append("'" + section + "' must be a list of objects")
+            content[section] = []
+
+    for i, item_data in enumerate(content["items"]):
+        where: str = "items[" + str(i) + "]"
+        check_field(item_data, "name", "string", where)
+        check_field(item_data, "description", "string", where)
+        check_field(item_data, "coin_cost", "number", where)
+        if item_data.get("type") not in ITEM_TYPE_FIELDS:
+            errors.append(where + ": unknown item type " + repr(item_data.get("type")))
+            continue
+
+        for field, field_type in ITEM_TYPE_FIELDS[item_data["type"]].items():
+            check_field(item_data, field, field_type, where)
+
+    for i, city_data in enumerate(content["cities"]):
+        where: str = "cities[" + str(i) + "]"
+        if not check_field(city_data, "name", "string", where) or not check_field(city_data, "tiles", "list", where):
+            continue
+
+        tiles: list = city_data["tiles"]
+        if len(tiles) == 0 or not all(isinstance(row, list) and len(row) == len(tiles[0]) > 0 for row in tiles):
+            errors.append(where + ": 'tiles' must be a non-empty rectangular grid")
+            continue
+
+        for row in tiles:
+            for tile_name in row:
+                if tile_name not in TILE_NAMES:
+                    errors.append(where + ": unknown tile " + repr(tile_name))
+
+        if any("TRAINING CENTER" in row for row in tiles):
+            check_field(city_data, "training_center_exp_per_second", "number", where)
+
+        city_sizes[city_data["name"]] = (len(tiles), len(tiles[0]))
+        city_tiles[city_data["name"]] = tiles
+
+    for i, portal_data in enumerate(content["portals"]):
+        check_location(portal_data, "from", "portals[" + str(i) + "]")
+        check_location(portal_data, "to", "portals[" + str(i) + "]")
+
+    skill_names: set = set()  # initial value
+    for i, skill_data in enumerate(content["skills"]):
+        where: str = "skills[" + str(i) + "]"
+        if check_field(skill_data, "name", "string", where):
+            skill_names.add(skill_data["name"])
+
+        check_field(skill_data, "description", "string", where)
+        check_field(skill_data, "magic_points_cost", "number", where)
+        if skill_data.get("type") not in SKILL_TYPE_FIELDS:
+            errors.append(where + ": unknown skill type " + repr(skill_data.get("type")))
+            continue
+
+        for field, field_type in SKILL_TYPE_FIELDS[skill_data["type"]].items():
+            check_field(skill_data, field, field_type, where)
+
+        if isinstance(skill_data.get("damage_multiplier"), dict):
+            for field, value in skill_data["damage_multiplier"].items():
+                if field not in DAMAGE_MULTIPLIER_FIELDS:
+                    errors.append(where + ".damage_multiplier: unknown field '" + field + "'")
+                else:
+                    check_field(skill_data["damage_multiplier"], field, "number", where + ".damage_multiplier")
+
+    legendary_creature_names: set = set()  # initial value
+    for i, legendary_creature_data in enumerate(content["legendary_creatures"]):
+        where: str = "legendary_creatures[" + str(i) + "]"
+        for field, field_type in LEGENDARY_CREATURE_FIELDS.items():
+            check_field(legendary_creature_data, field, field_type, where)
+
+        if isinstance(legendary_creature_data.get("name"), str):
+            legendary_creature_names.add(legendary_creature_data["name"])
+
+        if legendary_creature_data.get("creature_type") not in LegendaryCreature.POSSIBLE_TYPES:
+            errors.append(where + ": unknown creature type " + repr(legendary_creature_data.get("creature_type")))
+
+        for skill_name in legendary_creature_data.get("skills", []) if \
+                isinstance(legendary_creature_data.get("skills"), list) else []:
+            if skill_name not in skill_names:
+                errors.append(where + ": unknown skill " + repr(skill_name))
+
+    for i, trainer_data in enumerate(content["opponent_trainers"]):
+        where: str = "opponent_trainers[" + str(i) + "]"
+        check_field(trainer_data, "name", "string", where)
+        check_location(trainer_data, "location", where)
+        if "patrol_route" in trainer_data and check_field(trainer_data, "patrol_route", "list", where):
+            # Trainers walk between the locations of their patrol routes, so all of them must be reachable from the
+            # trainer's location without crossing water.
+            walking_distances: list or None = None  # initial value
+            start: dict = trainer_data["location"] if isinstance(trainer_data.get("location"), dict) else {}
+            if start.get("city") in city_tiles and isinstance(start.get("x"), int) and \
+                    isinstance(start.get("y"), int):
+                tiles: list = city_tiles[start["city"]]
+                city_height, city_width = city_sizes[start["city"]]
+                if 0 <= start["x"] < city_width and 0 <= start["y"] < city_height:
+                    walking_distances = City.get_walking_distances(lambda x, y: tiles[y][x] != "WATER", city_width,
+                                                                   city_height, start["x"], start["y"])
+
+            for j, location_data in enumerate(trainer_data["patrol_route"]):
+                field: str = "patrol_route[" + str(j) + "]"
+                errors_before: int = len(errors)
+                check_location({field: location_data}, field, where)
+                if isinstance(location_data, dict) and isinstance(trainer_data.get("location"), dict) and \
+                        location_data.get("city") != trainer_data["location"].get("city"):
+                    errors.append(where + "." + field + ": must be in the trainer's city")
+                elif len(errors) == errors_before and walking_distances is not None and \
+                        walking_distances[location_data["y"]][location_data["x"]] is None:
+                    errors.append(where + "." + field + ": cannot be reached from the trainer's location without "
+                                                        "crossing water")
+        if check_field(trainer_data, "team", "list", where):
+            if len(trainer_data["team"]) > Team.MAX_LEGENDARY_CREATURES:
+                errors.append(where + ": a team has at most " + str(Team.MAX_LEGENDARY_CREATURES) +
+                              " legendary creatures")
+
+            for legendary_creature_name in trainer_data["team"]:
+                if legendary_creature_name not in legendary_creature_names:
+                    errors.append(where + ": unknown legendary creature " + repr(legendary_creature_name))
+
+    for i, encounter_data in enumerate(content["encounters"]):
+        where: str = "encounters[" + str(i) + "]"
+        if check_field(encounter_data, "city", "string", where) and encounter_data["city"] not in city_sizes:
+            errors.append(where + ": unknown city '" + encounter_data["city"] + "'")
+
+        if encounter_data.get("tile") not in ENCOUNTER_TILE_NAMES:
+            errors.append(where + ": unknown encounter tile " + repr(encounter_data.get("tile")))
+
+        if not check_field(encounter_data, "entries", "list", where):
+            continue
+
+        if len(encounter_data["entries"]) == 0:
+            errors.append(where + ": 'entries' must not be empty")
+
+        for j, entry_data in enumerate(encounter_data["entries"]):
+            entry_where: str = where + ".entries[" + str(j) + "]"
+            if not isinstance(entry_data, dict):
+                errors.append(entry_where + ": must be an object")
+                continue
+
+            for field, field_type in ENCOUNTER_ENTRY_FIELDS.items():
+                check_field(entry_data, field, field_type, entry_where)
+
+            if entry_data.get("legendary_creature") not in legendary_creature_names:
+                errors.append(entry_where + ": unknown legendary creature " +
+                              repr(entry_data.get("legendary_creature")))
+
+            if is_number(str(entry_data.get("weight"))) and not float(entry_data["weight"]) > 0:
+                errors.append(entry_where + ": 'weight' must be positive")
+
+            if isinstance(entry_data.get("min_level"), int) and isinstance(entry_data.get("max_level"), int) and \
+                    not 1 <= entry_data["min_level"] <= entry_data["max_level"]:
+                errors.append(entry_where + ": levels must satisfy 1 <= 'min_level' <= 'max_level'")
+
+    if not isinstance(content.get("player"), dict):
+        errors.append("'player' must be an object")
+    else:
+        check_location(content["player"], "location", "player")
+        if content["player"].get("starter_legendary_creature") not in legendary_creature_names:
+            errors.append("player: unknown starter legendary creature " +
+                          repr(content["player"].get("starter_legendary_creature")))
+
+    if len(errors) > 0:
+        raise ValueError("Invalid game content:\n" + "\n".join(errors))
+
+
+def create_item(item_data):
+    # type: (dict) -> Item
+    name: str = item_data["name"]
+    description: str = item_data["description"]
+    coin_cost: mpf = mpf(str(item_data["coin_cost"]))
+    if item_data["type"] == "RUNE":
+        return Rune(name, description, coin_cost, item_data["rating"], item_data["slot_number"])
+    elif item_data["type"] == "EXP SHARD":
+        return EXPShard(name, description, coin_cost, mpf(str(item_data["exp_granted"])))
+    elif item_data["type"] == "LEVEL UP SHARD":
+        return LevelUpShard(name, description, coin_cost)
+    elif item_data["type"] == "SKILL LEVEL UP SHARD":
+        return SkillLevelUpShard(name, description, coin_cost)
+    elif item_data["type"] == "EVOLUTION CANDY":
+        return EvolutionCandy(name, description, coin_cost)
+    elif item_data["type"] == "FISHING ROD":
+        return FishingRod(name, description, coin_cost, float(item_data["encounter_legendary_creature_chance"]))
+    else:
+        return Ball(name, description, coin_cost, float(item_data["catch_success_rate"]))
+
+
+def create_tile(tile_name, city_data, items_sold_in_shop):
+    # type: (str, dict, list) -> Tile
+    if tile_name == "WATER":
+        return WaterTile()
+    elif tile_name == "SAND":
+        return SandTile()
+    elif tile_name == "GRASS":
+        return GrassTile()
+    elif tile_name == "SHOP":
+        return ShopTile(items_sold_in_shop)
+    else:
+        return TrainingCenterTile(mpf(str(city_data["training_center_exp_per_second"])))
+
+
+def create_skill(skill_data):
+    # type: (dict) -> Skill
+    name: str = skill_data["name"]
+    description: str = skill_data["description"]
+    magic_points_cost: mpf = mpf(str(skill_data["magic_points_cost"]))
+    if skill_data["type"] == "ATTACK":
+        damage_multiplier: DamageMultiplier = DamageMultiplier(
+            *[mpf(str(skill_data["damage_multiplier"].get(field, "0"))) for field in DAMAGE_MULTIPLIER_FIELDS])
+        return AttackSkill(name, description, magic_points_cost, damage_multiplier,
+                           skill_data["does_ignore_enemies_defense"])
+    elif skill_data["type"] == "HEAL":
+        return HealSkill(name, description, magic_points_cost, mpf(str(skill_data["heal_amount"])))
+    elif skill_data["type"] == "WEAKENING":
+        return WeakeningSkill(name, description, magic_points_cost, mpf(str(skill_data["enemy_attack_percentage_down"])),
+                              mpf(str(skill_data["enemy_defense_percentage_down"])))
+    else:
+        return StrengthenSkill(name, description, magic_points_cost, mpf(str(skill_data["self_attack_percentage_up"])),
+                               mpf(str(skill_data["self_defense_percentage_up"])))
+
+
+def compile_world_catalogue(content):
+    # type: (dict) -> WorldCatalogue
+    """
+    Building all shop items, cities, portals, skills, legendary creatures and opponent trainers of the game world
+    from validated content.
+    :param content: the merged and validated content
+    :return: a newly built world catalogue
+    """
+
+    items_sold_in_shop: list = [create_item(item_data) for item_data in content["items"]]
+    cities: list = [City(city_data["name"], len(city_data["tiles"]), len(city_data["tiles"][0]),
+                         [[create_tile(tile_name, city_data, items_sold_in_shop) for tile_name in row]
+                          for row in city_data["tiles"]]) for city_data in content["cities"]]
+    cities_by_name: dict = {city.name: city for city in cities}
+
+    def create_location(location_data):
+        # type: (dict) -> Location
+        return Location(cities_by_name[location_data["city"]], location_data["x"], location_data["y"])
+
+    # Adding portals to the cities
+    for portal_data in content["portals"]:
+        portal: Portal = Portal(create_location(portal_data["from"]), create_location(portal_data["to"]))
+        portal.get_tile_from().portal = portal
+        portal.location_from.city.tiles_changed()
+
+    skills_by_name: dict = {skill_data["name"]: create_skill(skill_data) for skill_data in content["skills"]}
+    potential_legendary_creatures: list = [
+        LegendarySpecies(legendary_creature_data["name"], legendary_creature_data["creature_type"],
+                         mpf(str(legendary_creature_data["max_hp"])),
+                         mpf(str(legendary_creature_data["max_magic_points"])),
+                         mpf(str(legendary_creature_data["attack_power"])),
+                         mpf(str(legendary_creature_data["defense"])),
+                         mpf(str(legendary_creature_data["attack_speed"])),
+                         [skills_by_name[skill_name] for skill_name in legendary_creature_data["skills"]])
+        for legendary_creature_data in content["legendary_creatures"]
+    ]
+    legendary_species_by_name: dict = {legendary_species.name: legendary_species for legendary_species in
+                                       potential_legendary_creatures}
+
+    # Initialising opponent trainers, each with their own legendary creatures
+    opponent_trainers: list = [
+        CPUTrainer(trainer_data["name"], create_location(trainer_data["location"]),
+                   Team([legendary_species_by_name[legendary_creature_name].create_legendary_creature() for
+                         legendary_creature_name in trainer_data["team"]]))
+        for trainer_data in content["opponent_trainers"]
+    ]
+    for opponent_trainer, trainer_data in zip(opponent_trainers, content["opponent_trainers"]):
+        opponent_trainer.patrol_route = [create_location(location_data) for location_data in
+                                         trainer_data.get("patrol_route", [])]
+
+    # Encounter tables are kept as plain data and built by every game from its own legendary species.
+    encounter_table_data: dict = {
+        (encounter_data["city"], encounter_data["tile"]): [
+            (entry_data["legendary_creature"], float(entry_data["weight"]), entry_data["min_level"],
+             entry_data["max_level"]) for entry_data in encounter_data["entries"]]
+        for encounter_data in content["encounters"]
+    }
+
+    return WorldCatalogue(items_sold_in_shop, cities, list(skills_by_name.values()), potential_legendary_creatures,
+                          opponent_trainers, create_location(content["player"]["location"]),
+                          legendary_species_by_name[content["player"]["starter_legendary_creature"]],
+                          encounter_table_data)
+
+
+def build_encounter_tables(encounter_table_data, cities, potential_legendary_creatures):
+    # type: (dict, list, list) -> dict
+    """
+    Building the encounter tables of a game world, with default tables for cities without their own.
+    :param encounter_table_data: (city name, tile name) -> list of (legendary species name, weight, min level,
+    max level)
+    :param cities: the cities of the game world
+    :param potential_legendary_creatures: the legendary species of the game world
+    :return: a dict of (city name, tile name) to encounter tables
+    """
+
+    legendary_species_by_name: dict = {legendary_species.name: legendary_species for legendary_species in
+                                       potential_legendary_creatures}
+    encounter_tables: dict = {}  # (city name, tile name) -> encounter table
+    for key, entries in encounter_table_data.items():
+        # Entries of legendary species which are not in the game world are left out.
+        entries = [entry for entry in entries if entry[0] in legendary_species_by_name]
+        if len(entries) > 0:
+            encounter_tables[key] = EncounterTable([legendary_species_by_name[entry[0]] for entry in entries],
+                                                   [entry[1] for entry in entries], [entry[2] for entry in entries],
+                                                   [entry[3] for entry in entries])
+
+    for city in cities:
+        for tile_name in ENCOUNTER_TILE_NAMES:
+            legendary_species_encountered: list = [
+                legendary_species for legendary_species in potential_legendary_creatures
+                if legendary_species.creature_type in DEFAULT_ENCOUNTER_CREATURE_TYPES[tile_name]]
+            if (city.name, tile_name) not in encounter_tables and len(legendary_species_encountered) > 0:
+                n: int = len(legendary_species_encountered)
+                encounter_tables[(city.name, tile_name)] = EncounterTable(legendary_species_encountered, [1.0] * n,
+                                                                          [1] * n, [1] * n)
+
+    return encounter_tables
+
+
+def read_content_files(content_file_names):
+    # type: (list) -> list
+    res: list = []  # initial value
+    for content_file_name in content_file_names:
+        with open(content_file_name, "rb") as content_file:
+            res.append(content_file.read())
+
+    return res
+
+
+def get_code_hash():
+    # type: () -> str
+    """
+    Getting the hash of the code of the game, so that objects pickled into caches are never loaded by code with
+    different classes.
+    :return: a hexadecimal SHA-256 digest
+    """
+
+    import hashlib
+
+    global code_hash
+    if code_hash is None:
+        try:
+            with open(os.path.abspath(__file__), "rb") as source_file:
+                code_hash = hashlib.sha256(source_file.read()).hexdigest()
+        except OSError:
+            # The source code is not shipped with the executable file, which is replaced as a whole when the code
+            # changes.
+            code_hash = hashlib.sha256((os.path.abspath(sys.executable) + str(os.path.getsize(sys.executable)) +
+                                        str(os.path.getmtime(sys.executable))).encode("utf-8")).hexdigest()
+
+    return code_hash
+
+
+def get_content_hash(content_file_data):
+    # type: (list) -> str
+    """
+    Getting the hash identifying a compiled world catalogue.
+    :param content_file_data: the raw content of all content files in the order they are applied
+    :return: a hexadecimal SHA-256 digest
+    """
+
+    import hashlib
+    content_hash = hashlib.sha256((get_code_hash() + numeric_backend).encode("utf-8"))
+    for data in content_file_data:
+        content_hash.update(len(data).to_bytes(8, "little"))
+        content_hash.update(data)
 
-    def clone(self):
-        # type: () -> LegendaryCreature
-        return copy.deepcopy(self)
+    return content_hash.hexdigest()
 
 
-class Skill:
+def build_world_catalogue(content_file_names=None):
+    # type: (list or None) -> WorldCatalogue
     """
-    This class contains attributes of a skill legendary creatures have.
+    Building the game world from content files without using the catalogue cache.
+    :param content_file_names: the content files to apply, all of them by default
+    :return: a newly built world catalogue
     """
 
-    def __init__(self, name, description, magic_points_cost):
-        # type: (str, str, mpf) -> None
-        self.name: str = name
-        self.description: str = description
-        self.magic_points_cost: mpf = magic_points_cost
-        self.level: int = 1
-
-    def __str__(self):
-        # type: () -> str
-        res: str = ""  # initial value
-        res += "Name: " + str(self.name) + "\n"
-        res += "Description: " + str(self.description) + "\n"
-        res += "Magic Points Cost: " + str(self.magic_points_cost) + "\n"
-        res += "Level: " + str(self.level) + "\n"
-        return res
+    if content_file_names is None:
+        content_file_names = get_content_file_names()
 
-    def level_up(self):
-        # type: () -> None
-        pass
+    contents: list = [parse_content(content_file_name, data) for content_file_name, data in
+                      zip(content_file_names, read_content_files(content_file_names))]
+    content: dict = merge_content(contents)
+    validate_content(content)
+    return compile_world_catalogue(content)
 
-    def clone(self):
-        # type: () -> Skill
-        return copy.deepcopy(self)
 
+def load_world_catalogue_data(content_file_names=None):
+    # type: (list or None) -> bytes
+    """
+    Loading the compiled world catalogue for the given content files. The catalogue is compiled and written to the
+    catalogue cache the first time the content is seen and memory-mapped from the cache afterwards.
+    :param content_file_names: the content files to apply, all of them by default
+    :return: the pickled world catalogue
+    """
 
-class AttackSkill(Skill):
+    import pickle
+    import mmap
+
+    if content_file_names is None:
+        content_file_names = get_content_file_names()
+
+    content_file_data: list = read_content_files(content_file_names)
+    cache_file_name: str = os.path.join(CATALOGUE_CACHE_DIRECTORY_NAME,
+                                        get_content_hash(content_file_data) + ".catalogue")
+    if not os.path.isfile(cache_file_name) or os.path.getsize(cache_file_name) == 0:
+        contents: list = [parse_content(content_file_name, data) for content_file_name, data in
+                          zip(content_file_names, content_file_data)]
+        content: dict = merge_content(contents)
+        validate_content(content)
+        data: bytes = pickle.dumps(compile_world_catalogue(content), protocol=pickle.HIGHEST_PROTOCOL)
+        try:
+            os.makedirs(CATALOGUE_CACHE_DIRECTORY_NAME, exist_ok=True)
+            temporary_file_name: str = cache_file_name + "." + str(os.getpid()) + ".tmp"
+            with open(temporary_file_name, "wb") as cache_file:
+                cache_file.write(data)
+
+            os.replace(temporary_file_name, cache_file_name)
+        except OSError:
+            return data  # The catalogue cannot be cached, so it is kept in memory only.
+
+    with open(cache_file_name, "rb") as cache_file:
+        return mmap.mmap(cache_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def get_world_catalogue():
+    # type: () -> WorldCatalogue
     """
-    This class contains attributes of a skill to attack an enemy.
+    Getting a fresh copy of the game world. The compiled catalogue is only loaded once per process and is copied
+    for every call.
+    :return: a world catalogue which is not shared with any other game
     """
 
-    def __init__(self, name, description, magic_points_cost, damage_multiplier, does_ignore_enemies_defense):
-        # type: (str, str, mpf, DamageMultiplier, bool) -> None
-        Skill.__init__(self, name, description, magic_points_cost)
-        self.damage_multiplier: DamageMultiplier = damage_multiplier
-        self.does_ignore_enemies_defense: bool = does_ignore_enemies_defense
+    import pickle
 
-    def __str__(self):
-        # type: () -> str
-        res: str = Skill.__str__(self)
-        res += "Damage Multiplier:\n" + str(self.damage_multiplier) + "\n"
-        res += "Does it ignore enemy's defense: " + str(self.does_ignore_enemies_defense) + "\n"
-        return res
+    global world_catalogue_data
+    if world_catalogue_data is None:
+        world_catalogue_data = load_world_catalogue_data()
 
-    def level_up(self):
-        # type: () -> None
-        self.level += 1
-        self.damage_multiplier.multiplier_to_self_max_hp *= mpf("1.25")
-        self.damage_multiplier.multiplier_to_enemy_max_hp *= mpf("1.25")
-        self.damage_multiplier.multiplier_to_self_attack_power *= mpf("1.25")
-        self.damage_multiplier.multiplier_to_enemy_attack_power *= mpf("1.25")
-        self.damage_multiplier.multiplier_to_self_defense *= mpf("1.25")
-        self.damage_multiplier.multiplier_to_enemy_defense *= mpf("1.25")
-        self.damage_multiplier.multiplier_to_self_max_magic_points *= mpf("1.25")
-        self.damage_multiplier.multiplier_to_enemy_max_magic_points *= mpf("1.25")
+    return pickle.loads(world_catalogue_data)
 
 
-class HealSkill(Skill):
+def create_new_game(player_name):
+    # type: (str) -> Game
     """
-    This class contains attributes of a skill to heal self.
+    Creating a new game for a player with the given name.
+    :param player_name: the name of the player
+    :return: a new game
     """
 
-    def __init__(self, name, description, magic_points_cost, heal_amount):
-        # type: (str, str, mpf, mpf) -> None
-        Skill.__init__(self, name, description, magic_points_cost)
-        self.heal_amount: mpf = heal_amount
+    world_catalogue: WorldCatalogue = get_world_catalogue()
+    player: Player = Player(player_name, world_catalogue.player_start_location)
+    player.add_legendary_creature(world_catalogue.starter_legendary_species.create_legendary_creature())
+    return Game(player, world_catalogue.get_opponent_trainers(), world_catalogue.get_cities(),
+                world_catalogue.get_potential_legendary_creatures(), world_catalogue.get_encounter_table_data())
 
-    def __str__(self):
-        # type: () -> str
-        res: str = Skill.__str__(self)
-        res += "Heal Amount: " + str(self.heal_amount) + "\n"
-        return res
 
-    def level_up(self):
-        # type: () -> None
-        self.level += 1
-        self.heal_amount *= 2
+# Creating functions used to analyse the balance of the game
 
 
-class StrengthenSkill(Skill):
-    """
-    This class contains attributes of a skill to strengthen self.
-    """
+# Win rates computed by balance sweeps are cached in this directory under the hash of what they were computed from.
+BALANCE_CACHE_DIRECTORY_NAME: str = "LEGENDARY CREATURE HUNTER AT MITHOTER PLANET BALANCE CACHE"
 
-    def __init__(self, name, description, magic_points_cost, self_attack_percentage_up, self_defense_percentage_up):
-        # type: (str, str, mpf, mpf, mpf) -> None
-        Skill.__init__(self, name, description, magic_points_cost)
-        self.self_attack_percentage_up: mpf = self_attack_percentage_up
-        self.self_defense_percentage_up: mpf = self_defense_percentage_up
+# Parameters of balance sweeps. Parameters ending in "_scale" multiply values from the content, the others replace
+# constants of the game. Stats of a single species are scaled by "<stat>_scale:<species name>" parameters.
+BALANCE_PARAMETERS: dict = {"damage_multiplier_scale": 1, "heal_amount_scale": 1, "magic_points_cost_scale": 1,
+                            "attack_gauge_tick_factor": Battle.ATTACK_GAUGE_TICK_FACTOR}
+BALANCE_SPECIES_STATS: list = ["max_hp", "max_magic_points", "attack_power", "defense", "attack_speed"]
 
-    def __str__(self):
-        # type: () -> str
-        res: str = Skill.__str__(self)
-        res += "Attack Percentage Up to Self: " + str(self.self_attack_percentage_up * 100) + "%\n"
-        res += "Defense Percentage Up to Self: " + str(self.self_defense_percentage_up * 100) + "%\n"
-        return res
 
+def apply_balance_parameters(legendary_species, parameters):
+    # type: (list, dict) -> list
+    """
+    Getting copies of legendary species and their skills changed by balance parameters.
+    :param legendary_species: a list of legendary species, which are not changed
+    :param parameters: a dict of balance parameters, with missing parameters keeping their default values
+    :return: a list of changed legendary species
+    """
+
+    skill_copies: dict = {}  # id(skill) -> copy, so that skills shared by several species stay shared
+    for species in legendary_species:
+        for skill in species.get_skills():
+            if id(skill) not in skill_copies:
+                skill_copy: Skill = skill.clone()
+                skill_copy.magic_points_cost *= mpf(str(parameters.get("magic_points_cost_scale", 1)))
+                if isinstance(skill_copy, AttackSkill):
+                    skill_copy.damage_multiplier = skill_copy.damage_multiplier.scale(
+                        mpf(str(parameters.get("damage_multiplier_scale", 1))))
+                elif isinstance(skill_copy, HealSkill):
+                    skill_copy.heal_amount *= mpf(str(parameters.get("heal_amount_scale", 1)))
+                skill_copies[id(skill)] = skill_copy
+
+    changed_legendary_species: list = []
+    for species in legendary_species:
+        stat_scales: dict = {stat: parameters.get(stat + "_scale:" + species.name, 1) for stat in
+                             BALANCE_SPECIES_STATS}
+        changed_legendary_species.append(LegendarySpecies(
+            species.name, species.creature_type, species.max_hp * mpf(str(stat_scales["max_hp"])),
+            species.max_magic_points * mpf(str(stat_scales["max_magic_points"])),
+            species.attack_power * mpf(str(stat_scales["attack_power"])),
+            species.defense * mpf(str(stat_scales["defense"])),
+            round(species.attack_speed * stat_scales["attack_speed"]),
+            [skill_copies[id(skill)] for skill in species.get_skills()]))
+
+    return changed_legendary_species
+
+
+def run_balance_point(job):
+    # type: (tuple) -> list
+    """
+    Estimating the win rates of every pair of legendary species at one point of a balance sweep, possibly in a worker
+    process.
+    :param job: a tuple of the legendary species, the balance parameters, the level of the battling legendary
+    creatures, the number of battles per pair of species, the most turns per battle and the random seed
+    :return: a matrix with the share of points each species scored against each other species, and None on its
+    diagonal
+    """
 
-class WeakeningSkill(Skill):
+    legendary_species, parameters, level, battles_per_pair, max_turns, seed = job
+    random_generator: random.Random = random.Random(seed)
+    changed_legendary_species: list = apply_balance_parameters(legendary_species, parameters)
+    win_rates: list = [[None] * len(changed_legendary_species) for species in changed_legendary_species]
+    for i, j in itertools.combinations(range(len(changed_legendary_species)), 2):
+        points: float = 0
+        for battle_number in range(battles_per_pair):
+            # Alternating sides, since team 1 moves first when attack gauges are equal
+            first, second = (i, j) if battle_number % 2 == 0 else (j, i)
+            battle: TrainerBattle = TrainerBattle(
+                Team([changed_legendary_species[first].create_legendary_creature(level)]),
+                Team([changed_legendary_species[second].create_legendary_creature(level)]))
+            battle.ATTACK_GAUGE_TICK_FACTOR = parameters.get("attack_gauge_tick_factor",
+                                                             Battle.ATTACK_GAUGE_TICK_FACTOR)
+            battle.random_generator = random_generator
+            winner: Team or None = battle.resolve(AutoBattlePolicy(), AutoBattlePolicy(), max_turns)
+            first_points: float = 1 if winner is battle.team1 else 0 if winner is battle.team2 else 0.5
+            points += first_points if first == i else 1 - first_points
+
+        win_rates[i][j] = points / battles_per_pair
+        win_rates[j][i] = 1 - win_rates[i][j]
+
+    return win_rates
+
+
+class BalanceSweep:
     """
-    This class contains attributes of a skill to weaken enemies.
+    This class contains attributes of a sweep over a grid of balance parameters, estimating the win rates of every
+    pair of legendary species by simulating battles at each grid point. Grid points are spread over worker processes,
+    and the win rates of each grid point are cached on disk under a hash of the species, the parameters and the
+    simulation settings, so running a sweep again only simulates new grid points.
     """
 
-    def __init__(self, name, description, magic_points_cost, enemy_attack_percentage_down,
-                 enemy_defense_percentage_down):
-        # type: (str, str, mpf, mpf, mpf) -> None
-        Skill.__init__(self, name, description, magic_points_cost)
-        self.enemy_attack_percentage_down: mpf = enemy_attack_percentage_down
-        self.enemy_defense_percentage_down: mpf = enemy_defense_percentage_down
+    def __init__(self, legendary_species, grid, level=1, battles_per_pair=10, max_turns=500, seed=0):
+        # type: (list, dict, int, int, int, int) -> None
+        species_names: list = [species.name for species in legendary_species]
+        for parameter in grid:
+            name, separator, species_name = parameter.partition(":")
+            if parameter not in BALANCE_PARAMETERS and not (name[:-len("_scale")] in BALANCE_SPECIES_STATS and
+                                                            name.endswith("_scale") and species_name in species_names):
+                raise ValueError("Unknown balance parameter " + repr(parameter))
+
+        self.__legendary_species: list = legendary_species
+        self.grid: dict = grid  # parameter -> list of values to try
+        self.level: int = level
+        self.battles_per_pair: int = battles_per_pair
+        self.max_turns: int = max_turns  # turns after which a battle is a draw
+        self.seed: int = seed
+        self.__results: dict = {}  # parameter hash -> win rate matrix
 
     def __str__(self):
         # type: () -> str
-        res: str = Skill.__str__(self)
-        res += "Attack Percentage Down to Enemy: " + str(self.enemy_attack_percentage_down * 100) + "%\n"
-        res += "Defense Percentage Down to Enemy: " + str(self.enemy_defense_percentage_down * 100) + "%\n"
-        return res
+        return render_text(self)
+
+    def write_text(self, stream):
+        # type: (io.TextIOBase) -> None
+        species_names: list = [species.name for species in self.__legendary_species]
+        for parameters in self.get_grid_points():
+            win_rates: list or None = self.__results.get(self.get_parameter_hash(parameters))
+            stream.write("Parameters: " + ", ".join(str(name) + " = " + str(value) for name, value in
+                                                    sorted(parameters.items())) + "\n")
+            if win_rates is None:
+                stream.write("Not simulated yet.\n\n")
+                continue
+
+            stream.write("%14s" % "" + "".join("%7s" % ("#" + str(j)) for j in range(len(species_names))) +
+                         "%9s" % "Overall" + "\n")
+            for i, (row, overall_win_rate) in enumerate(zip(win_rates, self.get_overall_win_rates(win_rates))):
+                stream.write("%14s" % ("#" + str(i) + " " + str(species_names[i])[:10]) +
+                             "".join("%7s" % ("-" if win_rate is None else "%.2f" % win_rate) for win_rate in row) +
+                             "%9s" % ("%.2f" % overall_win_rate) + "\n")
+
+            stream.write("\n")
+
+    @staticmethod
+    def get_overall_win_rates(win_rates):
+        # type: (list) -> list
+        return [sum(win_rate for win_rate in row if win_rate is not None) / max(1, len(row) - 1) for row in win_rates]
+
+    def get_grid_points(self):
+        # type: () -> list
+        names: list = sorted(self.grid)
+        return [dict(zip(names, values)) for values in itertools.product(*(self.grid[name] for name in names))]
 
+    def get_parameter_hash(self, parameters):
+        # type: (dict) -> str
+        """
+        Getting the hash identifying the win rates at a grid point. The code of the game is part of the hash, since
+        changing how battles work changes the win rates.
+        :param parameters: the balance parameters of the grid point
+        :return: a hexadecimal SHA-256 digest
+        """
 
-class DamageMultiplier:
-    """
-    This class contains attributes of damage multiplier.
-    """
+        import hashlib
+        parameter_hash = hashlib.sha256((get_code_hash() + numeric_backend).encode("utf-8"))
+        for species in self.__legendary_species:
+            parameter_hash.update(str(species).encode("utf-8"))
+        parameter_hash.update(repr((sorted((name, value) for name, value in parameters.items() if
+                                           value != BALANCE_PARAMETERS.get(name, 1)), self.level,
+                                    self.battles_per_pair, self.max_turns, self.seed)).encode("utf-8"))
+        return parameter_hash.hexdigest()
+
+    def get_win_rates(self, parameters):
+        # type: (dict) -> list or None
+        return self.__results.get(self.get_parameter_hash(parameters))
+
+    def run(self, workers=None):
+        # type: (int or None) -> list
+        """
+        Simulating every grid point which is not cached yet.
+        :param workers: the number of worker processes, all CPUs by default and none (simulating in this process) if
+        it is 1
+        :return: a list of tuples of the parameters and the win rate matrix at each grid point
+        """
 
-    def __init__(self, multiplier_to_self_max_hp, multiplier_to_enemy_max_hp, multiplier_to_self_attack_power,
-                 multiplier_to_enemy_attack_power, multiplier_to_self_defense, multiplier_to_enemy_defense,
-                 multiplier_to_self_max_magic_points, multiplier_to_enemy_max_magic_points,
-                 multiplier_to_self_attack_speed, multiplier_to_enemy_attack_speed):
-        # type: (float, float, float, float, float, float, float, float, float, float) -> None
-        self.multiplier_to_self_max_hp: float = multiplier_to_self_max_hp
-        self.multiplier_to_enemy_max_hp: float = multiplier_to_enemy_max_hp
-        self.multiplier_to_self_attack_power: float = multiplier_to_self_attack_power
-        self.multiplier_to_enemy_attack_power: float = multiplier_to_enemy_attack_power
-        self.multiplier_to_self_defense: float = multiplier_to_self_defense
-        self.multiplier_to_enemy_defense: float = multiplier_to_enemy_defense
-        self.multiplier_to_self_max_magic_points: float = multiplier_to_self_max_magic_points
-        self.multiplier_to_enemy_max_magic_points: float = multiplier_to_enemy_max_magic_points
-        self.multiplier_to_self_attack_speed: float = multiplier_to_self_attack_speed
-        self.multiplier_to_enemy_attack_speed: float = multiplier_to_enemy_attack_speed
+        import pickle
 
-    def __str__(self):
-        # type: () -> str
-        res: str = ""  # initial value
-        res += "Damage Multiplier to Self Max HP: " + str(self.multiplier_to_self_max_hp) + "\n"
-        res += "Damage Multiplier to Enemy's Max HP: " + str(self.multiplier_to_enemy_max_hp) + "\n"
-        res += "Damage Multiplier to Self Attack Power: " + str(self.multiplier_to_self_attack_power) + "\n"
-        res += "Damage Multiplier to Enemy's Attack Power: " + str(self.multiplier_to_enemy_attack_power) + "\n"
-        res += "Damage Multiplier to Self Defense: " + str(self.multiplier_to_self_defense) + "\n"
-        res += "Damage Multiplier to Enemy's Defense: " + str(self.multiplier_to_enemy_defense) + "\n"
-        res += "Damage Multiplier to Self Max Magic Points: " + str(self.multiplier_to_self_max_magic_points) + "\n"
-        res += "Damage Multiplier to Enemy's Max Magic Points: " + str(self.multiplier_to_enemy_max_magic_points) + "\n"
-        res += "Damage Multiplier to Self Attack Speed: " + str(self.multiplier_to_self_attack_speed) + "\n"
-        res += "Damage Multiplier to Enemy's Attack Speed: " + str(self.multiplier_to_enemy_attack_speed) + "\n"
-        return res
+        jobs: list = []
+        job_hashes: list = []
+        for parameters in self.get_grid_points():
+            parameter_hash: str = self.get_parameter_hash(parameters)
+            if parameter_hash in self.__results:
+                continue
 
-    def calculate_raw_damage_without_enemy_defense(self, user, target):
-        # type: (LegendaryCreature, LegendaryCreature) -> mpf
-        return user.max_hp * self.multiplier_to_self_max_hp + target.max_hp * self.multiplier_to_enemy_max_hp + \
-               user.attack_power * (1 + user.attack_power_percentage_up / 100 -
-                                    user.attack_power_percentage_down / 100) * \
-               (self.multiplier_to_self_attack_speed * user.attack_speed) \
-               * self.multiplier_to_self_attack_power + target.attack_power * (
-                       1 + target.attack_power_percentage_up / 100
-                       - target.attack_power_percentage_down / 100) * \
-               (self.multiplier_to_enemy_attack_speed * target.attack_speed) * \
-               self.multiplier_to_enemy_attack_power + user.defense * (1 + user.defense_percentage_up / 100 -
-                                        user.defense_percentage_down / 100) * self.multiplier_to_self_defense + \
-               target.defense * (1 + target.defense_percentage_up / 100 - target.defense_percentage_down / 100) * \
-               self.multiplier_to_enemy_defense + user.max_magic_points * \
-               self.multiplier_to_self_max_magic_points + target.max_magic_points * \
-               self.multiplier_to_enemy_max_magic_points
+            cache_file_name: str = os.path.join(BALANCE_CACHE_DIRECTORY_NAME, parameter_hash + ".balance")
+            if os.path.isfile(cache_file_name) and os.path.getsize(cache_file_name) > 0:
+                with open(cache_file_name, "rb") as cache_file:
+                    self.__results[parameter_hash] = pickle.load(cache_file)
+                continue
 
-    def calculate_raw_damage(self, user, target):
-        # type: (LegendaryCreature, LegendaryCreature) -> mpf
-        return self.calculate_raw_damage_without_enemy_defense(user, target) - target.defense
+            job_hashes.append(parameter_hash)
+            jobs.append((self.__legendary_species, parameters, self.level, self.battles_per_pair, self.max_turns,
+                         int(parameter_hash[:16], 16)))
 
-    def clone(self):
-        # type: () -> DamageMultiplier
-        return copy.deepcopy(self)
+        if workers == 1 or len(jobs) <= 1:
+            outcomes = map(run_balance_point, jobs)
+            self.__store_results(job_hashes, outcomes)
+        else:
+            from concurrent.futures import ProcessPoolExecutor
 
+            with ProcessPoolExecutor(max_workers=workers, initializer=set_numeric_backend,
+                                     initargs=(numeric_backend,)) as executor:
+                self.__store_results(job_hashes, executor.map(run_balance_point, jobs))
 
-class Reward:
-    """
-    This class contains attributes of the reward for doing something in this game.
-    """
+        return [(parameters, self.get_win_rates(parameters)) for parameters in self.get_grid_points()]
 
-    def __init__(self, player_coin_gain, player_exp_gain, legendary_creature_exp_gain):
-        # type: (mpf, mpf, mpf) -> None
-        self.player_coin_gain: mpf = player_coin_gain
-        self.player_exp_gain: mpf = player_exp_gain
-        self.legendary_creature_exp_gain: mpf = legendary_creature_exp_gain
+    def __store_results(self, job_hashes, outcomes):
+        # type: (list, object) -> None
+        import pickle
 
-    def __str__(self):
-        # type: () -> str
-        res: str = ""  # initial value
-        res += "Player Coin Gain: " + str(self.player_coin_gain) + "\n"
-        res += "Player EXP Gain: " + str(self.player_exp_gain) + "\n"
-        res += "Legendary Creature EXP Gain: " + str(self.legendary_creature_exp_gain) + "\n"
-        return res
+        for parameter_hash, win_rates in zip(job_hashes, outcomes):
+            self.__results[parameter_hash] = win_rates
+            try:
+                os.makedirs(BALANCE_CACHE_DIRECTORY_NAME, exist_ok=True)
+                cache_file_name: str = os.path.join(BALANCE_CACHE_DIRECTORY_NAME, parameter_hash + ".balance")
+                temporary_file_name: str = cache_file_name + "." + str(os.getpid()) + ".tmp"
+                with open(temporary_file_name, "wb") as cache_file:
+                    pickle.dump(win_rates, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
 
-    def clone(self):
-        # type: () -> Reward
-        return copy.deepcopy(self)
+                os.replace(temporary_file_name, cache_file_name)
+            except OSError:
+                pass  # The win rates cannot be cached, so they are kept in memory only.
 
 
-class Game:
+# Creating functions used to interact with the player
+
+
+# Number of entries shown on one page of an inventory.
+PAGE_SIZE: int = 10
+
+
+def read_page_command(page_number, page_size, page_length):
+    # type: (int, int, int) -> int or None
     """
-    This class contains attributes of the saved game data.
+    Asking the player whether to go to the next or the previous page.
+    :return: the new page number or None if the player wants to stop paging
     """
 
-    def __init__(self, player, opponent_trainers, cities, potential_legendary_creatures):
-        # type: (Player, list, list, list) -> None
-        self.player: Player = player
-        self.__opponent_trainers: list = opponent_trainers
-        self.__cities: list = cities
-        self.__potential_legendary_creatures: list = potential_legendary_creatures
+    print("Enter 'NEXT' to view the next page.")
+    print("Enter 'PREVIOUS' to view the previous page.")
+    print("Enter anything else to stop viewing pages.")
+    command: str = input("What do you want to do? ")
+    if command == "NEXT" and page_length == page_size:
+        return page_number + 1
+    elif command == "PREVIOUS" and page_number > 0:
+        return page_number - 1
+    elif command in ["NEXT", "PREVIOUS"]:
+        return page_number
+    return None
+
+
+def read_legendary_creature_filters():
+    # type: () -> dict
+    """
+    Asking the player which legendary creatures to show. Leaving an answer empty does not filter on it.
+    :return: keyword arguments for LegendaryCreatureInventory.get_page()
+    """
 
-    def __str__(self):
-        # type: () -> str
-        res: str = "Player in the game:\n" + str(self.player) + "\n"
-        res += "Below is a list of opponent trainers in the game:\n"
-        for opponent_trainer in self.__opponent_trainers:
-            res += str(opponent_trainer) + "\n"
+    creature_type: str = input("Please enter the type of legendary creatures to show (leave empty for all types): ")
+    min_level: str = input("Please enter the minimum level of legendary creatures to show (leave empty for no "
+                           "minimum): ")
+    max_level: str = input("Please enter the maximum level of legendary creatures to show (leave empty for no "
+                           "maximum): ")
+    name_prefix: str = input("Please enter the start of the names of legendary creatures to show (leave empty for "
+                             "all names): ")
+    return {
+        "creature_type": creature_type if creature_type != "" else None,
+        "min_level": int(min_level) if min_level.isdigit() else None,
+        "max_level": int(max_level) if max_level.isdigit() else None,
+        "name_prefix": name_prefix if name_prefix != "" else None
+    }
+
+
+def view_legendary_creatures(legendary_creature_inventory):
+    # type: (LegendaryCreatureInventory) -> None
+    filters: dict = read_legendary_creature_filters()
+    print("Enter 'Y' for yes.")
+    print("Enter anything else for no.")
+    summary: bool = input("Do you want to show one line for every legendary creature? ") == "Y"
+    page_number: int or None = 0
+    while page_number is not None:
+        page: list = legendary_creature_inventory.get_page(page_number, PAGE_SIZE, **filters)
+        print(legendary_creature_inventory.render_legendary_creatures(page_number, page, summary))
+        page_number = read_page_command(page_number, PAGE_SIZE, len(page))
 
-        res += "Maps of cities in the game:\n"
-        for city in self.__cities:
-            res += str(city) + "\n"
 
-        res += "Below is a list of potential legendary creatures in this game:\n"
-        for legendary_creature in self.__potential_legendary_creatures:
-            res += str(legendary_creature) + "\n"
+def view_items(item_inventory):
+    # type: (ItemInventory) -> None
+    name_prefix: str = input("Please enter the start of the names of items to show (leave empty for all names): ")
+    print("Enter 'Y' for yes.")
+    print("Enter anything else for no.")
+    summary: bool = input("Do you want to show one line for every item? ") == "Y"
+    page_number: int or None = 0
+    while page_number is not None:
+        page: list = item_inventory.get_page(page_number, PAGE_SIZE, name_prefix=name_prefix or None)
+        print(item_inventory.render_items(page_number, page, summary))
+        page_number = read_page_command(page_number, PAGE_SIZE, len(page))
 
-        return res
 
-    def get_opponent_trainers(self):
-        # type: () -> list
-        return self.__opponent_trainers
+def select_legendary_creature(legendary_creature_inventory, purpose):
+    # type: (LegendaryCreatureInventory, str) -> LegendaryCreature or None
+    """
+    Letting the player page through a legendary creature inventory and choose a legendary creature on a page.
+    :param legendary_creature_inventory: the inventory to choose from
+    :param purpose: what the chosen legendary creature is for, e.g. "give items to"
+    :return: the chosen legendary creature or None if the player did not choose any
+    """
 
-    def get_cities(self):
-        # type: () -> list
-        return self.__cities
+    filters: dict = read_legendary_creature_filters()
+    page_number: int = 0
+    while True:
+        page: list = legendary_creature_inventory.get_page(page_number, PAGE_SIZE, **filters)
+        print(legendary_creature_inventory.render_legendary_creatures(page_number, page))
+        print("Enter 'NEXT' to view the next page.")
+        print("Enter 'PREVIOUS' to view the previous page.")
+        print("Enter the number shown next to a legendary creature to choose it.")
+        print("Enter anything else to choose nothing.")
+        command: str = input("Which legendary creature do you want to " + str(purpose) + "? ")
+        if command == "NEXT":
+            if len(page) == PAGE_SIZE:
+                page_number += 1
+        elif command == "PREVIOUS":
+            if page_number > 0:
+                page_number -= 1
+        elif command.isdigit() and int(command) < len(page):
+            return page[int(command)]
+        else:
+            return None
 
-    def get_potential_legendary_creatures(self):
-        # type: () -> list
-        return self.__potential_legendary_creatures
 
-    def clone(self):
-        # type: () -> Game
-        return copy.deepcopy(self)
+def select_item(item_inventory, purpose, item_type=None, get_details=None):
+    # type: (ItemInventory, str, type or None, callable or None) -> Item or None
+    """
+    Letting the player page through an item inventory and choose an item on a page.
+    :param item_inventory: the inventory to choose from
+    :param purpose: what the chosen item is for, e.g. "sell"
+    :param item_type: only show items of this type
+    :param get_details: a function giving a line of details shown for every item on a page, e.g. catch chances
+    :return: the chosen item or None if the player did not choose any
+    """
+
+    page_number: int = 0
+    while True:
+        page: list = item_inventory.get_page(page_number, PAGE_SIZE, item_type)
+        print(item_inventory.render_items(page_number, page))
+        if get_details is not None:
+            for i, item in enumerate(page):
+                print("#" + str(i) + ": " + get_details(item))
+
+            print("")
+
+        print("Enter 'NEXT' to view the next page.")
+        print("Enter 'PREVIOUS' to view the previous page.")
+        print("Enter the number shown next to an item to choose it.")
+        print("Enter anything else to choose nothing.")
+        command: str = input("Which item do you want to " + str(purpose) + "? ")
+        if command == "NEXT":
+            if len(page) == PAGE_SIZE:
+                page_number += 1
+        elif command == "PREVIOUS":
+            if page_number > 0:
+                page_number -= 1
+        elif command.isdigit() and int(command) < len(page):
+            return page[int(command)]
+        else:
+            return None
+
+
+def offer_auto_battle(battle, max_turns=10000):
+    # type: (Battle, int) -> None
+    """
+    Asking whether the player's team is to battle automatically and if so carrying out the battle to the end, or
+    for at most max_turns turns after which the player takes over.
+    :param battle: the battle the player's team, which is team 1, is in
+    :param max_turns: the most turns to be taken automatically
+    :return: None
+    """
+
+    print("Enter 'Y' for yes.")
+    print("Enter anything else for no.")
+    auto_battle: str = input("Do you want your team to battle automatically? ")
+    if auto_battle == "Y":
+        if battle.resolve(AutoBattlePolicy(), RandomBattlePolicy(), max_turns) is None:
+            print("The battle did not end within " + str(max_turns) + " turns. You will choose the moves of your "
+                  "team from now on.")
+        else:
+            print(battle.get_summary())
 
 
 # Creating main function used to run the game
@@ -1508,193 +5743,6 @@ def main():
     print("This game is a turn based strategy game like Pokemon where you will hunt for legendary ")
     print("creatures around Mithoter Planet and battle against other trainers.")
 
-    # Initialising important variables to be used throughout the game.
-
-    items_sold_in_shop: list = [
-        Rune("1-STAR RUNE SLOT 1", "Rune with rating of 1 with slot number 1.", mpf("1e5"), 1, 1),
-        Rune("1-STAR RUNE SLOT 2", "Rune with rating of 1 with slot number 2.", mpf("1e5"), 1, 2),
-        Rune("1-STAR RUNE SLOT 3", "Rune with rating of 1 with slot number 3.", mpf("1e5"), 1, 3),
-        Rune("1-STAR RUNE SLOT 4", "Rune with rating of 1 with slot number 4.", mpf("1e5"), 1, 4),
-        Rune("1-STAR RUNE SLOT 5", "Rune with rating of 1 with slot number 5.", mpf("1e5"), 1, 5),
-        Rune("1-STAR RUNE SLOT 6", "Rune with rating of 1 with slot number 6.", mpf("1e5"), 1, 6),
-        Rune("1-STAR RUNE SLOT 7", "Rune with rating of 1 with slot number 7.", mpf("1e5"), 1, 7),
-        Rune("2-STAR RUNE SLOT 8", "Rune with rating of 2 with slot number 8.", mpf("1e5"), 1, 8),
-        Rune("2-STAR RUNE SLOT 1", "Rune with rating of 2 with slot number 1.", mpf("1e10"), 2, 1),
-        Rune("2-STAR RUNE SLOT 2", "Rune with rating of 2 with slot number 2.", mpf("1e10"), 2, 2),
-        Rune("2-STAR RUNE SLOT 3", "Rune with rating of 2 with slot number 3.", mpf("1e10"), 2, 3),
-        Rune("2-STAR RUNE SLOT 4", "Rune with rating of 2 with slot number 4.", mpf("1e10"), 2, 4),
-        Rune("2-STAR RUNE SLOT 5", "Rune with rating of 2 with slot number 5.", mpf("1e10"), 2, 5),
-        Rune("2-STAR RUNE SLOT 6", "Rune with rating of 2 with slot number 6.", mpf("1e10"), 2, 6),
-        Rune("2-STAR RUNE SLOT 7", "Rune with rating of 2 with slot number 7.", mpf("1e10"), 2, 7),
-        Rune("2-STAR RUNE SLOT 8", "Rune with rating of 2 with slot number 8.", mpf("1e10"), 2, 8),
-        Rune("3-STAR RUNE SLOT 1", "Rune with rating of 3 with slot number 1.", mpf("1e20"), 3, 1),
-        Rune("3-STAR RUNE SLOT 2", "Rune with rating of 3 with slot number 2.", mpf("1e20"), 3, 2),
-        Rune("3-STAR RUNE SLOT 3", "Rune with rating of 3 with slot number 3.", mpf("1e20"), 3, 3),
-        Rune("3-STAR RUNE SLOT 4", "Rune with rating of 3 with slot number 4.", mpf("1e20"), 3, 4),
-        Rune("3-STAR RUNE SLOT 5", "Rune with rating of 3 with slot number 5.", mpf("1e20"), 3, 5),
-        Rune("3-STAR RUNE SLOT 6", "Rune with rating of 3 with slot number 6.", mpf("1e20"), 3, 6),
-        Rune("3-STAR RUNE SLOT 7", "Rune with rating of 3 with slot number 7.", mpf("1e20"), 3, 7),
-        Rune("3-STAR RUNE SLOT 8", "Rune with rating of 3 with slot number 8.", mpf("1e20"), 3, 8),
-        Rune("4-STAR RUNE SLOT 1", "Rune with rating of 4 with slot number 1.", mpf("1e40"), 4, 1),
-        Rune("4-STAR RUNE SLOT 2", "Rune with rating of 4 with slot number 2.", mpf("1e40"), 4, 2),
-        Rune("4-STAR RUNE SLOT 3", "Rune with rating of 4 with slot number 3.", mpf("1e40"), 4, 3),
-        Rune("4-STAR RUNE SLOT 4", "Rune with rating of 4 with slot number 4.", mpf("1e40"), 4, 4),
-        Rune("4-STAR RUNE SLOT 5", "Rune with rating of 4 with slot number 5.", mpf("1e40"), 4, 5),
-        Rune("4-STAR RUNE SLOT 6", "Rune with rating of 4 with slot number 6.", mpf("1e40"), 4, 6),
-        Rune("4-STAR RUNE SLOT 7", "Rune with rating of 4 with slot number 7.", mpf("1e40"), 4, 7),
-        Rune("4-STAR RUNE SLOT 8", "Rune with rating of 4 with slot number 8.", mpf("1e40"), 4, 8),
-        Rune("5-STAR RUNE SLOT 1", "Rune with rating of 5 with slot number 1.", mpf("1e80"), 5, 1),
-        Rune("5-STAR RUNE SLOT 2", "Rune with rating of 5 with slot number 2.", mpf("1e80"), 5, 2),
-        Rune("5-STAR RUNE SLOT 3", "Rune with rating of 5 with slot number 3.", mpf("1e80"), 5, 3),
-        Rune("5-STAR RUNE SLOT 4", "Rune with rating of 5 with slot number 4.", mpf("1e80"), 5, 4),
-        Rune("5-STAR RUNE SLOT 5", "Rune with rating of 5 with slot number 5.", mpf("1e80"), 5, 5),
-        Rune("5-STAR RUNE SLOT 6", "Rune with rating of 5 with slot number 6.", mpf("1e80"), 5, 6),
-        Rune("5-STAR RUNE SLOT 7", "Rune with rating of 5 with slot number 7.", mpf("1e80"), 5, 7),
-        Rune("5-STAR RUNE SLOT 8", "Rune with rating of 5 with slot number 8.", mpf("1e80"), 5, 8),
-        Rune("6-STAR RUNE SLOT 1", "Rune with rating of 6 with slot number 1.", mpf("1e160"), 6, 1),
-        Rune("6-STAR RUNE SLOT 2", "Rune with rating of 6 with slot number 2.", mpf("1e160"), 6, 2),
-        Rune("6-STAR RUNE SLOT 3", "Rune with rating of 6 with slot number 3.", mpf("1e160"), 6, 3),
-        Rune("6-STAR RUNE SLOT 4", "Rune with rating of 6 with slot number 4.", mpf("1e160"), 6, 4),
-        Rune("6-STAR RUNE SLOT 5", "Rune with rating of 6 with slot number 5.", mpf("1e160"), 6, 5),
-        Rune("6-STAR RUNE SLOT 6", "Rune with rating of 6 with slot number 6.", mpf("1e160"), 6, 6),
-        Rune("6-STAR RUNE SLOT 7", "Rune with rating of 6 with slot number 7.", mpf("1e160"), 6, 7),
-        Rune("6-STAR RUNE SLOT 8", "Rune with rating of 6 with slot number 8.", mpf("1e160"), 6, 8),
-        EXPShard("EXP SHARD #1", "EXP Shard #1.", mpf("1e10"), mpf("1e9")),
-        EXPShard("EXP SHARD #2", "EXP Shard #2.", mpf("1e20"), mpf("1e19")),
-        EXPShard("EXP SHARD #3", "EXP Shard #3.", mpf("1e40"), mpf("1e39")),
-        EXPShard("EXP SHARD #4", "EXP Shard #4.", mpf("1e80"), mpf("1e79")),
-        EXPShard("EXP SHARD #5", "EXP Shard #5.", mpf("1e160"), mpf("1e159")),
-        EXPShard("EXP SHARD #6", "EXP Shard #6.", mpf("1e320"), mpf("1e319")),
-        LevelUpShard("LEVEL UP SHARD", "A shard to immediately level up a legendary creature.", mpf("1e35")),
-        SkillLevelUpShard("SKILL LEVEL UP SHARD", "A shard to level up a skill owned by a legendary creature.",
-                          mpf("1e35")),
-        EvolutionCandy("EVOLUTION CANDY", "An evolution candy to immediately evolve a legendary creature.",
-                       mpf("1e35")),
-        FishingRod("FISHING ROD #1", "Fishing Rod #1", mpf("1e10"), 0.1),
-        FishingRod("FISHING ROD #2", "Fishing Rod #2", mpf("1e20"), 0.2),
-        FishingRod("FISHING ROD #3", "Fishing Rod #3", mpf("1e40"), 0.3),
-        FishingRod("FISHING ROD #4", "Fishing Rod #4", mpf("1e80"), 0.4),
-        FishingRod("FISHING ROD #5", "Fishing Rod #5", mpf("1e160"), 0.5),
-        Ball("BALL #1", "Ball #1", mpf("1e10"), 0.1),
-        Ball("BALL #2", "Ball #2", mpf("1e20"), 0.2),
-        Ball("BALL #3", "Ball #3", mpf("1e40"), 0.3),
-        Ball("BALL #4", "Ball #4", mpf("1e80"), 0.4),
-        Ball("BALL #5", "Ball #5", mpf("1e160"), 0.5)
-    ]
-
-    cities: list = [
-        City("Timberhallow", 5, 5,
-             [
-                 [WaterTile(), SandTile(), SandTile(), GrassTile(), WaterTile()],
-                 [SandTile(), GrassTile(), ShopTile(items_sold_in_shop), GrassTile(), WaterTile()],
-                 [TrainingCenterTile(mpf("1e5")), GrassTile(), SandTile(), SandTile(), SandTile()],
-                 [SandTile(), SandTile(), GrassTile(), GrassTile(), GrassTile()],
-                 [GrassTile(), GrassTile(), TrainingCenterTile(mpf("1e5")), GrassTile(), GrassTile()]
-             ]),
-        City("Loststar", 5, 5,
-             [
-                 [WaterTile(), SandTile(), SandTile(), GrassTile(), WaterTile()],
-                 [SandTile(), GrassTile(), ShopTile(items_sold_in_shop), GrassTile(), WaterTile()],
-                 [TrainingCenterTile(mpf("1e10")), GrassTile(), SandTile(), SandTile(), SandTile()],
-                 [SandTile(), SandTile(), GrassTile(), GrassTile(), GrassTile()],
-                 [GrassTile(), GrassTile(), TrainingCenterTile(mpf("1e10")), GrassTile(), GrassTile()]
-             ]),
-        City("Mageborough", 5, 5,
-             [
-                 [WaterTile(), SandTile(), SandTile(), GrassTile(), WaterTile()],
-                 [SandTile(), GrassTile(), ShopTile(items_sold_in_shop), GrassTile(), WaterTile()],
-                 [TrainingCenterTile(mpf("1e20")), GrassTile(), SandTile(), SandTile(), SandTile()],
-                 [SandTile(), SandTile(), GrassTile(), GrassTile(), GrassTile()],
-                 [GrassTile(), GrassTile(), TrainingCenterTile(mpf("1e20")), GrassTile(), GrassTile()]
-             ]),
-        City("Coldpass", 5, 5,
-             [
-                 [WaterTile(), SandTile(), SandTile(), GrassTile(), WaterTile()],
-                 [SandTile(), GrassTile(), ShopTile(items_sold_in_shop), GrassTile(), WaterTile()],
-                 [TrainingCenterTile(mpf("1e20")), GrassTile(), SandTile(), SandTile(), SandTile()],
-                 [SandTile(), SandTile(), GrassTile(), GrassTile(), GrassTile()],
-                 [GrassTile(), GrassTile(), TrainingCenterTile(mpf("1e20")), GrassTile(), GrassTile()]
-             ]),
-        City("Whithollow", 5, 5,
-             [
-                 [WaterTile(), SandTile(), SandTile(), GrassTile(), WaterTile()],
-                 [SandTile(), GrassTile(), ShopTile(items_sold_in_shop), GrassTile(), WaterTile()],
-                 [TrainingCenterTile(mpf("1e20")), GrassTile(), SandTile(), SandTile(), SandTile()],
-                 [SandTile(), SandTile(), GrassTile(), GrassTile(), GrassTile()],
-                 [GrassTile(), GrassTile(), TrainingCenterTile(mpf("1e20")), GrassTile(), GrassTile()]
-             ])
-    ]
-
-    # Adding portals to the cities
-    timberhallow_city: City = cities[0]
-    loststar_city: City = cities[1]
-    mageborough_city: City = cities[2]
-    coldpass_city: City = cities[3]
-    whithollow_city: City = cities[4]
-
-    timberhallow_city.get_tiles()[4][3].portal = Portal(Location(timberhallow_city, 3, 4),
-                                                        Location(loststar_city, 3, 0))
-    loststar_city.get_tiles()[0][3].portal = Portal(Location(loststar_city, 3, 0), Location(timberhallow_city, 3, 4))
-    loststar_city.get_tiles()[4][3].portal = Portal(Location(loststar_city, 3, 4), Location(mageborough_city, 3, 0))
-    mageborough_city.get_tiles()[0][3].portal = Portal(Location(mageborough_city, 3, 0), Location(loststar_city, 3, 4))
-    mageborough_city.get_tiles()[4][3].portal = Portal(Location(mageborough_city, 3, 4), Location(coldpass_city, 3, 0))
-    coldpass_city.get_tiles()[0][3].portal = Portal(Location(coldpass_city, 3, 0), Location(mageborough_city, 3, 4))
-    coldpass_city.get_tiles()[4][3].portal = Portal(Location(coldpass_city, 3, 4), Location(whithollow_city, 3, 0))
-    whithollow_city.get_tiles()[0][3].portal = Portal(Location(whithollow_city, 3, 0), Location(coldpass_city, 3, 4))
-
-    # Creating a list of skills that all legendary creatures have.
-    skills_list: list = [
-        AttackSkill("ATTACK SKILL #1", "Normal Attack Skill", mpf("1e3"), mpf("3.5"), False),
-        AttackSkill("ATTACK SKILL #2", "Strong Attack Skill", mpf("1e10"), mpf("10.5"), False),
-        AttackSkill("ATTACK SKILL #3", "Ultimate Attack Skill", mpf("1e30"), mpf("31.5"), True),
-        HealSkill("HEAL SKILL #1", "First Heal Skill", mpf("1e3"), mpf("2e4")),
-        HealSkill("HEAL SKILL #2", "Better Heal Skill", mpf("1e10"), mpf("2e12")),
-        HealSkill("HEAL SKILL #3", "Ultimate Heal Skill", mpf("1e30"), mpf("2e36")),
-        WeakeningSkill("WEAKENING SKILL #1", "First Weakening Skill", mpf("1e3"), mpf("0.05"), mpf("0.05")),
-        WeakeningSkill("WEAKENING SKILL #2", "Better Weakening Skill", mpf("1e10"), mpf("0.15"), mpf("0.15")),
-        WeakeningSkill("WEAKENING SKILL #3", "Ultimate Weakening Skill", mpf("1e30"), mpf("0.45"), mpf("0.45")),
-        StrengthenSkill("STRENGTHENING SKILL #1", "First Strengthening Skill", mpf("1e3"), mpf("0.05"), mpf("0.05")),
-        StrengthenSkill("STRENGTHENING SKILL #2", "Better Strengthening Skill", mpf("1e10"), mpf("0.15"), mpf("0.15")),
-        StrengthenSkill("STRENGTHENING SKILL #3", "Ultimate Strengthening Skill", mpf("1e30"), mpf("0.45"), mpf("0.45"))
-    ]
-
-    potential_legendary_creatures: list = [
-        LegendaryCreature("Crondiff", "LAND", mpf("5e4"), mpf("4.75e4"), mpf("9e3"), mpf("8.8e3"), mpf("109"),
-                          skills_list),
-        LegendaryCreature("Grifngu", "WATER", mpf("4.85e4"), mpf("4.93e4"), mpf("9.5e3"), mpf("8.77e3"), mpf("112"),
-                          skills_list),
-        LegendaryCreature("Silechnou", "LAND", mpf("4.63e4"), mpf("5.12e4"), mpf("9.7e3"), mpf("8.9e3"), mpf("111"),
-                          skills_list),
-        LegendaryCreature("Icculsoz", "WATER", mpf("4.92e4"), mpf("5.08e4"), mpf("9.6e3"), mpf("9e3"), mpf("108"),
-                          skills_list),
-        LegendaryCreature("Ourezarm", "LAND", mpf("5.01e4"), mpf("4.96e4"), mpf("8.7e3"), mpf("9.2e3"), mpf("106"),
-                          skills_list),
-        LegendaryCreature("Braoclops", "WATER", mpf("4.75e4"), mpf("5.11e4"), mpf("9.36e3"), mpf("9e3"), mpf("114"),
-                          skills_list),
-        LegendaryCreature("Chielope", "LAND", mpf("4.9e4"), mpf("4.8e4"), mpf("9.45e3"), mpf("9.12e3"), mpf("115"),
-                          skills_list),
-        LegendaryCreature("Skaisena", "WATER", mpf("5.22e4"), mpf("5.12e4"), mpf("8.9e3"), mpf("9.4e3"), mpf("111"),
-                          skills_list),
-        LegendaryCreature("Weepe", "LAND", mpf("5.13e4"), mpf("5.07e4"), mpf("9.02e3"), mpf("8.86e3"), mpf("109"),
-                          skills_list),
-        LegendaryCreature("Skaucamx", "WATER", mpf("4.89e4"), mpf("4.96e4"), mpf("9.8e3"), mpf("9.5e3"), mpf("113"),
-                          skills_list)
-    ]
-
-    # Initialising opponent trainers
-    opponent_trainers: list = [
-        CPUTrainer("CPU #1", Location(timberhallow_city, 0, 4), Team(potential_legendary_creatures[0:5])),
-        CPUTrainer("CPU #2", Location(timberhallow_city, 0, 4), Team(potential_legendary_creatures[5:10])),
-        CPUTrainer("CPU #3", Location(loststar_city, 0, 4), Team(potential_legendary_creatures[0:5])),
-        CPUTrainer("CPU #4", Location(loststar_city, 0, 4), Team(potential_legendary_creatures[5:10])),
-        CPUTrainer("CPU #5", Location(mageborough_city, 0, 4), Team(potential_legendary_creatures[0:5])),
-        CPUTrainer("CPU #6", Location(mageborough_city, 0, 4), Team(potential_legendary_creatures[5:10])),
-        CPUTrainer("CPU #7", Location(coldpass_city, 0, 4), Team(potential_legendary_creatures[0:5])),
-        CPUTrainer("CPU #8", Location(coldpass_city, 0, 4), Team(potential_legendary_creatures[5:10])),
-        CPUTrainer("CPU #9", Location(whithollow_city, 0, 4), Team(potential_legendary_creatures[0:5])),
-        CPUTrainer("CPU #10", Location(whithollow_city, 0, 4), Team(potential_legendary_creatures[5:10]))
-    ]
-
     # Automatically load saved game data
     file_name: str = "SAVED LEGENDARY CREATURE HUNTER AT MITHOTER PLANET GAME DATA"
     new_game: Game
@@ -1707,9 +5755,9 @@ def main():
         print("Current game progress:\n", str(new_game))
     except FileNotFoundError:
         name: str = input("Please enter your name: ")
-        player: Player = Player(name, Location(cities[0], 2, 2))
-        player.add_legendary_creature(potential_legendary_creatures[0])
-        new_game = Game(player, opponent_trainers, cities, potential_legendary_creatures)
+        new_game = create_new_game(name)
+
+    from datetime import datetime
 
     old_now = datetime.now()
     print("Enter 'Y' for yes.")
@@ -1725,14 +5773,13 @@ def main():
         seconds: int = time_difference.seconds
         old_now = new_now
         for city in new_game.get_cities():
-            for row in range(city.CITY_HEIGHT):
-                for col in range(city.CITY_WIDTH):
-                    curr_location: Location = Location(city, col, row)
-                    curr_tile: Tile = curr_location.get_tile()
-                    if isinstance(curr_tile, TrainingCenterTile):
-                        for legendary_creature in curr_tile.get_legendary_creatures_trained():
-                            legendary_creature.exp += curr_tile.legendary_creature_exp_per_second * seconds
-                            legendary_creature.level_up()
+            for curr_location in city.get_locations_in_mask(city.get_tile_type_mask(TrainingCenterTile)):
+                curr_tile: TrainingCenterTile = curr_location.get_tile()
+                grant_exp_to_legendary_creatures(curr_tile.get_legendary_creatures_trained(),
+                                                 curr_tile.legendary_creature_exp_per_second * seconds)
+
+        # Moving roaming opponent trainers
+        new_game.get_world_simulation().tick()
 
         # Asking the player what he/she wants to do inside the game.
         allowed: list = ["PLAY ADVENTURE MODE", "MANAGE BATTLE TEAM", "MANAGE LEGENDARY CREATURE INVENTORY",
@@ -1756,56 +5803,42 @@ def main():
                 # Clearing up the command line window
                 clear()
 
-                # Display player's stats
-                print(str(new_game.player))
+                # Display player's stats, with the inventories shown one page at a time
+                print(new_game.player.get_summary())
+                print("Enter 'CREATURES' to view your legendary creatures.")
+                print("Enter 'ITEMS' to view your items.")
+                print("Enter anything else to stop viewing your stats.")
+                view: str = input("What do you want to view? ")
+                if view == "CREATURES":
+                    view_legendary_creatures(new_game.player.legendary_creature_inventory)
+                elif view == "ITEMS":
+                    view_items(new_game.player.item_inventory)
 
             elif action == "GIVE ITEM":
                 # Clearing up the command line window
                 clear()
-                if len(new_game.player.item_inventory.get_items()) > 0:
-                    if len(new_game.player.legendary_creature_inventory.get_legendary_creatures()) > 0:
-                        print("Below is a list of legendary creatures you have.\n")
-                        for legendary_creature in new_game.player.legendary_creature_inventory.get_legendary_creatures():
-                            print(str(legendary_creature) + "\n")
-
-                        legendary_creature_index: int = int(input("Please enter the index of the legendary creature "
-                                                                  "you want to give items to: "))
-                        while legendary_creature_index < 0 or legendary_creature_index >= \
-                            len(new_game.player.legendary_creature_inventory.get_legendary_creatures()):
-                            legendary_creature_index = int(
-                                input("Sorry, invalid input! Please enter the index of the legendary creature "
-                                      "you want to give items to: "))
-
-                        chosen_legendary_creature: LegendaryCreature = \
-                            new_game.player.legendary_creature_inventory.get_legendary_creatures() \
-                        [legendary_creature_index]
-                        exp_shards: list = []  # initial value
-                        for item in new_game.player.item_inventory.get_items():
-                            if isinstance(item, EXPShard):
-                                exp_shards.append(item)
-
+                if new_game.player.item_inventory.get_number_of_items() > 0:
+                    chosen_legendary_creature: LegendaryCreature or None = \
+                        select_legendary_creature(new_game.player.legendary_creature_inventory, "give items to")
+                    if chosen_legendary_creature is not None:
                         print("Enter 'Y' for yes.")
                         print("Enter anything else for no.")
                         give_exp_shard: str = input("Do you want to give an EXP shard to this legendary creature? ")
-                        if give_exp_shard == "Y" and len(exp_shards) > 0:
-                            print("Below is a list of EXP shards you have.\n")
-                            for exp_shard in exp_shards:
-                                print(str(exp_shard) + "\n")
-
-                            exp_shard_index: int = int(input("Please enter the index of the EXP shard you want to give: "))
-                            while exp_shard_index < 0 or exp_shard_index >= len(exp_shards):
-                                exp_shard_index = int(
-                                    input("Sorry, invalid input! Please enter the index of the EXP shard you want to give: "))
-
-                            chosen_exp_shard: EXPShard = exp_shards[exp_shard_index]
+                        chosen_exp_shard: EXPShard or None = None  # initial value
+                        if give_exp_shard == "Y":
+                            chosen_exp_shard = select_item(
+                                new_game.player.item_inventory, "give", EXPShard,
+                                lambda exp_shard: "Needed for the next level: " + str(
+                                    ProgressionPlanner.get_exp_shards_needed(chosen_legendary_creature,
+                                                                             chosen_legendary_creature.level + 1,
+                                                                             [exp_shard])[0][1]))
+
+                        if chosen_exp_shard is not None:
                             chosen_legendary_creature.exp += chosen_exp_shard.exp_granted
                             chosen_legendary_creature.level_up()
                             new_game.player.remove_item_from_inventory(chosen_exp_shard)
 
-                        level_up_shards: list = []  # initial value
-                        for item in new_game.player.item_inventory.get_items():
-                            if isinstance(item, LevelUpShard):
-                                level_up_shards.append(item)
+                        level_up_shards: list = new_game.player.item_inventory.get_items_of_type(LevelUpShard)
 
                         print("Enter 'Y' for yes.")
                         print("Enter anything else for no.")
@@ -1813,7 +5846,8 @@ def main():
                         if give_level_up_shard == "Y" and len(level_up_shards) > 0:
                             print("Below is a list of level up shards you have.\n")
                             for level_up_shard in level_up_shards:
-                                print(str(level_up_shard) + "\n")
+                                print(str(level_up_shard) + "Quantity: " +
+                                      str(new_game.player.item_inventory.get_quantity(level_up_shard)) + "\n")
 
                             level_up_shard_index: int = int(input("Please enter the index of the level up shard you want to give: "))
                             while level_up_shard_index < 0 or level_up_shard_index >= len(level_up_shards):
@@ -1825,10 +5859,7 @@ def main():
                             chosen_legendary_creature.level_up()
                             new_game.player.remove_item_from_inventory(chosen_level_up_shard)
 
-                        skill_level_up_shards: list = []  # initial value
-                        for item in new_game.player.item_inventory.get_items():
-                            if isinstance(item, SkillLevelUpShard):
-                                skill_level_up_shards.append(item)
+                        skill_level_up_shards: list = new_game.player.item_inventory.get_items_of_type(SkillLevelUpShard)
 
                         print("Enter 'Y' for yes.")
                         print("Enter anything else for no.")
@@ -1838,13 +5869,10 @@ def main():
                             chosen_skill_level_up_shard: SkillLevelUpShard = skill_level_up_shards[random.randint(0,
                                                                                 len(skill_level_up_shards) - 1)]
                             skill_to_be_levelled_up: Skill = chosen_legendary_creature.get_skills()[random.randint(0, len(chosen_legendary_creature.get_skills()) - 1)]
-                            skill_to_be_levelled_up.level_up()
+                            chosen_legendary_creature.level_up_skill(skill_to_be_levelled_up)
                             new_game.player.remove_item_from_inventory(chosen_skill_level_up_shard)
 
-                        evolution_candies: list = []  # initial value
-                        for item in new_game.player.item_inventory.get_items():
-                            if isinstance(item, EvolutionCandy):
-                                evolution_candies.append(item)
+                        evolution_candies: list = new_game.player.item_inventory.get_items_of_type(EvolutionCandy)
 
                         print("Enter 'Y' for yes.")
                         print("Enter anything else for no.")
@@ -1860,64 +5888,24 @@ def main():
             elif action == "PLACE RUNE":
                 # Clearing up the command line window
                 clear()
-                if len(new_game.player.legendary_creature_inventory.get_legendary_creatures()) > 0:
-                    print("Below is a list of legendary creatures you have.\n")
-                    for legendary_creature in new_game.player.legendary_creature_inventory.get_legendary_creatures():
-                        print(str(legendary_creature) + "\n")
-
-                    legendary_creature_index: int = int(input("Please enter the index of the legendary creature "
-                                                              "you want to place a rune to: "))
-                    while legendary_creature_index < 0 or legendary_creature_index >= \
-                            len(new_game.player.legendary_creature_inventory.get_legendary_creatures()):
-                        legendary_creature_index = int(input("Sorry, invalid input! Please enter the index of the legendary creature "
-                                                                  "you want to place a rune to: "))
-
-                    chosen_legendary_creature: LegendaryCreature = \
-                        new_game.player.legendary_creature_inventory.get_legendary_creatures() \
-                            [legendary_creature_index]
-
-                    runes: list = []  # initial value
-                    for item in new_game.player.item_inventory.get_items():
-                        if isinstance(item, Rune):
-                            runes.append(item)
-
+                chosen_legendary_creature: LegendaryCreature or None = \
+                    select_legendary_creature(new_game.player.legendary_creature_inventory, "place a rune to")
+                if chosen_legendary_creature is not None:
                     print("Enter 'Y' for yes.")
                     print("Enter anything else for no.")
                     place_rune: str = input("Do you want to place a rune to " + str(chosen_legendary_creature.name) + "? ")
                     if place_rune == "Y":
-                        if len(runes) > 0:
-                            print("Below is a list of runes you have.\n")
-                            for rune in runes:
-                                print(str(rune) + "\n")
-
-                            rune_index: int = int(input("Please enter the index of the rune you want to place to "
-                                                        "this legendary creature: "))
-                            while rune_index < 0 or rune_index >= len(runes):
-                                rune_index = int(input("Sorry, invalid input! Please enter the index of the rune you want to place to "
-                                                            "this legendary creature: "))
-
-                            chosen_rune: Rune = runes[rune_index]
+                        chosen_rune: Rune or None = select_item(new_game.player.item_inventory,
+                                                                "place to this legendary creature", Rune)
+                        if chosen_rune is not None:
                             chosen_legendary_creature.place_rune(chosen_rune)
 
             elif action == "REMOVE RUNE":
                 # Clearing up the command line window
                 clear()
-                if len(new_game.player.legendary_creature_inventory.get_legendary_creatures()) > 0:
-                    print("Below is a list of legendary creatures you have.\n")
-                    for legendary_creature in new_game.player.legendary_creature_inventory.get_legendary_creatures():
-                        print(str(legendary_creature) + "\n")
-
-                    legendary_creature_index: int = int(input("Please enter the index of the legendary creature "
-                                                              "you want to remove a rune from: "))
-                    while legendary_creature_index < 0 or legendary_creature_index >= \
-                            len(new_game.player.legendary_creature_inventory.get_legendary_creatures()):
-                        legendary_creature_index = int(input("Sorry, invalid input! Please enter the index of the legendary creature "
-                                                              "you want to remove a rune from: "))
-
-                    chosen_legendary_creature: LegendaryCreature = \
-                        new_game.player.legendary_creature_inventory.get_legendary_creatures() \
-                            [legendary_creature_index]
-
+                chosen_legendary_creature: LegendaryCreature or None = \
+                    select_legendary_creature(new_game.player.legendary_creature_inventory, "remove a rune from")
+                if chosen_legendary_creature is not None:
                     slot_number: int = int(input("Please enter the slot number of the rune you want to remove: "))
                     chosen_legendary_creature.remove_rune(slot_number)
 
@@ -1946,76 +5934,35 @@ def main():
                         new_game.player.battle_team.remove_legendary_creature(to_be_removed)
 
                 if len(new_game.player.battle_team.get_legendary_creatures()) < Team.MAX_LEGENDARY_CREATURES:
-                    print("Below is a list of legendary creatures you have.\n")
-                    for legendary_creature in new_game.player.legendary_creature_inventory.get_legendary_creatures():
-                        print(str(legendary_creature) + "\n")
-
                     print("Enter 'Y' for yes.")
                     print("Enter anything else for no.")
                     add_legendary_creature: str = input("Do you want to add a legendary creature to your team? ")
                     if add_legendary_creature == "Y":
-                        legendary_creature_index: int = int(input("Please enter the index of the legendary "
-                                                        "creature you want to add to your battle team: "))
-                        while legendary_creature_index < 0 or legendary_creature_index >= \
-                            len(new_game.player.legendary_creature_inventory.get_legendary_creatures()):
-                            legendary_creature_index = int(input("Sorry, invalid input! Please enter the "
-                                        "index of the legendary creature you want to add to your battle team: "))
-
-                        to_be_added: LegendaryCreature = \
-                            new_game.player.legendary_creature_inventory.get_legendary_creatures() \
-                            [legendary_creature_index]
-                        new_game.player.legendary_creature_inventory.add_legendary_creature(to_be_added)
+                        to_be_added: LegendaryCreature or None = \
+                            select_legendary_creature(new_game.player.legendary_creature_inventory,
+                                                      "add to your battle team")
+                        if to_be_added is not None:
+                            new_game.player.add_legendary_creature_to_team(to_be_added)
 
             elif action == "MANAGE LEGENDARY CREATURE INVENTORY":
                 # Clearing up the command line window
                 clear()
-                if len(new_game.player.legendary_creature_inventory.get_legendary_creatures()) > 0:
-                    print("Below is a list of legendary creatures in your legendary creature inventory.\n")
-                    for legendary_creature in new_game.player.legendary_creature_inventory.get_legendary_creatures():
-                        print(str(legendary_creature) + "\n")
-
-                    legendary_creature_index: int = int(input("Please enter the index of the legendary creature "
-                                                              "you want to remove: "))
-                    while legendary_creature_index < 0 or legendary_creature_index >= \
-                        len(new_game.player.legendary_creature_inventory.get_legendary_creatures()):
-                        legendary_creature_index = int(input("Sorry, invalid input! Please enter the index of the legendary creature "
-                                                                  "you want to remove: "))
-
-                    to_be_removed: LegendaryCreature = new_game.player.legendary_creature_inventory.get_legendary_creatures()[legendary_creature_index]
+                to_be_removed: LegendaryCreature or None = \
+                    select_legendary_creature(new_game.player.legendary_creature_inventory, "remove")
+                if to_be_removed is not None:
                     new_game.player.legendary_creature_inventory.remove_legendary_creature(to_be_removed)
 
             elif action == "MANAGE ITEM INVENTORY":
                 # Clearing up the command line window
                 clear()
-                if len(new_game.player.item_inventory.get_items()) > 0:
-                    print("Below is a list of items in your item inventory.\n")
-                    for item in new_game.player.item_inventory.get_items():
-                        print(str(item) + "\n")
-
-                    item_index: int = int(input("Please enter the index of the item you want to sell: "))
-                    while item_index < 0 or item_index >= len(new_game.player.item_inventory.get_items()):
-                        item_index = int(input("Sorry, invalid input! "
-                                               "Please enter the index of the item you want to sell: "))
-
-                    to_be_sold: Item = new_game.player.item_inventory.get_items()[item_index]
-                    new_game.player.sell_item(to_be_sold)
-
-                    runes: list = []  # initial value
-                    for item in new_game.player.item_inventory.get_items():
-                        if isinstance(item, Rune):
-                            runes.append(item)
+                if new_game.player.item_inventory.get_number_of_items() > 0:
+                    to_be_sold: Item or None = select_item(new_game.player.item_inventory, "sell")
+                    if to_be_sold is not None:
+                        new_game.player.sell_item(to_be_sold)
 
-                    print("Below is a list of runes you have.\n")
-                    for rune in runes:
-                        print(str(rune) + "\n")
-
-                    rune_index: int = int(input("Please enter the index of the rune you want to level up: "))
-                    while rune_index < 0 or rune_index >= len(runes):
-                        rune_index = int(input("Sorry, invalid input! "
-                                               "Please enter the index of the rune you want to level up: "))
-
-                    chosen_rune: Rune = runes[rune_index]
-                    new_game.player.level_up_rune(chosen_rune)
+                    chosen_rune: Rune or None = select_item(new_game.player.item_inventory, "level up", Rune)
+                    if chosen_rune is not None:
+                        new_game.player.level_up_rune(chosen_rune)
 
             elif action == "PLAY ADVENTURE MODE":
                 # Clearing up the command line window
@@ -2027,59 +5974,30 @@ def main():
                 print("Enter 'Y' for yes.")
                 print("Enter anything else for no.")
                 move: str = input("Do you want to move? ")
+                auto_walk: AutoWalk or None = None  # encounters are rolled on the spot if the player stays
                 if move == "Y":
                     print("Enter 'UP' to move up.")
                     print("Enter 'DOWN' to move down.")
                     print("Enter 'LEFT' to move left.")
                     print("Enter 'RIGHT' to move right.")
-                    directions: list = ["UP", "DOWN", "LEFT", "RIGHT"]
-                    direction: str = input("Where do you want to go? ")
-                    while direction not in directions:
+                    print("Enter a direction followed by the number of steps, e.g. 'RIGHT x20', to walk further.")
+                    print("Enter several of these separated by commas, e.g. 'RIGHT x3, UP x2', to follow a route.")
+                    auto_walk = AutoWalk.parse(input("Where do you want to go? "))
+                    while auto_walk is None:
                         print("Enter 'UP' to move up.")
                         print("Enter 'DOWN' to move down.")
                         print("Enter 'LEFT' to move left.")
                         print("Enter 'RIGHT' to move right.")
-                        direction = input("Sorry, invalid direction! Where do you want to go? ")
-
-                    if direction == "UP":
-                        if new_game.player.location.y > 0:
-                            new_location: Location = Location(new_game.player.location.city,
-                                                              new_game.player.location.x,
-                                                              new_game.player.location.y - 1)
-                            if not isinstance(new_location.get_tile(), WaterTile):
-                                new_game.player.location.get_tile().remove_game_character(new_game.player)
-                                new_location.get_tile().add_game_character(new_game.player)
-                                new_game.player.location = new_location
-
-                    elif direction == "DOWN":
-                        if new_game.player.location.y < new_game.player.location.city.CITY_HEIGHT - 1:
-                            new_location: Location = Location(new_game.player.location.city,
-                                                              new_game.player.location.x,
-                                                              new_game.player.location.y + 1)
-                            if not isinstance(new_location.get_tile(), WaterTile):
-                                new_game.player.location.get_tile().remove_game_character(new_game.player)
-                                new_location.get_tile().add_game_character(new_game.player)
-                                new_game.player.location = new_location
-
-                    elif direction == "LEFT":
-                        if new_game.player.location.x > 0:
-                            new_location: Location = Location(new_game.player.location.city,
-                                                              new_game.player.location.x - 1,
-                                                              new_game.player.location.y)
-                            if not isinstance(new_location.get_tile(), WaterTile):
-                                new_game.player.location.get_tile().remove_game_character(new_game.player)
-                                new_location.get_tile().add_game_character(new_game.player)
-                                new_game.player.location = new_location
-
-                    elif direction == "RIGHT":
-                        if new_game.player.location.x < new_game.player.location.city.CITY_WIDTH - 1:
-                            new_location: Location = Location(new_game.player.location.city,
-                                                              new_game.player.location.x + 1,
-                                                              new_game.player.location.y)
-                            if not isinstance(new_location.get_tile(), WaterTile):
-                                new_game.player.location.get_tile().remove_game_character(new_game.player)
-                                new_location.get_tile().add_game_character(new_game.player)
-                                new_game.player.location = new_location
+                        print("Enter a direction followed by the number of steps, e.g. 'RIGHT x20', to walk further.")
+                        print("Enter several of these separated by commas, e.g. 'RIGHT x3, UP x2', to follow a route.")
+                        auto_walk = AutoWalk.parse(input("Sorry, invalid direction! Where do you want to go? "))
+
+                    auto_walk.walk(new_game.player)
+                    if auto_walk.steps_taken == 0:
+                        auto_walk = None  # the player could not move and stays
+                    elif auto_walk.steps_taken > 1:
+                        print("You walked " + str(auto_walk.steps_taken) + " steps to " +
+                              str(new_game.player.location) + ".")
 
                 # Checking the destination tile
                 if isinstance(new_game.player.location.get_tile().portal, Portal):
@@ -2101,23 +6019,11 @@ def main():
                     if place_legendary_creature == "Y":
                         # Clearing up the command line window
                         clear()
-                        # Printing a list of legendary creatures the player has.
-                        print("Below is a list of legendary creatures you have.\n")
-                        for curr_legendary_creature in \
-                                new_game.player.legendary_creature_inventory.get_legendary_creatures():
-                            print(str(curr_legendary_creature) + "\n")
-
-                        legendary_creature_index: int = int(input("Please enter the index of the "
-                                                                      "legendary creature you want to place: "))
-                        while legendary_creature_index < 0 or legendary_creature_index >= \
-                                len(new_game.player.legendary_creature_inventory.get_legendary_creatures()):
-                            legendary_creature_index = int(input("Sorry, invalid input! Please enter the "
-                                            "index of the legendary creature you want to place: "))
-
-                        to_be_placed: LegendaryCreature = \
-                            new_game.player.legendary_creature_inventory.get_legendary_creatures() \
-                                [legendary_creature_index]
-                        training_center_tile.add_legendary_creature(to_be_placed)
+                        to_be_placed: LegendaryCreature or None = \
+                            select_legendary_creature(new_game.player.legendary_creature_inventory,
+                                                      "place in the training center")
+                        if to_be_placed is not None:
+                            training_center_tile.add_legendary_creature(to_be_placed)
 
                     # Asking whether the player wants to take a legendary creature from the training center or not.
                     print("Enter 'Y' for yes.")
@@ -2171,19 +6077,21 @@ def main():
 
                 elif isinstance(new_game.player.location.get_tile(), GrassTile):
                     # Determining whether the player encounters a wild battle or not
-                    encounter_wild_battle: bool = random.random() <= 0.5
-                    if encounter_wild_battle:
+                    encounter_wild_battle: bool = auto_walk.wild_encounter if auto_walk is not None else \
+                        random.random() <= AutoWalk.WILD_ENCOUNTER_CHANCE
+                    wild_legendary_creature: LegendaryCreature or None = \
+                        new_game.create_encountered_legendary_creature(new_game.player.location.city, "GRASS") \
+                        if encounter_wild_battle else None
+                    if wild_legendary_creature is not None:
                         # Clearing up the command line window
                         clear()
-                        wild_legendary_creature: LegendaryCreature = \
-                            new_game.get_potential_legendary_creatures()[random.randint(0,
-                                len(new_game.get_potential_legendary_creatures()) - 1)]
                         print("A wild " + str(wild_legendary_creature.name) + " appears!")
 
                         # Start a wild battle
                         wild_battle: WildBattle = WildBattle(new_game.player.battle_team, wild_legendary_creature)
                         flee: bool = False
-                        while wild_battle.winner is None and not flee and not \
+                        offer_auto_battle(wild_battle)
+                        while wild_battle.check_winner() is None and not flee and not \
                                 wild_battle.wild_legendary_creature_caught:
                             # Printing out the stats of legendary creatures in both teams
                             print("Below are the stats of all legendary creatures in player's team.\n")
@@ -2212,22 +6120,14 @@ def main():
                                     flee = True  # the player flees from the battle
 
                                 if wild_battle_action == "CATCH WILD LEGENDARY CREATURE":
-                                    balls_list: list = [item for item in
-                                                        new_game.player.item_inventory.get_items()
-                                                        if isinstance(item, Ball)]
-                                    print("Below is a list of balls you have.\n")
-                                    for ball in balls_list:
-                                        print(str(ball) + "\n")
-
-                                    ball_index: int = int(input("Please enter the index of the ball you "
-                                                                "want to use: "))
-                                    while ball_index < 0 or ball_index >= len(balls_list):
-                                        ball_index = int(input("Sorry, invalid input! Please enter the index of "
-                                                                "the ball you want to use: "))
-
-                                    chosen_ball: Ball = balls_list[ball_index]
-                                    if new_game.player.catch_legendary_creature(wild_legendary_creature,
-                                                                                chosen_ball):
+                                    hp_share: float = CatchAnalytics.get_hp_share(wild_legendary_creature)
+                                    chosen_ball: Ball or None = select_item(
+                                        new_game.player.item_inventory, "use", Ball,
+                                        lambda ball: "Catch Chance Now: " +
+                                        str(round(CatchAnalytics.get_catch_chance(ball, hp_share) * 100, 2)) + "%")
+                                    if chosen_ball is not None and \
+                                            new_game.player.catch_legendary_creature(wild_legendary_creature,
+                                                                                     chosen_ball):
                                         wild_battle.wild_legendary_creature_caught = True
 
                                 elif wild_battle_action == "NORMAL ATTACK":
@@ -2248,7 +6148,7 @@ def main():
                                     if len(usable_skills) > 0:
                                         print("Below is a list of skills you can use.\n")
                                         for skill in usable_skills:
-                                            print(str(skill) + "\n")
+                                            print(render_text(skill, wild_battle.whose_turn.get_skill_level(skill)) + "\n")
 
                                         skill_index: int = int(input("Please enter the index of the skill you "
                                                                         "want to use: "))
@@ -2295,20 +6195,21 @@ def main():
                                         moving_legendary_creature: LegendaryCreature = wild_battle.whose_turn
                                         moving_legendary_creature.use_skill(moving_legendary_creature, skill_to_use)
 
-                            # Recovering magic points
-                            wild_battle.whose_turn.recover_magic_points()
+                            # Recovering magic points and ending the turn
+                            wild_battle.end_turn()
 
                         if wild_battle.winner == new_game.player.battle_team:
                             print("Congratulations! You won the battle!")
+                            print("Rewards:\n" + str(wild_battle.reward))
                             new_game.player.coins += wild_battle.reward.player_coin_gain
                             new_game.player.exp += wild_battle.reward.player_exp_gain
                             new_game.player.level_up()
-                            for legendary_creature in new_game.player.battle_team.get_legendary_creatures():
-                                legendary_creature.exp += wild_battle.reward.legendary_creature_exp_gain
-                                legendary_creature.level_up()
+                            grant_exp_to_legendary_creatures(new_game.player.battle_team.get_legendary_creatures(),
+                                                             wild_battle.reward.legendary_creature_exp_gain)
                         elif wild_battle.winner == wild_battle.team2:
                             print("You lost the battle")
                         else:
+                            wild_battle.end_status_effects()
                             if wild_battle.wild_legendary_creature_caught:
                                 print("You have successfully caught " + str(wild_legendary_creature.name))
                             elif flee:
@@ -2316,42 +6217,37 @@ def main():
                             else:
                                 pass  # Do nothing
 
-                        for legendary_creature in wild_battle.team1.get_legendary_creatures():
-                            legendary_creature.restore()
-
-                        for legendary_creature in wild_battle.team2.get_legendary_creatures():
-                            legendary_creature.restore()
+                        restore_legendary_creatures(wild_battle.team1.get_legendary_creatures() +
+                                                    wild_battle.team2.get_legendary_creatures())
 
                 else:
                     pass  # Do nothing
 
                 # Checking whether the player is near a water tile or not
-                near_water_tile: bool = False  # initial value
-                above: Location = Location(new_game.player.location.city,
-                                           new_game.player.location.x, new_game.player.location.y - 1)
-                below: Location = Location(new_game.player.location.city,
-                                           new_game.player.location.x, new_game.player.location.y + 1)
-                left: Location = Location(new_game.player.location.city,
-                                           new_game.player.location.x - 1, new_game.player.location.y)
-                right: Location = Location(new_game.player.location.city,
-                                          new_game.player.location.x + 1, new_game.player.location.y)
-                if isinstance(above, WaterTile) or isinstance(below, WaterTile) or isinstance(left, WaterTile) \
-                        or isinstance(right, WaterTile):
-                    near_water_tile = True
+                player_location: Location = new_game.player.location
+                near_water_tile: bool = player_location.city.is_in_mask(
+                    player_location.city.get_water_adjacent_mask(), player_location.x, player_location.y)
 
                 if near_water_tile:
                     # Checking whether the player has a fishing rod or not
-                    fishing_rods: list = []  # initial value
-                    for item in new_game.player.item_inventory.get_items():
-                        if isinstance(item, FishingRod):
-                            fishing_rods.append(item)
+                    fishing_rods: list = new_game.player.item_inventory.get_items_of_type(FishingRod)
+
+                    go_fishing: str = "N"  # the player cannot go fishing without a fishing rod
+                    if len(fishing_rods) > 0:
+                        print("Enter 'Y' for yes.")
+                        print("Enter anything else for no.")
+                        go_fishing = input("Do you want to go fishing? ")
 
-                    print("Enter 'Y' for yes.")
-                    print("Enter anything else for no.")
-                    go_fishing: str = input("Do you want to go fishing? ")
                     if go_fishing == "Y":
                         # Clearing up the command line window
                         clear()
+                        print("Below is a list of fishing rods you have.\n")
+                        for i, (fishing_rod, encounter_chance, expected_casts) in enumerate(
+                                CatchAnalytics([], fishing_rods).get_fishing_statistics()):
+                            print("#" + str(i) + ": " + str(fishing_rod.name) + ", " +
+                                  str(round(encounter_chance * 100, 2)) + "% encounter chance per cast, " +
+                                  str(round(expected_casts, 2)) + " casts expected")
+
                         fishing_rod_index: int = int(input("Please enter the index of the fishing rod you want to "
                                                            "use: "))
                         while fishing_rod_index < 0 or fishing_rod_index >= len(fishing_rods):
@@ -2361,21 +6257,17 @@ def main():
                         chosen_fishing_rod: FishingRod = fishing_rods[fishing_rod_index]
                         encounter_wild_battle: bool = random.random() <= \
                                                       chosen_fishing_rod.encounter_legendary_creature_chance
-                        if encounter_wild_battle:
-                            potential_legendary_creatures: list = []  # initial value
-                            for legendary_creature in potential_legendary_creatures:
-                                if legendary_creature.creature_type == "WATER":
-                                    potential_legendary_creatures.append(legendary_creature)
-
-                            wild_legendary_creature: LegendaryCreature = potential_legendary_creatures \
-                                [random.randint(0, len(potential_legendary_creatures) - 1)]
-
+                        wild_legendary_creature: LegendaryCreature or None = \
+                            new_game.create_encountered_legendary_creature(new_game.player.location.city, "WATER") \
+                            if encounter_wild_battle else None
+                        if wild_legendary_creature is not None:
                             print("A wild " + str(wild_legendary_creature.name) + " appears!")
 
                             # Start a wild battle
                             wild_battle: WildBattle = WildBattle(new_game.player.battle_team, wild_legendary_creature)
                             flee: bool = False
-                            while wild_battle.winner is None and not flee and not \
+                            offer_auto_battle(wild_battle)
+                            while wild_battle.check_winner() is None and not flee and not \
                                     wild_battle.wild_legendary_creature_caught:
                                 # Printing out the stats of legendary creatures in both teams
                                 print("Below are the stats of all legendary creatures in player's team.\n")
@@ -2404,22 +6296,14 @@ def main():
                                         flee = True  # the player flees from the battle
 
                                     if wild_battle_action == "CATCH WILD LEGENDARY CREATURE":
-                                        balls_list: list = [item for item in
-                                                            new_game.player.item_inventory.get_items()
-                                                            if isinstance(item, Ball)]
-                                        print("Below is a list of balls you have.\n")
-                                        for ball in balls_list:
-                                            print(str(ball) + "\n")
-
-                                        ball_index: int = int(input("Please enter the index of the ball you "
-                                                                    "want to use: "))
-                                        while ball_index < 0 or ball_index >= len(balls_list):
-                                            ball_index = int(input("Sorry, invalid input! Please enter the index of "
-                                                                   "the ball you want to use: "))
-
-                                        chosen_ball: Ball = balls_list[ball_index]
-                                        if new_game.player.catch_legendary_creature(wild_legendary_creature,
-                                                                                    chosen_ball):
+                                        hp_share: float = CatchAnalytics.get_hp_share(wild_legendary_creature)
+                                        chosen_ball: Ball or None = select_item(
+                                            new_game.player.item_inventory, "use", Ball,
+                                            lambda ball: "Catch Chance Now: " +
+                                            str(round(CatchAnalytics.get_catch_chance(ball, hp_share) * 100, 2)) + "%")
+                                        if chosen_ball is not None and \
+                                                new_game.player.catch_legendary_creature(wild_legendary_creature,
+                                                                                         chosen_ball):
                                             wild_battle.wild_legendary_creature_caught = True
 
                                     elif wild_battle_action == "NORMAL ATTACK":
@@ -2440,7 +6324,7 @@ def main():
                                         if len(usable_skills) > 0:
                                             print("Below is a list of skills you can use.\n")
                                             for skill in usable_skills:
-                                                print(str(skill) + "\n")
+                                                print(render_text(skill, wild_battle.whose_turn.get_skill_level(skill)) + "\n")
 
                                             skill_index: int = int(input("Please enter the index of the skill you "
                                                                          "want to use: "))
@@ -2487,20 +6371,21 @@ def main():
                                             moving_legendary_creature: LegendaryCreature = wild_battle.whose_turn
                                             moving_legendary_creature.use_skill(moving_legendary_creature, skill_to_use)
 
-                                # Recovering magic points
-                                wild_battle.whose_turn.recover_magic_points()
+                                # Recovering magic points and ending the turn
+                                wild_battle.end_turn()
 
                             if wild_battle.winner == new_game.player.battle_team:
                                 print("Congratulations! You won the battle!")
+                                print("Rewards:\n" + str(wild_battle.reward))
                                 new_game.player.coins += wild_battle.reward.player_coin_gain
                                 new_game.player.exp += wild_battle.reward.player_exp_gain
                                 new_game.player.level_up()
-                                for legendary_creature in new_game.player.battle_team.get_legendary_creatures():
-                                    legendary_creature.exp += wild_battle.reward.legendary_creature_exp_gain
-                                    legendary_creature.level_up()
+                                grant_exp_to_legendary_creatures(new_game.player.battle_team.get_legendary_creatures(),
+                                                                 wild_battle.reward.legendary_creature_exp_gain)
                             elif wild_battle.winner == wild_battle.team2:
                                 print("You lost the battle")
                             else:
+                                wild_battle.end_status_effects()
                                 if wild_battle.wild_legendary_creature_caught:
                                     print("You have successfully caught " + str(wild_legendary_creature.name))
                                 elif flee:
@@ -2508,11 +6393,8 @@ def main():
                                 else:
                                     pass  # Do nothing
 
-                            for legendary_creature in wild_battle.team1.get_legendary_creatures():
-                                legendary_creature.restore()
-
-                            for legendary_creature in wild_battle.team2.get_legendary_creatures():
-                                legendary_creature.restore()
+                            restore_legendary_creatures(wild_battle.team1.get_legendary_creatures() +
+                                                        wild_battle.team2.get_legendary_creatures())
 
                 # Checking whether the player is at the same tile as an NPC or not.
                 curr_player_tile: Tile = new_game.player.location.get_tile()
@@ -2532,7 +6414,8 @@ def main():
                         other_trainers.append(game_character)
 
                 if len(other_trainers) > 0:
-                    encounter_trainer_battle: bool = random.random() <= 0.5
+                    encounter_trainer_battle: bool = auto_walk.trainer_encounter if auto_walk is not None else \
+                        random.random() <= AutoWalk.TRAINER_ENCOUNTER_CHANCE
                     if encounter_trainer_battle:
                         # Clearing up the command line window
                         clear()
@@ -2541,7 +6424,8 @@ def main():
                               str(chosen_trainer.name) + " starts!")
                         trainer_battle: TrainerBattle = TrainerBattle(new_game.player.battle_team,
                                                                       chosen_trainer.battle_team)
-                        while trainer_battle.winner is not None:
+                        offer_auto_battle(trainer_battle)
+                        while trainer_battle.check_winner() is None:
                             # Printing out the stats of legendary creatures in both teams
                             print("Below are the stats of all legendary creatures in player's team.\n")
                             for legendary_creature in trainer_battle.team1.get_legendary_creatures():
@@ -2572,7 +6456,7 @@ def main():
                                     if len(usable_skills) > 0:
                                         print("Below is a list of skills you can use.\n")
                                         for skill in usable_skills:
-                                            print(str(skill) + "\n")
+                                            print(render_text(skill, trainer_battle.whose_turn.get_skill_level(skill)) + "\n")
 
                                         skill_index: int = int(input("Please enter the index of the skill you "
                                                                      "want to use: "))
@@ -2670,27 +6554,24 @@ def main():
                                         moving_legendary_creature: LegendaryCreature = trainer_battle.whose_turn
                                         moving_legendary_creature.use_skill(moving_legendary_creature, skill_to_use)
 
-                            # Recovering magic points
-                            trainer_battle.whose_turn.recover_magic_points()
+                            # Recovering magic points and ending the turn
+                            trainer_battle.end_turn()
 
                         if trainer_battle.winner == new_game.player.battle_team:
                             print("Congratulations! You won the battle!")
+                            print("Rewards:\n" + str(trainer_battle.reward))
                             new_game.player.coins += trainer_battle.reward.player_coin_gain
                             new_game.player.exp += trainer_battle.reward.player_exp_gain
                             new_game.player.level_up()
-                            for legendary_creature in new_game.player.battle_team.get_legendary_creatures():
-                                legendary_creature.exp += trainer_battle.reward.legendary_creature_exp_gain
-                                legendary_creature.level_up()
+                            grant_exp_to_legendary_creatures(new_game.player.battle_team.get_legendary_creatures(),
+                                                             trainer_battle.reward.legendary_creature_exp_gain)
 
                             chosen_trainer.get_beaten()
                         elif trainer_battle.winner == trainer_battle.team2:
                             print("You lost the battle")
 
-                        for legendary_creature in trainer_battle.team1.get_legendary_creatures():
-                            legendary_creature.restore()
-
-                        for legendary_creature in trainer_battle.team2.get_legendary_creatures():
-                            legendary_creature.restore()
+                        restore_legendary_creatures(trainer_battle.team1.get_legendary_creatures() +
+                                                    trainer_battle.team2.get_legendary_creatures())
 
             else:
                 pass  # Do nothing
@@ -0,0 +1,34 @@
+"""
+This file contains fixtures shared by the tests of the game "Legendary Creature Hunter at Mithoter Planet".
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "code"))
+
+import legendary_creature_hunter_at_mithoter_planet as game  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def game_directory(tmp_path, monkeypatch):
+    """
+    Running every test in an empty folder, so that saved game data, content packs and caches written by one test are
+    not seen by another.
+    """
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(game, "world_catalogue_data", None)
+    return tmp_path
+
+
+@pytest.fixture
+def new_game():
+    return game.create_new_game("Player")
+
+
+@pytest.fixture
+def legendary_species(new_game):
+    return new_game.get_potential_legendary_creatures()
@@ -0,0 +1,105 @@
+import random
+import sys
+
+import pytest
+
+import legendary_creature_hunter_at_mithoter_planet as game
+
+
+def create_city(rows):
+    # S: sand, G: grass, W: water, H: shop, T: training center, P: sand with a portal
+    tile_types = {"S": game.SandTile, "G": game.GrassTile, "W": game.WaterTile, "P": game.SandTile,
+                  "H": lambda: game.ShopTile([]), "T": lambda: game.TrainingCenterTile(game.mpf("1"))}
+    city = game.City("Test City", len(rows), len(rows[0]), [[tile_types[name]() for name in row] for row in rows])
+    for y, row in enumerate(rows):
+        for x, name in enumerate(row):
+            if name == "P":
+                city.get_tiles()[y][x].portal = game.Portal(city.get_location(x, y), city.get_location(0, 0))
+
+    city.tiles_changed()
+    return city
+
+
+@pytest.fixture
+def city():
+    return create_city(["SSSSSW",
+                        "SGGSPS",
+                        "SHTSSS"])
+
+
+def walk(city, x, y, command):
+    player = game.Player("Player", city.get_location(x, y))
+    auto_walk = game.AutoWalk.parse(command)
+    auto_walk.walk(player)
+    return player, auto_walk
+
+
+def test_walks_are_parsed():
+    assert game.AutoWalk.parse("RIGHT x20")._AutoWalk__moves == [("RIGHT", 20)]
+    assert game.AutoWalk.parse("RIGHT x3, UP x2")._AutoWalk__moves == [("RIGHT", 3), ("UP", 2)]
+    assert game.AutoWalk.parse("UP")._AutoWalk__moves == [("UP", 1)]
+
+
+@pytest.mark.parametrize("command", ["", "JUMP", "RIGHT 20", "RIGHT x", "RIGHT x-1", "RIGHT x2 x3", "RIGHT,",
+                                     "right x2"])
+def test_invalid_walks_are_rejected(command):
+    assert game.AutoWalk.parse(command) is None
+
+
+def test_walks_are_at_most_max_steps_long():
+    assert game.AutoWalk.parse("UP x" + str(game.AutoWalk.MAX_STEPS)) is not None
+    assert game.AutoWalk.parse("UP x" + str(game.AutoWalk.MAX_STEPS) + ", DOWN") is None
+
+
+@pytest.fixture
+def no_encounters(monkeypatch):
+    monkeypatch.setattr(game.AutoWalk, "sample_steps_until_encounter", staticmethod(lambda chance: sys.maxsize))
+
+
+@pytest.mark.parametrize("x, y, command, stop_reason, steps_taken, end", [
+    (0, 0, "RIGHT x20", "BLOCKED", 4, (4, 0)),  # water
+    (0, 0, "LEFT", "BLOCKED", 0, (0, 0)),  # city edge
+    (0, 0, "RIGHT x2, UP", "BLOCKED", 2, (2, 0)),
+    (3, 1, "RIGHT x2", "PORTAL", 1, (4, 1)),
+    (0, 2, "RIGHT x3", "SHOP", 1, (1, 2)),
+    (5, 2, "LEFT x5", "TRAINING CENTER", 3, (2, 2)),
+    (3, 0, "DOWN x2, RIGHT x2", "FINISHED", 4, (5, 2)),
+])
+def test_walks_stop_where_they_should(city, no_encounters, x, y, command, stop_reason, steps_taken, end):
+    player, auto_walk = walk(city, x, y, command)
+    assert (auto_walk.stop_reason, auto_walk.steps_taken) == (stop_reason, steps_taken)
+    assert player.location is city.get_location(*end)
+    assert player in player.location.get_tile().get_game_characters()
+    assert not auto_walk.wild_encounter and not auto_walk.trainer_encounter
+
+
+@pytest.mark.parametrize("steps_until_encounter, stop_reason, end", [(2, "ENCOUNTER", (2, 1)), (3, "FINISHED", (3, 1))])
+def test_wild_encounters_happen_on_the_sampled_grass_step(city, monkeypatch, steps_until_encounter, stop_reason, end):
+    monkeypatch.setattr(game.AutoWalk, "sample_steps_until_encounter",
+                        staticmethod(lambda chance: steps_until_encounter))
+    player, auto_walk = walk(city, 0, 1, "RIGHT x3")
+    assert auto_walk.stop_reason == stop_reason
+    assert auto_walk.wild_encounter == (stop_reason == "ENCOUNTER")
+    assert not auto_walk.trainer_encounter
+    assert player.location is city.get_location(*end)
+
+
+def test_trainer_encounters_happen_on_the_sampled_step_with_trainers(city, monkeypatch):
+    monkeypatch.setattr(game.AutoWalk, "sample_steps_until_encounter", staticmethod(lambda chance: 2))
+    for x in [2, 3]:
+        game.CPUTrainer("CPU", city.get_location(x, 0), game.Team([]))
+
+    player, auto_walk = walk(city, 0, 0, "RIGHT x4")
+    assert (auto_walk.stop_reason, auto_walk.steps_taken) == ("ENCOUNTER", 3)
+    assert auto_walk.trainer_encounter and not auto_walk.wild_encounter
+    assert player.location is city.get_location(3, 0)
+
+
+def test_steps_until_encounter_follow_the_geometric_distribution():
+    assert game.AutoWalk.sample_steps_until_encounter(1) == 1
+    assert game.AutoWalk.sample_steps_until_encounter(0) == sys.maxsize
+    random.seed(0)
+    samples = [game.AutoWalk.sample_steps_until_encounter(0.25) for i in range(20000)]
+    assert min(samples) == 1
+    # The mean of 20000 samples with p = 0.25 has a standard deviation of about 0.024.
+    assert abs(sum(samples) / len(samples) - 4) < 0.1
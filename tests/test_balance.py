@@ -0,0 +1,21 @@
+import random
+
+import legendary_creature_hunter_at_mithoter_planet as game
+
+
+def test_balance_points_do_not_touch_the_random_module(legendary_species):
+    job = (legendary_species[:3], {"damage_multiplier_scale": 2}, 1, 4, 200, 7)
+    random.seed(0)
+    state = random.getstate()
+    win_rates = game.run_balance_point(job)
+    assert random.getstate() == state
+    random.seed(1)
+    assert game.run_balance_point(job) == win_rates
+
+
+def test_balance_cache_keys_change_with_the_code(legendary_species, monkeypatch):
+    sweep = game.BalanceSweep(legendary_species[:3], {"damage_multiplier_scale": [1, 2]})
+    parameter_hash = sweep.get_parameter_hash({"damage_multiplier_scale": 2})
+    assert sweep.get_parameter_hash({"damage_multiplier_scale": 2}) == parameter_hash
+    monkeypatch.setattr(game, "code_hash", "0" * 64)
+    assert sweep.get_parameter_hash({"damage_multiplier_scale": 2}) != parameter_hash
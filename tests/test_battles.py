@@ -0,0 +1,99 @@
+import random
+
+import pytest
+
+import legendary_creature_hunter_at_mithoter_planet as game
+
+
+def get_teams(legendary_species):
+    return game.Team([legendary_species[0].create_legendary_creature(5)]), \
+        game.Team([legendary_species[1].create_legendary_creature(1)])
+
+
+def test_status_effects_end_with_the_battle(legendary_species):
+    random.seed(0)
+    team1, team2 = get_teams(legendary_species)
+    for i in range(2):
+        battle = game.TrainerBattle(team1, team2)
+        team1.get_legendary_creatures()[0].add_status_effect(
+            game.StatusEffect("Rage", "attack_power_percentage_up", game.mpf("50"), 1000))
+        assert battle.resolve(game.AutoBattlePolicy(), game.AutoBattlePolicy()) is team1
+        for legendary_creature in team1.get_legendary_creatures() + team2.get_legendary_creatures():
+            assert legendary_creature.get_status_effects() == []
+            assert legendary_creature.status_effect_timer is None
+            assert legendary_creature.attack_power_percentage_up == 0
+
+        game.restore_legendary_creatures(team1.get_legendary_creatures() + team2.get_legendary_creatures())
+
+
+def test_status_effects_left_by_an_unfinished_battle_expire_in_the_next_one(legendary_species):
+    random.seed(0)
+    team1, team2 = get_teams(legendary_species)
+    legendary_creature = team1.get_legendary_creatures()[0]
+    game.TrainerBattle(team1, team2)
+    legendary_creature.add_status_effect(game.StatusEffect("Rage", "attack_power_percentage_up", game.mpf("50"), 3))
+    battle = game.TrainerBattle(team1, team2)
+    assert legendary_creature.status_effect_timer is battle.status_effect_timer
+    for i in range(3):
+        assert legendary_creature.attack_power_percentage_up == 50
+        battle.whose_turn = legendary_creature
+        battle.end_turn()
+
+    assert legendary_creature.get_status_effects() == []
+    assert legendary_creature.attack_power_percentage_up == 0
+
+
+def test_battle_policies_must_choose_moves(legendary_species):
+    with pytest.raises(TypeError):
+        game.BattlePolicy()
+
+    random.seed(0)
+    team1, team2 = get_teams(legendary_species)
+    battle = game.TrainerBattle(team1, team2)
+    assert battle.resolve(game.RandomBattlePolicy(), game.RandomBattlePolicy()) is team1
+
+
+def test_normal_attacks_deal_the_damage_auto_battles_expect(legendary_species):
+    user, target = legendary_species[0].create_legendary_creature(5), legendary_species[1].create_legendary_creature(1)
+    expected_damage = game.Action.calculate_normal_attack_raw_damage(user, target)
+    hp = target.curr_hp
+    assert game.Action("NORMAL ATTACK").execute(user, target)
+    assert hp - target.curr_hp == max(expected_damage, 0)
+
+
+def test_unfinished_auto_battles_are_handed_back_to_the_player(legendary_species, monkeypatch, capsys):
+    random.seed(0)
+    team1, team2 = get_teams(legendary_species)
+    battle = game.TrainerBattle(team1, team2)
+    monkeypatch.setattr("builtins.input", lambda prompt: "Y")
+    game.offer_auto_battle(battle, 1)
+    assert battle.winner is None
+    assert "did not end within 1 turns" in capsys.readouterr().out
+    game.offer_auto_battle(battle)
+    assert battle.winner is team1
+    assert "The battle ended after" in capsys.readouterr().out
+
+
+def test_raid_battles_find_the_same_enemies_as_scanning_both_teams(legendary_species):
+    random.seed(0)
+    teams = [game.RaidTeam([legendary_species[(i * 7 + j) % len(legendary_species)].create_legendary_creature(1 + i % 4)
+                        for i in range(40)]) for j in range(2)]
+    battle = game.RaidBattle(teams[0], teams[1])
+    policy = game.RandomBattlePolicy()
+    for turn in range(300):
+        battle.get_someone_to_move()
+        if battle.check_winner() is not None or battle.whose_turn is None:
+            break
+
+        user = battle.whose_turn
+        enemies = [enemy for enemy in battle.get_opposing_teams(user)[1].get_legendary_creatures() if
+                   enemy.get_is_alive()]
+        assert sorted(enemy.legendary_creature_id for enemy in battle.get_alive_enemies(user)) == \
+            sorted(enemy.legendary_creature_id for enemy in enemies)
+        assert battle.get_weakest_enemy(user).curr_hp == min(enemy.curr_hp for enemy in enemies)
+        assert game.Battle.get_threat(battle.get_most_threatening_enemy(user)) == \
+            max(game.Battle.get_threat(enemy) for enemy in enemies)
+        battle.take_turn(policy)
+        battle.end_turn()
+
+    assert battle.turns > 100
@@ -0,0 +1,55 @@
+import random
+
+import legendary_creature_hunter_at_mithoter_planet as game
+
+
+def test_thrown_balls_are_not_used_up(new_game, legendary_species):
+    player = new_game.player
+    ball = game.Ball("Ball", "A ball.", game.mpf("1000"), 0)
+    legendary_creature = legendary_species[0].create_legendary_creature()
+    assert not player.catch_legendary_creature(legendary_creature, ball)
+    player.add_item_to_inventory(ball)
+    assert not player.catch_legendary_creature(legendary_creature, ball)
+    assert player.item_inventory.has_item(ball)
+    legendary_creature.curr_hp = game.mpf("0")
+    assert player.catch_legendary_creature(legendary_creature, ball)
+    assert player.item_inventory.has_item(ball)
+
+
+def test_simulated_catches_match_the_catch_analytics(new_game, legendary_species):
+    random.seed(0)
+    player = new_game.player
+    ball = game.Ball("Ball", "A ball.", game.mpf("1000"), 0.2)
+    legendary_creature = legendary_species[0].create_legendary_creature()
+    legendary_creature.curr_hp = legendary_creature.max_hp * game.mpf("0.9")
+    hp_share = game.CatchAnalytics.get_hp_share(legendary_creature)
+    statistics = game.CatchAnalytics([ball]).get_ball_statistics(hp_share, 0.9)
+    ball_statistics, catch_chance, expected_throws, coin_cost, throws_needed = statistics[0]
+    player.add_item_to_inventory(ball)
+    number_of_catches = 3000
+    throws = []
+    for i in range(number_of_catches):
+        number_of_throws = 1
+        while not player.catch_legendary_creature(legendary_creature, ball):
+            number_of_throws += 1
+
+        throws.append(number_of_throws)
+        player.remove_legendary_creature_from_team(legendary_creature)
+        player.remove_legendary_creature(legendary_creature)
+
+    assert abs(catch_chance - 0.3) < 1e-9
+    # The mean of 3000 geometric samples with p = 0.3 has a standard deviation of about 0.05.
+    assert abs(sum(throws) / number_of_catches - expected_throws) < 0.2
+    assert abs(sum(1 for number_of_throws in throws if number_of_throws <= throws_needed) / number_of_catches - 0.9) < \
+        0.03
+    assert coin_cost == ball.coin_cost
+    assert player.item_inventory.get_number_of_items() == 1
+
+
+def test_balls_which_cannot_catch_come_last():
+    useless_ball = game.Ball("Useless Ball", "A ball.", game.mpf("10"), -2)
+    ball = game.Ball("Ball", "A ball.", game.mpf("1000"), 0.2)
+    catch_analytics = game.CatchAnalytics([useless_ball, ball])
+    assert [statistic[0] for statistic in catch_analytics.get_ball_statistics()] == [ball, useless_ball]
+    assert catch_analytics.get_best_ball() is ball
+    assert "\nBall: " + str(ball.coin_cost) + " coins, 20.0% per throw, 5.0 throws expected" in str(catch_analytics)
@@ -0,0 +1,61 @@
+import random
+
+import pytest
+
+import legendary_creature_hunter_at_mithoter_planet as game
+
+
+def create_city(rows):
+    # W: water, G: grass, S: sand
+    tile_types = {"W": game.WaterTile, "G": game.GrassTile, "S": game.SandTile}
+    return game.City("Test City", len(rows), len(rows[0]), [[tile_types[name]() for name in row] for row in rows])
+
+
+def get_water_adjacent_locations(city):
+    tiles = city.get_tiles()
+    return {(x, y) for y in range(city.CITY_HEIGHT) for x in range(city.CITY_WIDTH) if
+            any(0 <= x + dx < city.CITY_WIDTH and 0 <= y + dy < city.CITY_HEIGHT and
+                isinstance(tiles[y + dy][x + dx], game.WaterTile) for dx, dy in game.WorldSimulation.DIRECTIONS)}
+
+
+def get_mask_locations(city, mask):
+    return {(location.x, location.y) for location in city.get_locations_in_mask(mask)}
+
+
+def get_random_rows(seed, height, width):
+    random_generator = random.Random(seed)
+    return ["".join(random_generator.choice("WGS") for x in range(width)) for y in range(height)]
+
+
+@pytest.mark.parametrize("rows", [
+    ["WSSSW",
+     "SSSSS",
+     "WSSSW"],  # water in the corners
+    ["SSSSW",
+     "SSSSS",
+     "WSSSS"],  # water at the right and left edges, next to the other edge of the row below or above
+    ["SWS"],
+    ["S",
+     "W",
+     "S"],
+    ["W"],
+    ["SSS",
+     "SSS"],
+] + [get_random_rows(seed, 3 + seed % 4, 2 + seed % 5) for seed in range(20)])
+def test_water_adjacent_mask_matches_a_neighbour_scan(rows):
+    city = create_city(rows)
+    assert get_mask_locations(city, city.get_water_adjacent_mask()) == get_water_adjacent_locations(city)
+    for tile_type in [game.WaterTile, game.GrassTile, game.SandTile]:
+        assert get_mask_locations(city, city.get_tile_type_mask(tile_type)) == \
+            {(x, y) for y, row in enumerate(city.get_tiles()) for x, tile in enumerate(row) if
+             isinstance(tile, tile_type)}
+
+
+def test_masks_follow_changed_tiles():
+    city = create_city(["SSS",
+                        "SSS"])
+    assert city.get_water_adjacent_mask() == 0
+    city.set_tile(2, 0, game.WaterTile())
+    assert get_mask_locations(city, city.get_water_adjacent_mask()) == {(1, 0), (2, 1)}
+    assert not city.is_in_mask(city.get_water_adjacent_mask(), 0, 1)
+    assert not city.is_in_mask(city.get_water_adjacent_mask(), 3, 0)
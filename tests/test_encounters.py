@@ -0,0 +1,47 @@
+import pickle
+import random
+
+import legendary_creature_hunter_at_mithoter_planet as game
+
+
+def get_city(new_game, name):
+    return next(city for city in new_game.get_cities() if city.name == name)
+
+
+def test_alias_sampler_follows_the_weights(legendary_species):
+    weights = [1.0, 2.0, 3.0, 4.0, 0.5]
+    encounter_table = game.EncounterTable(legendary_species[:5], weights, [1] * 5, [1] * 5)
+    random.seed(0)
+    number_of_draws = 50000
+    counts = [0] * len(weights)
+    for i in range(number_of_draws):
+        counts[encounter_table.choose_entry()] += 1
+
+    for count, weight in zip(counts, weights):
+        expected = number_of_draws * weight / sum(weights)
+        assert abs(count - expected) < 4 * (expected * (1 - weight / sum(weights))) ** 0.5
+
+
+def test_shipped_encounter_entry(new_game):
+    encounter_table = new_game.get_encounter_table(get_city(new_game, "Timberhallow"), "GRASS")
+    assert [legendary_species.name for legendary_species in encounter_table.get_legendary_species()] == \
+        ["Crondiff", "Silechnou", "Grifngu"]
+    assert encounter_table.get_probabilities() == {"Crondiff": 0.5, "Silechnou": 2 / 6, "Grifngu": 1 / 6}
+    random.seed(0)
+    for i in range(100):
+        legendary_creature = new_game.create_encountered_legendary_creature(get_city(new_game, "Timberhallow"),
+                                                                             "GRASS")
+        assert 1 <= legendary_creature.level <= (2 if legendary_creature.name == "Silechnou" else
+                                                 3 if legendary_creature.name == "Crondiff" else 4)
+
+
+def test_encounter_tables_use_the_species_of_the_game(new_game, monkeypatch):
+    loaded_game = pickle.loads(pickle.dumps(new_game))
+    monkeypatch.setattr(game, "get_world_catalogue", None)  # the world catalogue is not needed any more
+    city = get_city(loaded_game, "Loststar")
+    assert set(loaded_game.get_encounter_table(city, "WATER").get_legendary_species()) == \
+        {legendary_species for legendary_species in loaded_game.get_potential_legendary_creatures() if
+         legendary_species.creature_type == "WATER"}
+    assert all(legendary_species in loaded_game.get_potential_legendary_creatures() for legendary_species in
+               loaded_game.get_encounter_table(get_city(loaded_game, "Timberhallow"), "GRASS")
+               .get_legendary_species())
@@ -0,0 +1,55 @@
+import os
+import subprocess
+import sys
+
+import legendary_creature_hunter_at_mithoter_planet as game
+
+
+# Most microseconds importing the game may take with the "float" numeric backend, measured with -X importtime. Importing
+# it took about 8 ms when this budget was set.
+IMPORT_TIME_BUDGET: int = 50000
+
+# Libraries which are only imported by the code paths that use them
+LAZILY_IMPORTED_MODULES: list = ["mpmath", "numpy", "uuid", "pickle", "datetime", "mmap", "concurrent.futures",
+                                 "hashlib"]
+
+
+def get_import_times(pycache_directory):
+    # type: (str) -> dict
+    """
+    Importing the game in a fresh process.
+    :param pycache_directory: the directory to write compiled bytecode to
+    :return: a dict of names of imported modules to their cumulative import times in microseconds
+    """
+
+    environment: dict = dict(os.environ, LEGENDARY_CREATURE_HUNTER_NUMERIC_BACKEND="float",
+                             PYTHONPYCACHEPREFIX=pycache_directory)
+    environment.pop("PYTHONDONTWRITEBYTECODE", None)
+    # The first import compiles the module, which is not counted.
+    subprocess.run([sys.executable, "-c", "import " + game.__name__],
+                   cwd=os.path.dirname(os.path.abspath(game.__file__)), env=environment, check=True)
+    output: str = subprocess.run([sys.executable, "-X", "importtime", "-c", "import " + game.__name__],
+                                 cwd=os.path.dirname(os.path.abspath(game.__file__)), env=environment, check=True,
+                                 capture_output=True, text=True).stderr
+    import_times: dict = {}
+    for line in output.splitlines():
+        if line.startswith("import time:") and "|" in line and "cumulative" not in line:
+            self_time, cumulative_time, name = line[len("import time:"):].split("|")
+            import_times[name.strip()] = int(cumulative_time)
+
+    return import_times
+
+
+def test_import_time_is_within_budget(tmp_path):
+    assert get_import_times(str(tmp_path))[game.__name__] <= IMPORT_TIME_BUDGET
+
+
+def test_heavy_libraries_are_not_imported(tmp_path):
+    import_times: dict = get_import_times(str(tmp_path))
+    assert [name for name in LAZILY_IMPORTED_MODULES if name in import_times] == []
+
+
+def test_mpf_is_the_number_type_of_the_backend():
+    number_type: type = game.get_mpf()
+    assert game.mpf is number_type
+    assert isinstance(game.mpf("1.5"), number_type)
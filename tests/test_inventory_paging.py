@@ -0,0 +1,35 @@
+import legendary_creature_hunter_at_mithoter_planet as game
+
+
+def answer(monkeypatch, answers):
+    answers = iter(answers)
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(answers))
+
+
+def get_item_inventory():
+    item_inventory = game.ItemInventory()
+    item_inventory.add_item(game.Rune("Rune", "A rune.", game.mpf("1e6"), 1, 1), 25)
+    item_inventory.add_item(game.Ball("Ball", "A ball.", game.mpf("1e3"), 0.5), 3)
+    return item_inventory
+
+
+def test_select_item_pages_through_items_of_a_type(monkeypatch):
+    item_inventory = get_item_inventory()
+    answer(monkeypatch, ["NEXT", "NEXT", "NEXT", "4"])
+    assert game.select_item(item_inventory, "level up", game.Rune) is item_inventory.get_items()[24]
+    answer(monkeypatch, ["0"])
+    assert game.select_item(item_inventory, "use", game.Ball) is item_inventory.get_items()[25]
+    answer(monkeypatch, ["9"])
+    assert game.select_item(item_inventory, "use", game.Ball) is None
+
+
+def test_view_items_gets_each_page_once(monkeypatch, capsys):
+    item_inventory = get_item_inventory()
+    pages = []
+    get_page = game.ItemInventory.get_page
+    monkeypatch.setattr(game.ItemInventory, "get_page", lambda self, *args, **kwargs: pages.append(args) or
+                        get_page(self, *args, **kwargs))
+    answer(monkeypatch, ["", "Y", "NEXT", "NEXT", "STOP"])
+    game.view_items(item_inventory)
+    assert [page_number for page_number, page_size in pages] == [0, 1, 2]
+    assert "#5: Ball (Coin Cost: 1000.0) x3" in capsys.readouterr().out
@@ -0,0 +1,87 @@
+import pickle
+
+import pytest
+
+import legendary_creature_hunter_at_mithoter_planet as game
+
+
+@pytest.fixture
+def balls():
+    return [game.Ball("Ball " + str(rate), "A ball.", game.mpf("1e3"), rate) for rate in [0.5, 0.1, 0.9, 0.3]]
+
+
+@pytest.fixture
+def runes():
+    return [game.Rune("Rune", "A rune.", game.mpf("1e6"), rating, slot_number) for rating, slot_number in
+            [(3, 2), (1, 2), (6, 1), (2, 5)]]
+
+
+@pytest.fixture
+def item_inventory(balls, runes):
+    item_inventory = game.ItemInventory()
+    for i, ball in enumerate(balls):
+        item_inventory.add_item(ball, i + 1)
+
+    for rune in runes:
+        item_inventory.add_item(rune)
+
+    item_inventory.add_item(game.EXPShard("EXP Shard", "An EXP shard.", game.mpf("1e5"), game.mpf("1e6")), 2)
+    return item_inventory
+
+
+def test_stackable_items_are_stored_once(item_inventory, balls):
+    assert item_inventory.add_item(balls[0], 4) == item_inventory.add_item(balls[0])
+    assert item_inventory.get_quantity(balls[0]) == 6
+    assert len(item_inventory.get_items_of_type(game.Ball)) == len(balls)
+    assert item_inventory.get_number_of_items() == 1 + 2 + 3 + 4 + 4 + 2 + 5
+
+
+def test_every_rune_gets_its_own_instance(item_inventory, runes):
+    rune_instances = item_inventory.get_items_of_type(game.Rune)
+    assert len(rune_instances) == len(runes)
+    assert all(isinstance(rune_instance, game.RuneInstance) for rune_instance in rune_instances)
+    item_inventory.add_item(runes[0], 2)
+    assert len(item_inventory.get_items_of_type(game.Rune)) == len(runes) + 2
+
+
+def test_sorted_views(item_inventory):
+    assert [ball.catch_success_rate for ball in item_inventory.get_sorted_items(game.Ball)] == [0.1, 0.3, 0.5, 0.9]
+    assert [(rune.slot_number, rune.rating) for rune in item_inventory.get_sorted_items(game.Rune)] == \
+        [(1, 6), (2, 1), (2, 3), (5, 2)]
+    assert item_inventory.get_sorted_items(game.EXPShard) == []
+
+
+def test_items_removed_down_to_zero_leave_every_index(item_inventory, balls):
+    number_of_items = item_inventory.get_number_of_items()
+    assert item_inventory.remove_item(balls[2], 2)
+    assert item_inventory.get_quantity(balls[2]) == 1
+    assert not item_inventory.remove_item(balls[2], 2)
+    assert item_inventory.remove_item(balls[2])
+    assert not item_inventory.has_item(balls[2])
+    assert item_inventory.get_quantity(balls[2]) == 0
+    assert balls[2] not in item_inventory.get_items()
+    assert balls[2] not in item_inventory.get_items_of_type(game.Ball)
+    assert balls[2] not in item_inventory.get_sorted_items(game.Ball)
+    assert balls[2] not in item_inventory.get_page(0, 100, game.Ball)
+    assert item_inventory.get_number_of_items() == number_of_items - 3
+    assert not item_inventory.remove_item(balls[2])
+
+    rune_instance = item_inventory.get_sorted_items(game.Rune)[1]
+    assert item_inventory.remove_item(rune_instance)
+    assert rune_instance not in item_inventory.get_items_of_type(game.Rune)
+    assert [(rune.slot_number, rune.rating) for rune in item_inventory.get_sorted_items(game.Rune)] == \
+        [(1, 6), (2, 3), (5, 2)]
+
+
+def test_loaded_inventories_keep_their_indexes(item_inventory, balls):
+    loaded = pickle.loads(pickle.dumps(item_inventory))
+    assert loaded.get_number_of_items() == item_inventory.get_number_of_items()
+    assert [item.name for item in loaded.get_items()] == [item.name for item in item_inventory.get_items()]
+    assert [ball.catch_success_rate for ball in loaded.get_sorted_items(game.Ball)] == [0.1, 0.3, 0.5, 0.9]
+    loaded_ball = loaded.get_sorted_items(game.Ball)[0]
+    assert loaded.get_quantity(loaded_ball) == 2
+    loaded.add_item(loaded_ball)
+    assert loaded.get_quantity(loaded_ball) == 3
+    assert len(loaded.get_items_of_type(game.Ball)) == len(balls)
+    assert loaded.remove_item(loaded_ball, 3)
+    assert [ball.catch_success_rate for ball in loaded.get_sorted_items(game.Ball)] == [0.3, 0.5, 0.9]
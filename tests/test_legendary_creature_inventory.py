@@ -0,0 +1,88 @@
+import pickle
+
+import pytest
+
+import legendary_creature_hunter_at_mithoter_planet as game
+
+
+@pytest.fixture
+def inventory(legendary_species):
+    inventory = game.LegendaryCreatureInventory()
+    for i in range(30):
+        inventory.add_legendary_creature(legendary_species[i % len(legendary_species)].create_legendary_creature(
+            1 + i % 4))
+
+    return inventory
+
+
+def get_ids(legendary_creatures):
+    return [legendary_creature.legendary_creature_id for legendary_creature in legendary_creatures]
+
+
+def assert_indexes_are_sorted(inventory):
+    legendary_creatures = inventory.get_legendary_creatures()
+    for attribute in game.LegendaryCreatureInventory.INDEXED_ATTRIBUTES:
+        expected = sorted(legendary_creatures, key=lambda legendary_creature: (
+            getattr(legendary_creature, attribute), legendary_creature.legendary_creature_id))
+        assert get_ids(inventory.get_legendary_creatures_in_range(attribute)) == get_ids(expected)
+        assert get_ids(inventory.get_top_legendary_creatures(attribute, 5)) == get_ids(expected[::-1][:5])
+        middle = getattr(expected[len(expected) // 2], attribute)
+        assert get_ids(inventory.get_legendary_creatures_in_range(attribute, middle, middle)) == \
+            get_ids(legendary_creature for legendary_creature in expected if
+                    getattr(legendary_creature, attribute) == middle)
+        assert get_ids(inventory.get_legendary_creatures_in_range(attribute, min_value=middle)) == \
+            get_ids(legendary_creature for legendary_creature in expected if
+                    getattr(legendary_creature, attribute) >= middle)
+
+
+def level_up(legendary_creature):
+    legendary_creature.exp = legendary_creature.required_exp
+    legendary_creature.level_up()
+
+
+def test_indexes_follow_stat_changes(inventory):
+    legendary_creatures = inventory.get_legendary_creatures()
+    assert_indexes_are_sorted(inventory)
+    level_up(legendary_creatures[0])
+    level_up(legendary_creatures[1])
+    assert_indexes_are_sorted(inventory)
+    legendary_creatures[2].evolve()
+    assert_indexes_are_sorted(inventory)
+    rune = game.RuneInstance(game.Rune("Rune", "A rune.", game.mpf("1e6"), 6, 1))
+    legendary_creatures[3].place_rune(rune)
+    assert_indexes_are_sorted(inventory)
+    legendary_creatures[3].remove_rune(rune.slot_number)
+    assert_indexes_are_sorted(inventory)
+
+
+def test_removed_legendary_creatures_are_no_longer_indexed(inventory):
+    legendary_creature = inventory.get_legendary_creatures()[0]
+    assert inventory.remove_legendary_creature(legendary_creature)
+    level_up(legendary_creature)
+    assert legendary_creature.legendary_creature_id not in get_ids(inventory.get_legendary_creatures_in_range("level"))
+    assert_indexes_are_sorted(inventory)
+
+
+def test_loaded_inventories_keep_following_stat_changes(inventory):
+    loaded = pickle.loads(pickle.dumps(inventory))
+    assert_indexes_are_sorted(loaded)
+    for legendary_creature in loaded.get_legendary_creatures()[:3]:
+        level_up(legendary_creature)
+        legendary_creature.evolve()
+
+    assert_indexes_are_sorted(loaded)
+
+
+def test_legacy_inventories_are_indexed(legendary_species):
+    legendary_creatures = [legendary_species[i % len(legendary_species)].create_legendary_creature(1 + i % 3) for i in
+                           range(10)]
+    inventory = game.LegendaryCreatureInventory.__new__(game.LegendaryCreatureInventory)
+    inventory.__setstate__({"_LegendaryCreatureInventory__legendary_creatures": legendary_creatures})
+    assert sorted(get_ids(inventory.get_legendary_creatures())) == sorted(get_ids(legendary_creatures))
+    assert_indexes_are_sorted(inventory)
+    level_up(legendary_creatures[0])
+    assert_indexes_are_sorted(inventory)
+    assert get_ids(inventory.get_page(0, 100, name_prefix=legendary_creatures[0].name)) == \
+        get_ids(sorted((legendary_creature for legendary_creature in legendary_creatures if
+                        legendary_creature.name == legendary_creatures[0].name),
+                       key=lambda legendary_creature: legendary_creature.legendary_creature_id))
@@ -0,0 +1,37 @@
+import pytest
+
+import legendary_creature_hunter_at_mithoter_planet as game
+
+STATS = ["level", "max_hp", "curr_hp", "max_magic_points", "curr_magic_points", "attack_power", "defense",
+         "attack_speed", "required_exp"]
+
+
+@pytest.mark.parametrize("level", [1, 2, 5, 10, 20])
+def test_created_legendary_creatures_match_levelled_up_ones(legendary_species, level):
+    for species in legendary_species:
+        created = species.create_legendary_creature(level)
+        levelled_up = species.create_legendary_creature()
+        for i in range(level - 1):
+            levelled_up.exp = levelled_up.required_exp
+            levelled_up.level_up()
+
+        # Multiplying by the stat growth at once rounds differently from multiplying level by level.
+        assert [float(getattr(created, stat)) for stat in STATS] == \
+            pytest.approx([float(getattr(levelled_up, stat)) for stat in STATS], rel=1e-12)
+
+
+def test_legendary_creatures_of_a_species_do_not_share_state(legendary_species):
+    species = next(species for species in legendary_species if len(species.get_skills()) > 0)
+    first, second = species.create_legendary_creature(), species.create_legendary_creature()
+    first.get_skills().pop()
+    first.level_up_skill(second.get_skills()[0])
+    first.place_rune(game.RuneInstance(game.Rune("Rune", "A rune.", game.mpf("1e6"), 1, 1)))
+    first.add_status_effect(game.StatusEffect("Rage", "attack_power_percentage_up", game.mpf("50"), 3))
+    first.exp += first.required_exp
+    first.level_up()
+    assert len(second.get_skills()) == len(species.get_skills())
+    assert second.get_skill_level(second.get_skills()[0]) == 1
+    assert len(second.get_runes()) == 0
+    assert second.get_status_effects() == []
+    assert (second.level, second.max_hp, second.attack_power) == (1, species.max_hp, species.attack_power)
+    assert first.legendary_creature_id != second.legendary_creature_id
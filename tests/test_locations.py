@@ -0,0 +1,20 @@
+import pytest
+
+import legendary_creature_hunter_at_mithoter_planet as game
+
+
+def test_locations_are_interned(new_game):
+    city = new_game.get_cities()[0]
+    location = game.Location(city, 1, 2)
+    assert city.get_location(1, 2) is location
+    assert location.get_tile() is city.get_tiles()[2][1]
+
+
+@pytest.mark.parametrize("dx, dy", [(-1, 0), (0, -1), (1, 0), (0, 1)])
+def test_locations_outside_the_city_are_rejected(new_game, dx, dy):
+    city = new_game.get_cities()[0]
+    x = -1 if dx < 0 else city.CITY_WIDTH if dx > 0 else 0
+    y = -1 if dy < 0 else city.CITY_HEIGHT if dy > 0 else 0
+    for i in range(2):
+        with pytest.raises(ValueError):
+            city.get_location(x, y)
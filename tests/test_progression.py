@@ -0,0 +1,51 @@
+import pytest
+
+import legendary_creature_hunter_at_mithoter_planet as game
+
+
+def assert_exp_needed_levels_up(levelling, target_level):
+    exp_needed = game.ProgressionPlanner.get_exp_needed_by(levelling, target_level)
+    assert exp_needed > 0
+    short = levelling.clone()
+    short.exp += exp_needed * game.mpf("0.999")
+    short.level_up()
+    assert short.level < target_level
+    levelled_up = levelling.clone()
+    levelled_up.exp += exp_needed
+    levelled_up.level_up()
+    assert levelled_up.level == target_level
+
+
+@pytest.mark.parametrize("level", [1, 2, 5])
+@pytest.mark.parametrize("levels_gained", [1, 2, 4])
+def test_legendary_creatures_reach_the_planned_level(legendary_species, level, levels_gained):
+    legendary_creature = legendary_species[0].create_legendary_creature(level)
+    legendary_creature.exp = legendary_creature.required_exp * game.mpf("0.4")
+    assert_exp_needed_levels_up(legendary_creature, level + levels_gained)
+
+
+@pytest.mark.parametrize("levels_gained", [1, 3])
+def test_trainers_reach_the_planned_level(new_game, levels_gained):
+    player = new_game.player
+    player.exp += player.required_exp / 2
+    player.level_up()
+    assert_exp_needed_levels_up(player, player.level + levels_gained)
+
+
+def test_no_exp_is_needed_for_levels_already_reached(legendary_species):
+    legendary_creature = legendary_species[0].create_legendary_creature(3)
+    assert game.ProgressionPlanner.get_exp_needed_by(legendary_creature, 3) == 0
+
+
+@pytest.mark.skipif(game.numeric_backend != "float", reason="only floats overflow")
+def test_levelling_stops_once_the_exp_required_is_infinite(new_game, legendary_species):
+    legendary_creature = legendary_species[0].create_legendary_creature()
+    player = new_game.player
+    for levelling in [legendary_creature, player]:
+        levelling.exp = game.mpf("inf")
+        levelling.level_up()
+        assert levelling.required_exp == game.mpf("inf")
+        assert 1 < levelling.level < 400
+
+    assert game.power_of_ten(400) == game.mpf("inf")
+    assert legendary_species[0].create_legendary_creature(30).required_exp == game.mpf("inf")
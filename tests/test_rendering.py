@@ -0,0 +1,101 @@
+import io
+import random
+
+import pytest
+
+import legendary_creature_hunter_at_mithoter_planet as game
+
+
+@pytest.fixture
+def no_nested_str(monkeypatch):
+    """
+    Making str() fail for every class of the game, so that rendering only passes if nested objects write into the
+    shared stream.
+    """
+
+    def fail(self):
+        raise AssertionError(type(self).__name__ + " was rendered with str()")
+
+    for cls in vars(game).values():
+        if isinstance(cls, type) and cls.__module__ == game.__name__ and "__str__" in vars(cls):
+            monkeypatch.setattr(cls, "__str__", fail)
+
+
+def test_str_renders_write_text(new_game):
+    stream = io.StringIO()
+    stream.write("Saved game:\n")
+    new_game.write_text(stream)
+    assert stream.getvalue() == "Saved game:\n" + str(new_game)
+
+
+def test_nested_objects_write_into_the_shared_stream(new_game, legendary_species, no_nested_str):
+    legendary_creature = legendary_species[0].create_legendary_creature()
+    legendary_creature.place_rune(game.RuneInstance(game.Rune("Rune", "A rune.", game.mpf("1e6"), 1, 1)))
+    new_game.player.add_legendary_creature(legendary_creature)
+    battle = game.TrainerBattle(game.Team([legendary_creature]),
+                                game.Team([legendary_species[1].create_legendary_creature()]))
+    for obj in [new_game, battle, legendary_creature]:
+        assert len(game.render_text(obj)) > 0
+
+
+def test_skills_are_numbered(legendary_species):
+    legendary_creature = legendary_species[0].create_legendary_creature()
+    text = game.render_text(legendary_creature)
+    for skill_number in range(1, len(legendary_creature.get_skills()) + 1):
+        assert "Skill #" + str(skill_number) + "\n" in text
+
+
+def get_rows_to_render(city):
+    return [row for row, row_text in enumerate(city._City__row_texts) if row_text is None]
+
+
+def render_again(city):
+    city.tiles_changed()
+    return str(city)
+
+
+def test_cities_only_render_changed_rows_again(new_game):
+    player = new_game.player
+    city = player.location.city
+    str(city)
+    assert get_rows_to_render(city) == []
+    x, y = player.location.x, player.location.y
+    for dx, dy in game.WorldSimulation.DIRECTIONS:
+        if city.is_in_mask(city.get_tile_type_mask(game.LandTile), x + dx, y + dy):
+            player.move_to(city.get_location(x + dx, y + dy))
+            assert get_rows_to_render(city) == sorted({y, y + dy})
+            text = str(city)
+            assert get_rows_to_render(city) == []
+            assert text == render_again(city)
+            player.move_to(city.get_location(x, y))
+            str(city)
+
+    city.set_tile(0, city.CITY_HEIGHT - 1, game.SandTile())
+    assert get_rows_to_render(city) == [city.CITY_HEIGHT - 1]
+    text = str(city)
+    assert text == render_again(city)
+
+
+def test_cities_render_moves_of_roaming_trainers(new_game):
+    cities = new_game.get_cities()
+    world_simulation = new_game.get_world_simulation()
+    random.seed(0)
+    moves = 0
+    for i in range(10):
+        for city in cities:
+            str(city)
+
+        old_locations = [trainer.location for trainer in world_simulation.get_game_characters()]
+        world_simulation.tick()
+        changed_rows = set()
+        for old_location, trainer in zip(old_locations, world_simulation.get_game_characters()):
+            if trainer.location is not old_location:
+                changed_rows |= {(old_location.city, old_location.y), (trainer.location.city, trainer.location.y)}
+                moves += 1
+
+        for city in cities:
+            assert get_rows_to_render(city) == sorted(row for row_city, row in changed_rows if row_city is city)
+            text = str(city)
+            assert text == render_again(city)
+
+    assert moves > 0
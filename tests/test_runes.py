@@ -0,0 +1,63 @@
+import legendary_creature_hunter_at_mithoter_planet as game
+
+
+def get_rune():
+    return game.Rune("Rune", "A rune.", game.mpf("1e6"), 3, 2)
+
+
+def get_legacy_rune(level):
+    """
+    Creating a rune as it is loaded from saved game data from before rune instances existed, which was levelled up in
+    place to the given level.
+    """
+
+    rune_instance = game.RuneInstance(get_rune())
+    for i in range(level - 1):
+        rune_instance.level_up()
+
+    legacy_rune = game.Rune.__new__(game.Rune)
+    legacy_rune.__setstate__(dict(get_rune().__getstate__(), stat_increase=rune_instance.stat_increase,
+                                  level=rune_instance.level, level_up_coin_cost=rune_instance.level_up_coin_cost))
+    return legacy_rune, rune_instance
+
+
+def test_levelling_up_a_rune_instance_keeps_the_definition():
+    rune = get_rune()
+    rune_instance = game.RuneInstance(rune)
+    rune_instance.level_up()
+    assert rune_instance.level == 2
+    assert rune_instance.stat_increase.attack_speed_up == 12
+    assert rune.stat_increase.attack_speed_up == 6
+
+
+def test_legacy_runes_in_item_inventory_become_rune_instances():
+    legacy_runes = [get_legacy_rune(level) for level in range(1, 5)]
+    item_inventory = game.ItemInventory.__new__(game.ItemInventory)
+    item_inventory.__setstate__({"_ItemInventory__items": [legacy_rune for legacy_rune, rune_instance in legacy_runes]})
+    runes = item_inventory.get_items()
+    assert all(type(rune) is game.RuneInstance for rune in runes)
+    assert [(rune.level, rune.level_up_coin_cost) for rune in runes] == \
+        [(rune_instance.level, rune_instance.level_up_coin_cost) for legacy_rune, rune_instance in legacy_runes]
+
+
+def test_legacy_runes_placed_on_legendary_creature_become_rune_instances(legendary_species):
+    legacy_rune, rune_instance = get_legacy_rune(3)
+    legendary_creature = legendary_species[0].create_legendary_creature()
+    legendary_creature.place_rune(legacy_rune)
+    loaded_legendary_creature = game.LegendaryCreature.__new__(game.LegendaryCreature)
+    loaded_legendary_creature.__setstate__(legendary_creature.__getstate__())
+    loaded_rune = loaded_legendary_creature.get_runes()[legacy_rune.slot_number]
+    assert type(loaded_rune) is game.RuneInstance
+    assert (loaded_rune.level, loaded_rune.level_up_coin_cost) == (3, rune_instance.level_up_coin_cost)
+    assert loaded_rune.stat_increase is legacy_rune.stat_increase
+
+
+def test_rune_instances_are_runes_without_slots_for_the_definition():
+    rune_instance = game.RuneInstance(get_rune())
+    assert isinstance(rune_instance, game.Rune) and isinstance(rune_instance, game.Item)
+    assert game.RuneInstance.get_slot_names() == ("rune", "level", "level_up_coin_cost", "stat_increase")
+    assert (rune_instance.name, rune_instance.rating, rune_instance.slot_number) == ("Rune", 3, 2)
+    item_inventory = game.ItemInventory()
+    item_inventory.add_item(rune_instance)
+    assert item_inventory.get_items_of_type(game.Rune) == [rune_instance]
+    assert item_inventory.get_sorted_items(game.Rune) == [rune_instance]
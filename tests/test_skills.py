@@ -0,0 +1,80 @@
+import pytest
+
+import legendary_creature_hunter_at_mithoter_planet as game
+
+
+def get_values(damage_multiplier):
+    return [float(getattr(damage_multiplier, name)) for name in game.DamageMultiplier.__slots__]
+
+
+def find_species_with_skill(legendary_species, skill_type):
+    for species in legendary_species:
+        legendary_creature = species.create_legendary_creature()
+        skills = [skill for skill in legendary_creature.get_skills() if isinstance(skill, skill_type)]
+        if len(skills) > 0:
+            return species, skills[0]
+
+    pytest.skip("no legendary species has a skill of type " + skill_type.__name__)
+
+
+def test_levelling_up_a_skill_only_changes_its_legendary_creature(legendary_species):
+    species, attack_skill = find_species_with_skill(legendary_species, game.AttackSkill)
+    levelled_up, other = species.create_legendary_creature(), species.create_legendary_creature()
+    skill = next(skill for skill in levelled_up.get_skills() if skill.name == attack_skill.name)
+    values = get_values(skill.damage_multiplier)
+    assert levelled_up.level_up_skill(skill)
+    assert levelled_up.get_skill_level(skill) == 2
+    assert other.get_skill_level(skill) == 1
+    assert get_values(skill.damage_multiplier) == values
+    assert get_values(skill.get_damage_multiplier(other.get_skill_level(skill))) == values
+    assert get_values(skill.get_damage_multiplier(levelled_up.get_skill_level(skill))) == \
+        pytest.approx([value if "attack_speed" in name else value * 1.25 for name, value in
+                       zip(game.DamageMultiplier.__slots__, values)])
+
+
+def test_levelling_up_a_heal_skill_only_changes_its_legendary_creature(legendary_species):
+    species, heal_skill = find_species_with_skill(legendary_species, game.HealSkill)
+    levelled_up, other = species.create_legendary_creature(), species.create_legendary_creature()
+    skill = next(skill for skill in levelled_up.get_skills() if skill.name == heal_skill.name)
+    heal_amount = skill.heal_amount
+    levelled_up.level_up_skill(skill)
+    levelled_up.level_up_skill(skill)
+    assert skill.heal_amount == heal_amount
+    assert skill.get_heal_amount(other.get_skill_level(skill)) == heal_amount
+    assert skill.get_heal_amount(levelled_up.get_skill_level(skill)) == heal_amount * 4
+
+
+def restore_legacy_skill(skill, level):
+    state = skill.__getstate__()
+    state["level"] = level
+    restored = type(skill).__new__(type(skill))
+    restored.__setstate__(state)
+    return restored
+
+
+def test_legacy_levelled_up_attack_skills_are_brought_back_to_level_1():
+    damage_multiplier = game.DamageMultiplier(*[game.mpf(str(i + 1)) for i in range(10)])
+    skill = game.AttackSkill("Attack", "An attack.", game.mpf("10"), damage_multiplier.scale(game.mpf("1.25") ** 2),
+                             False)
+    restored = restore_legacy_skill(skill, 3)
+    assert get_values(restored.damage_multiplier) == pytest.approx(get_values(damage_multiplier))
+    assert get_values(restored.get_damage_multiplier(3)) == pytest.approx(get_values(skill.damage_multiplier))
+
+
+def test_legacy_levelled_up_heal_skills_are_brought_back_to_level_1():
+    skill = game.HealSkill("Heal", "A heal.", game.mpf("10"), game.mpf("400"))
+    restored = restore_legacy_skill(skill, 3)
+    assert restored.heal_amount == 100
+    assert restored.get_heal_amount(3) == 400
+
+
+def test_saved_legendary_creatures_with_private_attributes_named_after_legendary_creature(legendary_species):
+    legendary_creature = legendary_species[0].create_legendary_creature()
+    legendary_creature.level_up_skill(legendary_creature.get_skills()[0])
+    state = {name.replace("_LegendaryCreatureBase__", "_LegendaryCreature__"): value for name, value in
+             legendary_creature.__getstate__().items()}
+    loaded_legendary_creature = game.LegendaryCreature.__new__(game.LegendaryCreature)
+    loaded_legendary_creature.__setstate__(state)
+    assert loaded_legendary_creature.get_skills() == legendary_creature.get_skills()
+    assert loaded_legendary_creature.get_skill_level(legendary_creature.get_skills()[0]) == 2
+    assert str(loaded_legendary_creature) == str(legendary_creature)
@@ -0,0 +1,85 @@
+import sys
+
+import pytest
+
+import legendary_creature_hunter_at_mithoter_planet as game
+
+pytest.importorskip("numpy")
+
+
+def get_stats(legendary_creature):
+    return [getattr(legendary_creature, column) for column in game.LegendaryCreatureStore.COLUMNS]
+
+
+def test_removing_moves_the_last_row_into_the_gap(legendary_species):
+    store = game.LegendaryCreatureStore()
+    legendary_creatures = [species.create_legendary_creature(level) for level, species in
+                           enumerate(legendary_species[:3], 1)]
+    stored_legendary_creatures = [store.add_legendary_creature(legendary_creature) for legendary_creature in
+                                  legendary_creatures]
+    removed = store.remove_legendary_creature(stored_legendary_creatures[0])
+    assert type(removed) is game.LegendaryCreature
+    assert get_stats(removed) == get_stats(legendary_creatures[0])
+    assert store.get_legendary_creatures() == [stored_legendary_creatures[2], stored_legendary_creatures[1]]
+    assert stored_legendary_creatures[2].row == 0
+    assert get_stats(stored_legendary_creatures[2]) == get_stats(legendary_creatures[2])
+    assert store.remove_legendary_creature(stored_legendary_creatures[0]) is None
+    with pytest.raises(ValueError):
+        stored_legendary_creatures[0].level
+
+
+def test_grant_exp_matches_level_up(legendary_species):
+    store = game.LegendaryCreatureStore()
+    legendary_creatures = [species.create_legendary_creature() for species in legendary_species[:4]]
+    stored_legendary_creatures = [store.add_legendary_creature(legendary_creature) for legendary_creature in
+                                  legendary_creatures]
+    for exp in [game.mpf("5"), game.mpf("1e6"), game.mpf("1e20")]:
+        store.grant_exp(exp)
+        for legendary_creature, stored_legendary_creature in zip(legendary_creatures, stored_legendary_creatures):
+            legendary_creature.exp += exp
+            legendary_creature.level_up()
+            assert get_stats(stored_legendary_creature) == get_stats(legendary_creature)
+
+    assert stored_legendary_creatures[0].level > 1
+
+
+def test_restore(legendary_species):
+    store = game.LegendaryCreatureStore()
+    stored_legendary_creatures = [store.add_legendary_creature(species.create_legendary_creature()) for species in
+                                  legendary_species[:2]]
+    for stored_legendary_creature in stored_legendary_creatures:
+        stored_legendary_creature.curr_hp /= 2
+        stored_legendary_creature.curr_magic_points = game.mpf("0")
+        stored_legendary_creature.attack_gauge = game.mpf("0.5")
+        stored_legendary_creature.add_status_effect(
+            game.StatusEffect("Rage", "attack_power_percentage_up", game.mpf("50"), 3))
+
+    store.restore(stored_legendary_creatures[:1])
+    assert stored_legendary_creatures[0].curr_hp == stored_legendary_creatures[0].max_hp
+    assert stored_legendary_creatures[0].curr_magic_points == stored_legendary_creatures[0].max_magic_points
+    assert stored_legendary_creatures[0].attack_gauge == game.LegendaryCreature.MIN_ATTACK_GAUGE
+    assert stored_legendary_creatures[0].get_status_effects() == []
+    assert stored_legendary_creatures[0].attack_power_percentage_up == 0
+    assert stored_legendary_creatures[1].curr_hp < stored_legendary_creatures[1].max_hp
+    assert stored_legendary_creatures[1].attack_power_percentage_up == 50
+
+
+@pytest.mark.skipif(game.numeric_backend != "float", reason="only floats overflow")
+def test_grant_exp_stops_once_the_exp_required_is_infinite(legendary_species):
+    store = game.LegendaryCreatureStore()
+    legendary_creature = legendary_species[0].create_legendary_creature()
+    stored_legendary_creature = store.add_legendary_creature(legendary_creature.clone())
+    store.grant_exp(game.mpf("inf"))
+    legendary_creature.exp = game.mpf("inf")
+    legendary_creature.level_up()
+    assert stored_legendary_creature.required_exp == game.mpf("inf")
+    assert stored_legendary_creature.level == legendary_creature.level
+
+
+def test_stored_legendary_creatures_have_no_slots_for_columns(legendary_species):
+    store = game.LegendaryCreatureStore()
+    legendary_creature = legendary_species[0].create_legendary_creature()
+    stored_legendary_creature = store.add_legendary_creature(legendary_creature)
+    assert not isinstance(stored_legendary_creature, game.LegendaryCreature)
+    assert sys.getsizeof(stored_legendary_creature) < sys.getsizeof(legendary_creature)
+    assert not set(game.LegendaryCreatureStore.COLUMNS) & set(game.StoredLegendaryCreature.get_slot_names())
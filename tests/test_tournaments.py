@@ -0,0 +1,27 @@
+import random
+
+import legendary_creature_hunter_at_mithoter_planet as game
+
+
+def test_tournament_matches_do_not_touch_the_random_module(new_game):
+    team1, team2 = [trainer.battle_team for trainer in new_game.get_opponent_trainers()[:2]]
+    match = (team1.clone(), team2.clone(), game.RandomBattlePolicy(), game.RandomBattlePolicy(), 42, 2000)
+    random.seed(0)
+    state = random.getstate()
+    outcome = game.run_tournament_match(match)
+    assert random.getstate() == state
+    random.seed(1)
+    assert game.run_tournament_match((team1.clone(), team2.clone(), game.RandomBattlePolicy(),
+                                      game.RandomBattlePolicy(), 42, 2000)) == outcome
+
+
+def test_swiss_byes_score_a_point(new_game):
+    trainers = new_game.get_opponent_trainers()[:3]
+    tournament = game.Tournament(trainers, "SWISS", number_of_rounds=3, seed=0)
+    for i in range(3):
+        results = tournament.play_round()
+        assert len(results) == 1
+
+    standings = tournament.get_standings()
+    assert sum(standing[2] for standing in standings) == 3 * 2
+    assert sum(standing[3] + standing[4] + standing[5] for standing in standings) == 3 * 2
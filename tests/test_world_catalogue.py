@@ -0,0 +1,32 @@
+import os
+
+import legendary_creature_hunter_at_mithoter_planet as game
+
+
+def get_cache_file_names():
+    return sorted(os.listdir(game.CATALOGUE_CACHE_DIRECTORY_NAME))
+
+
+def test_catalogue_is_cached_once_per_content():
+    game.create_new_game("Player")
+    game.world_catalogue_data = None
+    game.create_new_game("Player")
+    assert len(get_cache_file_names()) == 1
+
+
+def test_catalogue_cache_is_not_used_by_different_code(monkeypatch):
+    game.create_new_game("Player")
+    old_cache_file_names = get_cache_file_names()
+    monkeypatch.setattr(game, "code_hash", "0" * 64)
+    game.world_catalogue_data = None
+    game.create_new_game("Player")
+    assert len(get_cache_file_names()) == 2
+    assert set(old_cache_file_names) < set(get_cache_file_names())
+
+
+def test_content_hash_depends_on_code(monkeypatch):
+    content_file_data = [b"{}"]
+    content_hash = game.get_content_hash(content_file_data)
+    assert game.get_content_hash(content_file_data) == content_hash
+    monkeypatch.setattr(game, "code_hash", "0" * 64)
+    assert game.get_content_hash(content_file_data) != content_hash
@@ -0,0 +1,62 @@
+import copy
+import json
+
+import pytest
+
+import legendary_creature_hunter_at_mithoter_planet as game
+
+
+def test_patrolling_trainers_walk_around_water(new_game):
+    trainer = new_game.get_opponent_trainers()[0]
+    city = trainer.location.city
+    start = trainer.location
+    trainer.patrol_route = [city.get_location(3, 0), start]
+    trainer.patrol_position = 0
+    world_simulation = game.WorldSimulation([trainer])
+    visited = [start]
+    for i in range(20):
+        world_simulation.tick()
+        previous, location = visited[-1], trainer.location
+        assert abs(location.x - previous.x) + abs(location.y - previous.y) <= 1
+        assert not isinstance(location.get_tile(), game.WaterTile)
+        visited.append(location)
+
+    assert city.get_location(3, 0) in visited
+    # Walking (0, 4) -> (3, 0) and back takes 7 steps each way along a shortest path.
+    assert visited[7] == city.get_location(3, 0)
+    assert visited[14] == start
+
+
+def test_unreachable_waypoints_are_skipped(new_game):
+    trainer = new_game.get_opponent_trainers()[0]
+    city = trainer.location.city
+    start = trainer.location
+    trainer.patrol_route = [city.get_location(4, 0), city.get_location(start.x + 1, start.y)]
+    trainer.patrol_position = 0
+    world_simulation = game.WorldSimulation([trainer])
+    world_simulation.tick()
+    assert trainer.location == start
+    world_simulation.tick()
+    assert trainer.location == city.get_location(start.x + 1, start.y)
+
+
+@pytest.fixture
+def content():
+    with open(game.DEFAULT_CONTENT_FILE_NAME, "r") as file:
+        return json.load(file)
+
+
+def test_reachable_patrol_routes_are_accepted(content):
+    content["opponent_trainers"][0]["patrol_route"] = [{"city": "Timberhallow", "x": 3, "y": 0}]
+    game.validate_content(content)
+
+
+@pytest.mark.parametrize("x, y", [(4, 0), (0, 0)])
+def test_unreachable_patrol_routes_are_rejected(content, x, y):
+    content = copy.deepcopy(content)
+    tiles = content["cities"][0]["tiles"]
+    tiles[0][0] = "SAND"
+    tiles[0][1] = tiles[1][0] = "WATER"  # (0, 0) is now walled in by water
+    content["opponent_trainers"][0]["patrol_route"] = [{"city": "Timberhallow", "x": x, "y": y}]
+    with pytest.raises(ValueError, match="without crossing water"):
+        game.validate_content(content)